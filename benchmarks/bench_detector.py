@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Benchmark Swedish-indicator detection: linear substring scan vs Aho-Corasick.
+Usage: python3 benchmarks/bench_detector.py [--cells 50000]
+
+Each run is repeated with indicator lists of 50, 500 and 5,000 terms (the
+real list, truncated or padded with synthetic terms) to show how detection
+cost scales with list size.
+"""
+
+import argparse
+import random
+import string
+import time
+
+from corpus import synthetic_cells
+
+from translation.matchers import AhoCorasick
+from translation.swedish import SWEDISH_INDICATORS
+
+
+def indicator_list(size, seed=0):
+    """Return size terms: the real indicators first, then synthetic padding."""
+    terms = list(dict.fromkeys(SWEDISH_INDICATORS))[:size]
+    rng = random.Random(seed)
+    while len(terms) < size:
+        terms.append(''.join(rng.choice(string.ascii_lowercase + 'åäö') for _ in range(rng.randint(5, 12))))
+    return terms
+
+
+def linear_findall(terms, text):
+    """Every (start, term) hit, found with one str.find loop per term."""
+    hits = []
+    for term in terms:
+        start = text.find(term)
+        while start != -1:
+            hits.append((start, term))
+            start = text.find(term, start + 1)
+    return hits
+
+
+def timed(func, cells):
+    """Return cells/s for func over cells."""
+    start = time.perf_counter()
+    for cell in cells:
+        func(cell)
+    return len(cells) / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark Swedish-indicator detection')
+    parser.add_argument('--cells', type=int, default=50_000, help='Synthetic corpus size')
+    args = parser.parse_args()
+
+    cells = [cell.lower() for cell in synthetic_cells(args.cells, columns=(5, 6, 7))]
+    print(f"Corpus: {len(cells):,} cells")
+    print(f"{'terms':>6}  {'linear any()':>14}  {'automaton search':>17}  {'linear all hits':>16}  {'automaton all hits':>19}")
+
+    for size in (50, 500, 5000):
+        terms = indicator_list(size)
+        matcher = AhoCorasick(terms)
+        rates = [
+            timed(lambda text: any(term in text for term in terms), cells),
+            timed(matcher.search, cells),
+            timed(lambda text: linear_findall(terms, text), cells),
+            timed(matcher.findall, cells),
+        ]
+        print(f"{size:>6}  " + '  '.join(f"{rate:>{width},.0f}" for rate, width in zip(rates, (14, 17, 16, 19))))
+    print("(cells/s, higher is better)")
+
+
+if __name__ == '__main__':
+    main()
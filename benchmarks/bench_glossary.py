@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Benchmark translate_csv.translate_text against the old per-entry regex loop.
+Usage: python3 benchmarks/bench_glossary.py [--cells 1000000] [--legacy-sample 5000]
+
+The legacy loop is too slow to run over a million cells, so it is timed on
+a sample and its cells/s figure is used to project the full corpus time.
+"""
+
+import argparse
+import re
+import time
+
+from corpus import load_source_cells, synthetic_cells
+
+import translate_csv
+from translate_csv import GLOSSARY, RISK_MAP, STATUS_MAP
+
+
+def legacy_translate_text(text):
+    """The translate_text implementation before the compiled glossary."""
+    if not text or text == '-':
+        return text
+    for swedish, english in STATUS_MAP.items():
+        text = text.replace(swedish, english)
+    for swedish, english in RISK_MAP.items():
+        text = text.replace(swedish, english)
+    result = text
+    for swedish, english in GLOSSARY.items():
+        pattern = re.compile(re.escape(swedish), re.IGNORECASE)
+        result = pattern.sub(english, result)
+    return result
+
+
+def time_cells(func, cells):
+    """Run func over cells and return elapsed seconds."""
+    start = time.perf_counter()
+    for cell in cells:
+        func(cell)
+    return time.perf_counter() - start
+
+
+def report(label, cells, legacy_cells):
+    """Time both implementations on one corpus and print the comparison."""
+    legacy_elapsed = time_cells(legacy_translate_text, legacy_cells)
+    legacy_rate = len(legacy_cells) / legacy_elapsed
+    new_elapsed = time_cells(translate_csv.translate_text, cells)
+    new_rate = len(cells) / new_elapsed
+
+    print(f"\n{label}: {len(cells):,} cells")
+    if len(legacy_cells) == len(cells):
+        print(f"  Per-entry loop: {legacy_elapsed:8.2f}s  ({legacy_rate:,.0f} cells/s)")
+    else:
+        projected = len(cells) / legacy_rate
+        print(f"  Per-entry loop: {projected:8.2f}s  ({legacy_rate:,.0f} cells/s, "
+              f"projected from {len(legacy_cells):,} cells)")
+    print(f"  Compiled glossary: {new_elapsed:5.2f}s  ({new_rate:,.0f} cells/s)")
+    print(f"  Speedup: {new_rate / legacy_rate:,.1f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the compiled glossary engine')
+    parser.add_argument('--cells', type=int, default=1_000_000, help='Synthetic corpus size')
+    parser.add_argument('--legacy-sample', type=int, default=5000,
+                        help='Cells of the synthetic corpus to time the per-entry loop on')
+    args = parser.parse_args()
+
+    print(f"Glossary entries: {len(GLOSSARY)}")
+
+    start = time.perf_counter()
+    translate_csv.GlossaryMatcher(GLOSSARY)
+    print(f"Glossary compile time: {(time.perf_counter() - start) * 1000:.1f} ms")
+
+    source = load_source_cells()
+    changed = sum(1 for cell in source if legacy_translate_text(cell) != translate_csv.translate_text(cell))
+    print(f"Cells whose output differs from the per-entry loop: {changed}/{len(source)}")
+
+    report('Supplement CSV', source, source)
+
+    synthetic = synthetic_cells(args.cells)
+    report('Synthetic corpus', synthetic, synthetic[:args.legacy_sample])
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Report what the n-gram language detector saves on supplements-english.csv.
+Usage: python3 benchmarks/bench_langid.py [--threshold 0.1] [--folds 5] [--examples 10]
+
+For each OpenAI script, counts the distinct (column, text) values its
+Swedish-indicator detector would send to the API today, and how many of
+those the n-gram detector judges English. Deduplicated values are what
+the scripts make API calls for. Also reports cross-validated accuracy on
+the translated pairs the model is trained on, and scoring throughput.
+"""
+
+import argparse
+import os
+import random
+import time
+
+from corpus import REPO_ROOT, SOURCE_CSV
+
+import translate_specific_cells
+import translate_with_openai
+from translation.langid import DEFAULT_THRESHOLD, NgramDetector, training_pairs
+from translation.pipeline import is_data_row, read_rows
+from translation.swedish import find_swedish_terms
+
+TRANSLATED_CSV = os.path.join(REPO_ROOT, 'supplements-english.csv')
+
+
+def cross_validate(pairs, folds, threshold):
+    """(Swedish cells judged English, English cells judged Swedish, total cells) over held-out folds."""
+    pairs = list(pairs)
+    random.Random(0).shuffle(pairs)
+    missed = false_alarms = 0
+    for k in range(folds):
+        held_out = pairs[k::folds]
+        train = [pair for i, pair in enumerate(pairs) if i % folds != k]
+        model = NgramDetector([sv for sv, _ in train], [en for _, en in train], threshold)
+        missed += sum(1 for sv, _ in held_out if not model.is_swedish(sv))
+        false_alarms += sum(1 for _, en in held_out if model.is_swedish(en))
+    return missed, false_alarms, 2 * len(pairs)
+
+
+def flagged_values(rows, pipeline, detect):
+    """Distinct (column, text) values of rows that detect() flags, for the pipeline's LLM stage columns."""
+    llm_columns = next(stage.columns for stage in pipeline.stages if stage.name == 'llm')
+    values = {(column, text) for _, column, text in pipeline.cells(rows) if column in llm_columns}
+    return {value for value in values if detect(value[1])}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Report API calls avoided by the n-gram language detector')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD)
+    parser.add_argument('--folds', type=int, default=5)
+    parser.add_argument('--examples', type=int, default=10, help='Overruled values to print per script')
+    args = parser.parse_args()
+
+    source_rows = [row for row in read_rows(SOURCE_CSV) if is_data_row(row)]
+    translated_rows = read_rows(TRANSLATED_CSV)
+    pairs = training_pairs(source_rows, [row for row in translated_rows if is_data_row(row)])
+    print(f"Training pairs (translated cells): {len(pairs)}")
+
+    missed, false_alarms, total = cross_validate(pairs, args.folds, args.threshold)
+    print(f"{args.folds}-fold cross-validation: {missed} Swedish cells judged English, "
+          f"{false_alarms} English cells judged Swedish, of {total} "
+          f"({1 - (missed + false_alarms) / total:.2%} correct)")
+
+    start = time.perf_counter()
+    detector = NgramDetector.from_files(SOURCE_CSV, TRANSLATED_CSV, args.threshold)
+    print(f"Training time: {(time.perf_counter() - start) * 1000:.0f} ms (including reading both CSVs)")
+
+    cells = [text for row in translated_rows if is_data_row(row) for text in row[5:8]] * 20
+    start = time.perf_counter()
+    detector.scores(cells)
+    elapsed = time.perf_counter() - start
+    print(f"Scoring: {len(cells) / elapsed:,.0f} cells/s on repeated catalog columns "
+          f"({len(set(cells))} distinct values)")
+
+    scripts = [
+        ('translate_with_openai', translate_with_openai.PIPELINE, find_swedish_terms),
+        ('translate_specific_cells', translate_specific_cells.PIPELINE, translate_specific_cells.detect_swedish),
+    ]
+    print(f"\nOn {os.path.basename(TRANSLATED_CSV)} (threshold {args.threshold:.2f}):")
+    for name, pipeline, detect in scripts:
+        flagged = flagged_values(translated_rows, pipeline, detect)
+        overruled = sorted(value for value in flagged if not detector.is_swedish(value[1]))
+        print(f"  {name}: {len(flagged)} values flagged by the indicators, "
+              f"{len(overruled)} judged English -> {len(overruled)} API calls avoided, "
+              f"{len(flagged) - len(overruled)} still sent")
+        for column, text in overruled[:args.examples]:
+            print(f"      {detector.confidence(text):.3f}  {column}: {text[:70]}")
+
+
+if __name__ == '__main__':
+    main()
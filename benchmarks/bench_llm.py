@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Benchmark the OpenAI translation path against the local stand-in server.
+Usage: python3 benchmarks/bench_llm.py [--script openai] [--concurrency 1 8] [--batch-tokens 0 2000]
+
+Each configuration runs the real main() of translate_with_openai (or
+translate_specific_cells) in a scratch directory, on a copy of the source
+catalog, with the translation memory off and OPENAI_BASE_URL pointing at
+benchmarks/fake_openai.py. Reported per run: wall-clock time, API-bound
+cells per second, client-side request latency (p50/p95/p99), failed
+requests that were retried, and what the server answered.
+"""
+
+import argparse
+import contextlib
+import importlib
+import io
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+from corpus import SOURCE_CSV
+from fake_openai import add_arguments, fake_from_args, serve
+
+from translation import ratelimit
+
+SCRIPTS = {
+    'openai': ('translate_with_openai', os.path.basename(SOURCE_CSV), ['--no-cache']),
+    'specific': ('translate_specific_cells', 'supplements-english.csv', []),
+}
+UNLIMITED = 10 ** 9
+
+
+def percentile(values, fraction):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+class Instrument:
+    """Times every rate-limited API call made through translation.ratelimit."""
+
+    def __init__(self):
+        self.latencies = []
+        self.failures = 0
+        self._create = ratelimit.create
+        self._create_async = ratelimit.create_async
+
+    def __enter__(self):
+        def create(completions, limiter, params):
+            start = time.perf_counter()
+            try:
+                return self._create(completions, limiter, params)
+            except Exception:
+                self.failures += 1
+                raise
+            finally:
+                self.latencies.append(time.perf_counter() - start)
+
+        async def create_async(completions, limiter, params):
+            start = time.perf_counter()
+            try:
+                return await self._create_async(completions, limiter, params)
+            except Exception:
+                self.failures += 1
+                raise
+            finally:
+                self.latencies.append(time.perf_counter() - start)
+
+        ratelimit.create = create
+        ratelimit.create_async = create_async
+        return self
+
+    def __exit__(self, *exc):
+        ratelimit.create = self._create
+        ratelimit.create_async = self._create_async
+
+
+def run(script, flags, fake):
+    """Run one script end to end in a scratch directory; returns the result row."""
+    module_name, input_name, base_flags = SCRIPTS[script]
+    workdir = tempfile.mkdtemp(prefix='bench_llm_')
+    cwd = os.getcwd()
+    argv = sys.argv
+    fake.stats.clear()
+    try:
+        shutil.copy(SOURCE_CSV, os.path.join(workdir, input_name))
+        os.chdir(workdir)
+        # A fresh module per run: clients, limiter and caches start empty
+        module = importlib.reload(importlib.import_module(module_name))
+        sys.argv = [module_name + '.py'] + base_flags + flags
+        log = io.StringIO()
+        with Instrument() as instrument, contextlib.redirect_stdout(log):
+            start = time.perf_counter()
+            try:
+                module.main()
+            except SystemExit:
+                pass
+            wall = time.perf_counter() - start
+    finally:
+        sys.argv = argv
+        os.chdir(cwd)
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    cells = sum(1 for line in log.getvalue().splitlines() if line.strip().startswith('→'))
+    return {
+        'wall': wall,
+        'requests': len(instrument.latencies),
+        'cells_per_s': cells / wall if wall else 0.0,
+        'p50': percentile(instrument.latencies, 0.50),
+        'p95': percentile(instrument.latencies, 0.95),
+        'p99': percentile(instrument.latencies, 0.99),
+        'retries': instrument.failures,
+        'server': dict(fake.stats),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the OpenAI path against a local stand-in server')
+    parser.add_argument('--script', choices=sorted(SCRIPTS), default='openai')
+    parser.add_argument('--concurrency', type=int, nargs='+', default=[1, 8])
+    parser.add_argument('--batch-tokens', type=int, nargs='+', default=[0],
+                        help='Batch budgets to try (translate_with_openai only; 0 = one cell per request)')
+    add_arguments(parser)
+    args = parser.parse_args()
+
+    fake = fake_from_args(args)
+    server, base_url = serve(fake)
+    os.environ['OPENAI_BASE_URL'] = base_url
+    os.environ['OPENAI_API_KEY'] = 'fake'
+
+    print(f"Stand-in server: {base_url} (median latency {args.latency_ms:.0f} ms, "
+          f"429 {args.rate_429:.0%}, 5xx {args.rate_5xx:.0%}, truncated {args.truncate_rate:.0%})")
+    print(f"{'config':<24} {'wall s':>8} {'cells/s':>8} {'requests':>9} {'p50 ms':>8} {'p95 ms':>8} "
+          f"{'p99 ms':>8} {'retries':>8}  server")
+    for concurrency in args.concurrency:
+        for batch_tokens in args.batch_tokens:
+            # The client-side limiter gets the server's limits (or none), so
+            # the run measures the request path rather than the default RPM
+            flags = ['--concurrency', str(concurrency),
+                     '--rpm', str(args.server_rpm or UNLIMITED), '--tpm', str(args.server_tpm or UNLIMITED)]
+            label = f'concurrency={concurrency}'
+            if batch_tokens:
+                if args.script != 'openai':
+                    continue
+                flags += ['--batch-tokens', str(batch_tokens)]
+                label += f' batch={batch_tokens}'
+            result = run(args.script, flags, fake)
+            print(f"{label:<24} {result['wall']:>8.1f} {result['cells_per_s']:>8.1f} {result['requests']:>9} "
+                  f"{result['p50'] * 1000:>8.0f} {result['p95'] * 1000:>8.0f} {result['p99'] * 1000:>8.0f} "
+                  f"{result['retries']:>8}  {result['server']}")
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite and regression gate for the rule-based translators.
+Usage: python3 benchmarks/bench_suite.py [--rows 100000] [--output results.json]
+       python3 benchmarks/bench_suite.py --baseline results.json [--threshold 0.10]
+
+Every benchmarked function runs over the free-text cells of a synthetic
+catalog (see corpus.synthetic_rows). Reported per function:
+  - throughput: cells/s over the whole corpus, best of --repeat runs
+  - latency: per-cell p50/p95/p99/max in microseconds, on --latency-sample cells
+  - peak memory: the largest tracemalloc peak while processing
+    --memory-sample cells, in KiB
+
+With --baseline, throughput is compared against a stored results file and
+the script exits with status 1 if any function got slower than the
+threshold allows.
+"""
+
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+
+from corpus import TEXT_COLUMNS, synthetic_rows
+
+import translate_csv
+import translate_csv_simple
+from translation.swedish import has_swedish_text
+
+FUNCTIONS = {
+    'translate_csv.translate_text': translate_csv.translate_text,
+    'translate_csv_simple.translate_text': translate_csv_simple.translate_text,
+    'has_swedish_text': has_swedish_text,
+}
+
+
+def build_corpus(rows, seed):
+    return [row[idx] for row in synthetic_rows(rows, seed) for idx in TEXT_COLUMNS]
+
+
+def throughput(func, cells, repeat):
+    """Best cells/s of repeat runs over cells."""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for cell in cells:
+            func(cell)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return len(cells) / best
+
+
+def latency(func, cells):
+    """Per-cell latency percentiles in microseconds."""
+    clock = time.perf_counter_ns
+    samples = []
+    for cell in cells:
+        start = clock()
+        func(cell)
+        samples.append(clock() - start)
+    samples.sort()
+
+    def pick(fraction):
+        return samples[min(len(samples) - 1, int(fraction * len(samples)))] / 1000
+
+    return {'p50': pick(0.50), 'p95': pick(0.95), 'p99': pick(0.99), 'max': samples[-1] / 1000}
+
+
+def peak_memory(func, cells):
+    """Largest traced allocation peak (KiB) of a single call over cells."""
+    peak = 0
+    tracemalloc.start()
+    try:
+        for cell in cells:
+            tracemalloc.reset_peak()
+            baseline = tracemalloc.get_traced_memory()[0]
+            func(cell)
+            peak = max(peak, tracemalloc.get_traced_memory()[1] - baseline)
+    finally:
+        tracemalloc.stop()
+    return peak / 1024
+
+
+def run(args):
+    start = time.perf_counter()
+    cells = build_corpus(args.rows, args.seed)
+    print(f"Corpus: {args.rows:,} rows, {len(cells):,} cells, {sum(map(len, cells)):,} chars "
+          f"(generated in {time.perf_counter() - start:.1f}s)")
+
+    results = {}
+    for name, func in FUNCTIONS.items():
+        if args.only and name not in args.only:
+            continue
+        # Warm up: first calls pay for lazy compiles and cache fills
+        for cell in cells[:1000]:
+            func(cell)
+        rate = throughput(func, cells, args.repeat)
+        lat = latency(func, cells[:args.latency_sample])
+        peak = peak_memory(func, cells[:args.memory_sample])
+        results[name] = {'cells_per_s': rate, 'latency_us': lat, 'peak_kib': peak}
+        print(f"{name:<38} {rate:>12,.0f} cells/s  p50 {lat['p50']:7.1f}µs  p95 {lat['p95']:7.1f}µs  "
+              f"p99 {lat['p99']:7.1f}µs  max {lat['max']:9.1f}µs  peak {peak:8.1f} KiB")
+
+    return {
+        'corpus': {'rows': args.rows, 'seed': args.seed, 'cells': len(cells)},
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'results': results,
+    }
+
+
+def compare(current, baseline, threshold):
+    """Print throughput against baseline; returns the names that regressed."""
+    if current['corpus'] != baseline['corpus']:
+        print(f"⚠️  Corpus differs from the baseline ({baseline['corpus']}); ratios are approximate")
+    print(f"\n{'function':<38} {'baseline':>14} {'current':>14} {'change':>8}")
+    regressed = []
+    for name, result in current['results'].items():
+        if name not in baseline['results']:
+            print(f"{name:<38} {'-':>14} {result['cells_per_s']:>14,.0f}      new")
+            continue
+        before = baseline['results'][name]['cells_per_s']
+        change = result['cells_per_s'] / before - 1
+        flag = ''
+        if change < -threshold:
+            regressed.append(name)
+            flag = '  ❌ regression'
+        print(f"{name:<38} {before:>14,.0f} {result['cells_per_s']:>14,.0f} {change:>+8.1%}{flag}")
+    return regressed
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark and regression-check the rule-based translators')
+    parser.add_argument('--rows', type=int, default=100_000, help='Synthetic catalog rows')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--repeat', type=int, default=3, help='Throughput runs per function (best is kept)')
+    parser.add_argument('--latency-sample', type=int, default=20_000, help='Cells timed one by one')
+    parser.add_argument('--memory-sample', type=int, default=2_000, help='Cells run under tracemalloc')
+    parser.add_argument('--only', nargs='+', choices=sorted(FUNCTIONS), help='Benchmark only these functions')
+    parser.add_argument('--output', help='Write the results as JSON to this file')
+    parser.add_argument('--baseline', help='Results JSON to compare throughput against')
+    parser.add_argument('--threshold', type=float, default=0.10,
+                        help='Allowed throughput drop against the baseline (0.10 = 10%%)')
+    args = parser.parse_args()
+
+    current = run(args)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(current, f, indent=2)
+        print(f"💾 Results saved to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        regressed = compare(current, baseline, args.threshold)
+        if regressed:
+            print(f"\n❌ Throughput regressed more than {args.threshold:.0%}: {', '.join(regressed)}")
+            sys.exit(1)
+        print(f"\n✅ No throughput regression beyond {args.threshold:.0%}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Benchmark translate_csv_simple.translate_text against the old re.sub loop.
+Usage: python3 benchmarks/bench_terms.py [--cells 1000000] [--legacy-sample 20000]
+
+Throughput is reported in cells per second. The legacy loop is timed on a
+sample of the synthetic corpus.
+"""
+
+import argparse
+import re
+import time
+
+from corpus import load_source_cells, synthetic_cells
+
+import translate_csv_simple
+from translate_csv_simple import TERM_REPLACEMENTS
+
+
+def legacy_translate_text(text):
+    """The translate_text implementation before the token engine."""
+    if not text or text == '-':
+        return text
+    result = text
+    for pattern, replacement in TERM_REPLACEMENTS:
+        result = re.sub(pattern, replacement, result, flags=re.IGNORECASE)
+    return result
+
+
+def cells_per_second(func, cells):
+    """Run func over cells and return throughput."""
+    start = time.perf_counter()
+    for cell in cells:
+        func(cell)
+    return len(cells) / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the token-level term replacer')
+    parser.add_argument('--cells', type=int, default=1_000_000, help='Synthetic corpus size')
+    parser.add_argument('--legacy-sample', type=int, default=20_000,
+                        help='Cells of the synthetic corpus to time the re.sub loop on')
+    args = parser.parse_args()
+
+    source = load_source_cells(columns=(5, 6, 7))
+    mismatches = [cell for cell in source
+                  if legacy_translate_text(cell) != translate_csv_simple.translate_text(cell)]
+    print(f"Rules: {len(TERM_REPLACEMENTS)}")
+    print(f"Cells differing from the re.sub loop: {len(mismatches)}/{len(source)}")
+    for cell in mismatches[:5]:
+        print(f"  {cell[:70]}")
+
+    synthetic = synthetic_cells(args.cells, columns=(5, 6, 7))
+    for label, cells, legacy_cells in [
+        ('Supplement CSV', source, source),
+        ('Synthetic corpus', synthetic, synthetic[:args.legacy_sample]),
+    ]:
+        legacy_rate = cells_per_second(legacy_translate_text, legacy_cells)
+        new_rate = cells_per_second(translate_csv_simple.translate_text, cells)
+        print(f"\n{label}: {len(cells):,} cells")
+        print(f"  re.sub loop:  {legacy_rate:>12,.0f} cells/s")
+        print(f"  Token engine: {new_rate:>12,.0f} cells/s")
+        print(f"  Speedup: {new_rate / legacy_rate:,.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Benchmark corpora built from the Swedish supplement CSV.
+Usage: python3 benchmarks/corpus.py --rows 1000000 --output synthetic.csv
+
+Run as a script it writes a synthetic catalog (header plus --rows data
+rows) for benchmarking the translators on files of any size.
+"""
+
+import argparse
+import csv
+import os
+import random
+import sys
+from collections import Counter, defaultdict
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SOURCE_CSV = os.path.join(REPO_ROOT, 'Börja utforska - Börja utforska.csv')
+
+# Make the translate_*.py scripts importable from benchmarks/
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+TEXT_COLUMNS = [5, 6, 7]
+
+
+def load_source_rows(path=SOURCE_CSV):
+    """Read the data rows (header and malformed rows skipped) of a catalog CSV."""
+    rows = []
+    with open(path, 'r', encoding='utf-8') as f:
+        for row in csv.reader(f):
+            if len(row) >= 10 and 'name_sv' not in row[0].lower():
+                rows.append(row)
+    return rows
+
+
+def load_source_cells(columns=(5, 6), path=SOURCE_CSV):
+    """Return the free-text cells of the source CSV, in file order."""
+    return [row[idx] for row in load_source_rows(path) for idx in columns if row[idx]]
+
+
+def synthetic_cells(count, columns=(5, 6), seed=0, path=SOURCE_CSV):
+    """Return count cells sampled (with replacement) from the source CSV."""
+    cells = load_source_cells(columns, path)
+    rng = random.Random(seed)
+    return [rng.choice(cells) for _ in range(count)]
+
+
+class WordModel:
+    """Word-bigram model of one text column of the source CSV.
+
+    Cells are generated word by word, each word drawn from the words that
+    followed the previous one in the source (with their counts), until the
+    end of a cell is drawn. Word frequencies, common phrases and the
+    distribution of cell lengths therefore match the source however many
+    cells are generated.
+    """
+
+    START = ''  # str.split() never yields an empty word
+    END = None
+
+    def __init__(self, cells):
+        follows = defaultdict(Counter)
+        for cell in cells:
+            previous = self.START
+            for word in cell.split():
+                follows[previous][word] += 1
+                previous = word
+            follows[previous][self.END] += 1
+        self.choices = {}
+        for previous, counter in follows.items():
+            words = list(counter)
+            total = 0
+            cumulative = []
+            for word in words:
+                total += counter[word]
+                cumulative.append(total)
+            self.choices[previous] = (words, cumulative)
+
+    def generate(self, rng):
+        words = []
+        previous = self.START
+        while True:
+            candidates, cumulative = self.choices[previous]
+            word = rng.choices(candidates, cum_weights=cumulative)[0]
+            if word is self.END:
+                return ' '.join(words)
+            words.append(word)
+            previous = word
+
+
+def synthetic_rows(count, seed=0, path=SOURCE_CSV):
+    """Yield count catalog rows shaped like the data rows of the source CSV.
+
+    The free-text columns come from a WordModel per column; the other
+    columns (names, status, doses, flags) are copied together from a
+    random source row. The same seed gives the same rows.
+    """
+    source = load_source_rows(path)
+    models = {idx: WordModel(row[idx] for row in source if row[idx]) for idx in TEXT_COLUMNS}
+    rng = random.Random(seed)
+    for _ in range(count):
+        row = list(rng.choice(source))
+        for idx, model in models.items():
+            row[idx] = model.generate(rng)
+        yield row
+
+
+def write_synthetic_csv(output, count, seed=0, path=SOURCE_CSV):
+    """Write the source header and count synthetic rows to output."""
+    with open(path, 'r', encoding='utf-8') as f:
+        header = next(row for row in csv.reader(f) if row and 'name_sv' in row[0].lower())
+    with open(output, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(header)
+        writer.writerows(synthetic_rows(count, seed, path))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Write a synthetic supplement catalog CSV')
+    parser.add_argument('--rows', type=int, default=1_000_000, help='Data rows to generate')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', required=True, help='CSV file to write')
+    args = parser.parse_args()
+
+    write_synthetic_csv(args.output, args.rows, args.seed)
+    print(f"✅ Wrote {args.rows:,} rows to {args.output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for the OpenAI chat-completions endpoint.
+Usage: python3 benchmarks/fake_openai.py [--port 8765] [--latency-ms 400] [--rate-429 0.02]
+
+Point a script at it with OPENAI_BASE_URL=http://127.0.0.1:8765/v1 (any
+OPENAI_API_KEY will do). Replies are deterministic "translations" ('EN: '
+plus the source text; batched JSON-array prompts get a JSON array back).
+The server adds latency from a log-normal distribution, and can inject 429
+and 5xx errors and truncated replies. It also enforces RPM/TPM limits and
+reports them in x-ratelimit-* headers the way the real API does.
+"""
+
+import argparse
+import json
+import math
+import random
+import threading
+import time
+from collections import Counter, deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class FakeOpenAI:
+    """Behaviour of the stand-in server; shared by all request threads."""
+
+    def __init__(self, latency_ms=400.0, latency_sigma=0.5, rate_429=0.0, rate_5xx=0.0,
+                 truncate_rate=0.0, rpm=None, tpm=None, seed=0):
+        self.latency_ms = latency_ms
+        self.latency_sigma = latency_sigma
+        self.rate_429 = rate_429
+        self.rate_5xx = rate_5xx
+        self.truncate_rate = truncate_rate
+        self.rpm = rpm
+        self.tpm = tpm
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        self.window = deque()  # (time, tokens) of requests in the last minute
+        self.stats = Counter()
+
+    def latency(self):
+        """Seconds to wait before replying: log-normal around latency_ms."""
+        with self.lock:
+            factor = math.exp(self.random.gauss(0, self.latency_sigma)) if self.latency_sigma else 1.0
+        return self.latency_ms * factor / 1000
+
+    def roll(self, rate):
+        with self.lock:
+            return self.random.random() < rate
+
+    def admit(self, tokens):
+        """Apply the RPM/TPM limits; returns (allowed, rate-limit headers)."""
+        with self.lock:
+            now = time.monotonic()
+            while self.window and now - self.window[0][0] >= 60:
+                self.window.popleft()
+            used_requests = len(self.window)
+            used_tokens = sum(t for _, t in self.window)
+            allowed = ((self.rpm is None or used_requests < self.rpm)
+                       and (self.tpm is None or used_tokens + tokens <= self.tpm))
+            if allowed:
+                self.window.append((now, tokens))
+                used_requests += 1
+                used_tokens += tokens
+            reset = 60 - (now - self.window[0][0]) if self.window else 0.0
+        headers = {}
+        if self.rpm is not None:
+            headers['x-ratelimit-limit-requests'] = str(self.rpm)
+            headers['x-ratelimit-remaining-requests'] = str(max(0, self.rpm - used_requests))
+            headers['x-ratelimit-reset-requests'] = f'{reset:.3f}s'
+        if self.tpm is not None:
+            headers['x-ratelimit-limit-tokens'] = str(self.tpm)
+            headers['x-ratelimit-remaining-tokens'] = str(max(0, self.tpm - used_tokens))
+            headers['x-ratelimit-reset-tokens'] = f'{reset:.3f}s'
+        if not allowed:
+            headers['retry-after-ms'] = str(int(reset * 1000) + 1)
+        return allowed, headers
+
+    def count(self, key):
+        with self.lock:
+            self.stats[key] += 1
+
+
+def translate(messages):
+    """Deterministic reply content for a chat request."""
+    user = messages[-1]['content']
+    try:
+        items = json.loads(user)
+    except ValueError:
+        items = None
+    if isinstance(items, list):
+        return json.dumps([{'i': item['i'], 'text': 'EN: ' + item['text']} for item in items],
+                          ensure_ascii=False)
+    # Single-cell prompts end with a blank line and the text
+    return 'EN: ' + user.split('\n\n', 1)[-1]
+
+
+def estimate_tokens(text):
+    return len(text) // 4 + 1
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    # Headers and body go out in separate writes; without TCP_NODELAY the
+    # client's delayed ACK adds ~40 ms to every reply
+    disable_nagle_algorithm = True
+    fake = None  # FakeOpenAI, set by serve()
+
+    def log_message(self, format, *args):
+        pass
+
+    def reply(self, status, body, headers=None):
+        data = json.dumps(body, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def error(self, status, kind, message, headers=None):
+        self.fake.count(status)
+        self.reply(status, {'error': {'message': message, 'type': kind, 'code': None}}, headers)
+
+    def do_POST(self):
+        length = int(self.headers.get('Content-Length', 0))
+        request = json.loads(self.rfile.read(length) or b'{}')
+        if not self.path.rstrip('/').endswith('/chat/completions'):
+            self.error(404, 'invalid_request_error', f'Unknown path {self.path}')
+            return
+        fake = self.fake
+        fake.count('requests')
+        messages = request.get('messages', [])
+        prompt_tokens = sum(estimate_tokens(m.get('content', '')) for m in messages)
+        allowed, headers = fake.admit(prompt_tokens + request.get('max_tokens', 0))
+        if not allowed:
+            self.error(429, 'requests', 'Rate limit reached (enforced)', headers)
+            return
+        time.sleep(fake.latency())
+        if fake.roll(fake.rate_429):
+            headers['retry-after-ms'] = '500'
+            self.error(429, 'requests', 'Rate limit reached (injected)', headers)
+            return
+        if fake.roll(fake.rate_5xx):
+            self.error(fake.random.choice([500, 502, 503]), 'server_error', 'Injected server error', headers)
+            return
+
+        content = translate(messages)
+        finish_reason = 'stop'
+        if fake.roll(fake.truncate_rate):
+            content = content[:len(content) // 2]
+            finish_reason = 'length'
+            fake.count('truncated')
+        fake.count(200)
+        self.reply(200, {
+            'id': f'chatcmpl-fake-{fake.stats["requests"]}',
+            'object': 'chat.completion',
+            'created': int(time.time()),
+            'model': request.get('model', 'fake'),
+            'choices': [{'index': 0, 'message': {'role': 'assistant', 'content': content},
+                         'finish_reason': finish_reason}],
+            'usage': {'prompt_tokens': prompt_tokens, 'completion_tokens': estimate_tokens(content),
+                      'total_tokens': prompt_tokens + estimate_tokens(content)},
+        }, headers)
+
+
+def serve(fake, host='127.0.0.1', port=0):
+    """Start the server in a background thread; returns (server, base_url)."""
+    handler = type('FakeHandler', (Handler,), {'fake': fake})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f'http://{host}:{server.server_address[1]}/v1'
+
+
+def add_arguments(parser):
+    """Server options, shared with bench_llm.py."""
+    parser.add_argument('--latency-ms', type=float, default=400.0, help='Median reply latency')
+    parser.add_argument('--latency-sigma', type=float, default=0.5,
+                        help='Log-normal spread of the latency (0 for fixed latency)')
+    parser.add_argument('--rate-429', type=float, default=0.0, help='Fraction of requests answered with 429')
+    parser.add_argument('--rate-5xx', type=float, default=0.0, help='Fraction of requests answered with 5xx')
+    parser.add_argument('--truncate-rate', type=float, default=0.0,
+                        help="Fraction of replies cut in half (finish_reason 'length')")
+    parser.add_argument('--server-rpm', type=int, help='Requests per minute to enforce')
+    parser.add_argument('--server-tpm', type=int, help='Tokens per minute to enforce')
+    parser.add_argument('--seed', type=int, default=0)
+
+
+def fake_from_args(args):
+    return FakeOpenAI(args.latency_ms, args.latency_sigma, args.rate_429, args.rate_5xx,
+                      args.truncate_rate, args.server_rpm, args.server_tpm, args.seed)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Local stand-in for the OpenAI chat-completions API')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    add_arguments(parser)
+    args = parser.parse_args()
+
+    fake = fake_from_args(args)
+    server, base_url = serve(fake, args.host, args.port)
+    print(f"Serving fake chat completions at {base_url}")
+    print(f"  export OPENAI_BASE_URL={base_url} OPENAI_API_KEY=fake")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.shutdown()
+        print(f"\nRequests: {dict(fake.stats)}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Bulk load the translated catalog CSV into the supplements table.
+Stages the rows with one COPY and upserts them by identity; see translation/loader.py.
+--input also takes the delta file of an incremental run (translate_with_openai.py --incremental).
+Usage: python3 load_supplements.py [--input FILE|-] (--database-url URL | --sql FILE|-) [--rejects FILE]
+"""
+
+import argparse
+import csv
+import os
+import sys
+
+from translation.columnar import ColumnTable
+from translation.dosing import IDENTITY_COLUMNS, identity_fields
+from translation.loader import load, script, staged_rows
+from translation.streaming import STDIO, open_input
+
+def write_rejects(path, rejects):
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(IDENTITY_COLUMNS + ['column', 'value', 'reason'])
+        writer.writerows(identity_fields(identity) + [column, value, reason]
+                         for identity, column, value, reason in rejects)
+
+def main():
+    parser = argparse.ArgumentParser(description='Load the translated supplement CSV into Postgres with COPY')
+    parser.add_argument('--input', default='supplements-english.csv', help="Translated CSV or delta file ('-' for stdin)")
+    parser.add_argument('--database-url', default=os.environ.get('DATABASE_URL'),
+                        help='Postgres connection string (default: $DATABASE_URL); needs psycopg')
+    parser.add_argument('--sql', metavar='FILE',
+                        help="Write the load as a psql script to FILE ('-' for stdout) instead of connecting")
+    parser.add_argument('--rejects', metavar='FILE', help='Write cells that could not be loaded to FILE')
+    args = parser.parse_args()
+    if not args.sql and not args.database_url:
+        parser.error('give --database-url (or set DATABASE_URL), or --sql FILE')
+
+    log = sys.stderr if args.sql == STDIO else sys.stdout
+    with open_input(args.input) as f:
+        table = ColumnTable.read(f)
+    rows, rejects = staged_rows(table)
+    print(f"📦 {len(rows)} rows staged, {len(rejects)} rejected cells", file=log)
+    if args.rejects:
+        write_rejects(args.rejects, rejects)
+        print(f"📝 Rejects written to {args.rejects}", file=log)
+
+    if args.sql:
+        # For psql: python3 load_supplements.py --sql - | psql "$DATABASE_URL"
+        out = sys.stdout if args.sql == STDIO else open(args.sql, 'w', encoding='utf-8')
+        try:
+            out.writelines(script(rows))
+        finally:
+            if out is not sys.stdout:
+                out.close()
+        print(f"✅ Load script written to {args.sql}", file=log)
+        return
+
+    try:
+        updated, deleted, inserted = load(args.database_url, rows)
+    except ImportError:
+        sys.exit("❌ psycopg is not installed: pip install 'psycopg[binary]', or use --sql - | psql")
+    print(f"✅ Supplements loaded: {updated} updated, {deleted} deleted, {inserted} inserted", file=log)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,66 @@
+"""Alignment of earlier translated files with the source (translation/alignment.py)."""
+
+from translation.alignment import TranslatedFile, align
+from translation.pipeline import COLUMN_INDEX
+
+NOTES = COLUMN_INDEX['dosing_notes']
+RISK = COLUMN_INDEX['interaction_risk']
+HEADER = ['name_sv', 'name_en', 'research_status', 'dosing_base_g_mg', 'dosing_max_g_mg', 'dosing_notes',
+          'bioavailability_notes', 'interaction_risk', 'is_base_health', 'category_links']
+
+
+def row(name, notes, risk='Låg.', base='50 mg'):
+    return [name, name, 'Blå', base, '200 mg', notes, '-', risk, 'FALSE', '1']
+
+
+def translated(source_row, notes=None, risk=None):
+    result = list(source_row)
+    if notes is not None:
+        result[NOTES] = notes
+    if risk is not None:
+        result[RISK] = risk
+    return result
+
+
+def test_translations_survive_inserted_deleted_and_reordered_rows():
+    a, b, c = row('Zink', 'Immunförsvar.'), row('Magnesium', 'Sömn.'), row('Järn', 'Blodbrist.')
+    output = [HEADER, translated(a, 'Immune system.'), translated(b, 'Sleep.'), translated(c, 'Anaemia.')]
+    d = row('Jod', 'Sköldkörtel.')
+    result = align([HEADER, d, c, a], [TranslatedFile(output)])
+    assert result.rows == [HEADER, d, translated(c, 'Anaemia.'), translated(a, 'Immune system.')]
+    assert (result.matched, result.added, result.dropped, result.cells) == (2, 1, 1, 2)
+
+
+def test_a_repeated_key_goes_to_the_row_translated_from_its_source():
+    first, second = row('5-HTP', 'Serotonin.'), row('5-HTP', 'Serotonin-prekursor.')
+    output = [translated(first, 'EN: Serotonin.'), translated(second, 'EN: Serotonin precursor.')]
+    # The two rows swapped places in the source; the snapshot tells them apart
+    result = align([second, first], [TranslatedFile(output, [first, second])])
+    assert result.rows == [translated(second, 'EN: Serotonin precursor.'), translated(first, 'EN: Serotonin.')]
+
+
+def test_a_partly_translated_output_is_completed_from_the_backup():
+    source = row('Zink', 'Immunförsvar.', risk='Hög.')
+    output = TranslatedFile([translated(source, risk='High.')], [source])
+    backup = TranslatedFile([translated(source, 'Immune system.', 'High risk.')])
+    result = align([source], [output, backup])
+    assert result.rows == [translated(source, 'Immune system.', 'High.')]
+    assert result.cells == 2
+
+
+def test_a_stale_cell_takes_no_translation_from_the_backup():
+    old = row('5-HTP', 'Serotonin-prekursor.')
+    output = TranslatedFile([translated(old, 'EN: Serotonin precursor.', 'Low.')], [old])
+    backup = TranslatedFile([translated(old, 'EN: Serotonin precursor.', 'Low.')])
+    edited = row('5-HTP', 'Ökar serotonin.')
+    result = align([edited], [output, backup])
+    assert result.rows == [translated(edited, risk='Low.')]
+    assert (result.stale, result.cells) == (1, 1)
+
+
+def test_without_a_snapshot_an_edited_cell_keeps_its_translation():
+    old = row('5-HTP', 'Serotonin-prekursor.')
+    edited = row('5-HTP', 'Ökar serotonin.')
+    result = align([edited], [TranslatedFile([translated(old, 'EN: Serotonin precursor.')])])
+    assert result.rows == [translated(edited, 'EN: Serotonin precursor.')]
+    assert result.stale == 0
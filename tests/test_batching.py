@@ -0,0 +1,65 @@
+"""Packing, reply parsing and splitting of batched requests (translation/batching.py)."""
+
+import json
+
+import pytest
+
+from translation.batching import (
+    ITEM_OVERHEAD_TOKENS, BatchError, BatchStats, batch_payload, estimate_tokens, pack, parse_reply,
+    translate_batch,
+)
+
+
+def reply(translations):
+    return json.dumps([{'i': i, 'text': text} for i, text in enumerate(translations)])
+
+
+def test_pack_fills_batches_up_to_the_budget():
+    texts = ['a' * 40] * 5
+    cost = estimate_tokens(texts[0]) + ITEM_OVERHEAD_TOKENS
+    assert pack(texts, cost * 2) == [texts[:2], texts[2:4], texts[4:]]
+    assert pack(texts, cost * 10, max_items=3) == [texts[:3], texts[3:]]
+
+
+def test_pack_gives_an_oversized_text_its_own_batch():
+    assert pack(['short', 'x' * 400, 'short'], 20) == [['short'], ['x' * 400], ['short']]
+
+
+def test_parse_reply_orders_by_index():
+    content = '```json\n' + json.dumps([{'i': 1, 'text': 'B'}, {'i': 0, 'text': 'A'}]) + '\n```'
+    assert parse_reply(content, 2) == ['A', 'B']
+    assert json.loads(batch_payload(['Hög.'])) == [{'i': 0, 'text': 'Hög.'}]
+
+
+@pytest.mark.parametrize('content', [
+    'not json',
+    json.dumps([{'i': 0, 'text': 'A'}]),
+    json.dumps([{'i': 0, 'text': 'A'}, {'i': 0, 'text': 'B'}]),
+    json.dumps([{'i': 0, 'text': 'A'}, {'i': 2, 'text': 'B'}]),
+    json.dumps([{'i': 0, 'text': 'A'}, 'B']),
+])
+def test_parse_reply_rejects_a_reply_that_does_not_cover_every_index(content):
+    with pytest.raises(BatchError):
+        parse_reply(content, 2)
+
+
+def test_translate_batch_splits_until_replies_parse():
+    requests = []
+
+    def request(texts):
+        requests.append(list(texts))
+        if len(texts) > 2:
+            return 'garbled'
+        return reply([text.upper() for text in texts])
+
+    stats = BatchStats(10, 20)
+    answered = []
+    texts = ['a', 'b', 'c', 'd', 'e']
+    result = translate_batch(texts, request, lambda text: text + '!', stats,
+                             lambda batch, translations: answered.append(batch))
+    # 'c' is left alone after the second split and goes through single()
+    assert result == ['A', 'B', 'c!', 'D', 'E']
+    assert requests == [texts, ['a', 'b'], ['c', 'd', 'e'], ['d', 'e']]
+    assert answered == [['a', 'b'], ['d', 'e']]
+    assert stats.requests == 5
+    assert stats.splits == 2
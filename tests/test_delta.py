@@ -0,0 +1,76 @@
+"""Row diffs and incremental runs (translation/delta.py)."""
+
+from decimal import Decimal
+
+from translation.delta import (
+    OP_DELETE, OP_UPSERT, delta_identities, diff, snapshot_path, translate_delta, write_delta,
+)
+from translation.pipeline import COLUMN_INDEX, LLMStage, Pipeline, read_rows, write_rows
+
+NOTES = COLUMN_INDEX['dosing_notes']
+HEADER = ['name_sv', 'name_en', 'research_status', 'dosing_base_g_mg', 'dosing_max_g_mg', 'dosing_notes',
+          'bioavailability_notes', 'interaction_risk', 'is_base_health', 'category_links']
+
+
+def row(name, notes, base='50 mg', maximum='200 mg'):
+    return [name, name, 'Blå', base, maximum, notes, '-', '-', 'FALSE', '1']
+
+
+def test_identities_number_rows_with_the_same_name_and_doses():
+    rows = [HEADER, row('Zink', 'a'), row('Zink', 'b'), row('Zink', 'c', base='1 g'), row('Zink', 'd')]
+    assert delta_identities(rows) == [
+        None,
+        ('Zink', Decimal(50), Decimal(200), 'mg', 1),
+        ('Zink', Decimal(50), Decimal(200), 'mg', 2),
+        ('Zink', Decimal(1), Decimal('0.2'), 'g', 1),
+        ('Zink', Decimal(50), Decimal(200), 'mg', 3),
+    ]
+
+
+def test_diff_sorts_rows_into_added_changed_removed_and_unchanged():
+    old = [HEADER, row('Zink', 'Immunförsvar.'), row('Järn', 'Blodbrist.'), row('Jod', 'Sköldkörtel.')]
+    new = [HEADER, row('Jod', 'Sköldkörtel.'), row('Zink', 'Immunförsvar!'), row('Selen', 'Antioxidant.')]
+    delta = diff(old, new)
+    identity = lambda name: (name, Decimal(50), Decimal(200), 'mg', 1)
+    assert delta.added == [identity('Selen')]
+    assert delta.changed == [identity('Zink')]
+    assert delta.removed == [identity('Järn')]
+    assert delta.unchanged == [identity('Jod')]
+
+
+def test_write_delta_upserts_new_rows_and_deletes_old_ones(tmp_path):
+    old = [HEADER, row('Zink', 'a'), row('Järn', 'b')]
+    new = [HEADER, row('Zink', 'a'), row('Selen', 'c')]
+    path = str(tmp_path / 'delta.csv')
+    write_delta(path, diff(old, new), new, old)
+    assert read_rows(path) == [HEADER + ['op', 'occurrence'], row('Selen', 'c') + [OP_UPSERT, '1'],
+                               row('Järn', 'b') + [OP_DELETE, '1']]
+
+
+def test_translate_delta_only_translates_changed_rows_and_retries_failures(tmp_path):
+    failing = set()
+    calls = []
+
+    def translate(text, column, hits=None):
+        calls.append(text)
+        return None if text in failing else f'EN: {text}'
+
+    pipeline = Pipeline([LLMStage(translate, ['dosing_notes'])])
+    source, output = str(tmp_path / 'source.csv'), str(tmp_path / 'out.csv')
+    write_rows(source, [HEADER, row('Zink', 'Immunförsvar.'), row('Järn', 'Blodbrist.')])
+    failing.add('Blodbrist.')
+    delta = translate_delta(pipeline, source, output)
+    assert len(delta.added) == 2
+    assert [r[NOTES] for r in read_rows(output)[1:]] == ['EN: Immunförsvar.', 'Blodbrist.']
+    assert [r[NOTES] for r in read_rows(snapshot_path(output))[1:]] == ['Immunförsvar.', '']
+
+    failing.clear()
+    calls.clear()
+    delta = translate_delta(pipeline, source, output)
+    assert (len(delta.changed), len(delta.unchanged)) == (1, 1)
+    assert calls == ['Blodbrist.']
+    assert [r[NOTES] for r in read_rows(output)[1:]] == ['EN: Immunförsvar.', 'EN: Blodbrist.']
+
+    calls.clear()
+    assert len(translate_delta(pipeline, source, output).unchanged) == 2
+    assert calls == []
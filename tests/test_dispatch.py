@@ -0,0 +1,89 @@
+"""Ordering, bounds and Ctrl-C handling of the async dispatcher (translation/dispatch.py)."""
+
+import asyncio
+import os
+import signal
+
+from translation.dispatch import dispatch
+
+
+def run(items, worker, concurrency, window=None):
+    delivered = []
+
+    def on_result(index, item, result, error):
+        delivered.append((index, item, result, error))
+
+    interrupted = asyncio.run(dispatch(items, worker, concurrency, on_result, window))
+    return interrupted, delivered
+
+
+def test_results_come_back_in_input_order_with_bounded_concurrency():
+    in_flight = 0
+    most = 0
+
+    async def worker(item):
+        nonlocal in_flight, most
+        in_flight += 1
+        most = max(most, in_flight)
+        # Later items finish first
+        await asyncio.sleep(0.001 * (10 - item))
+        in_flight -= 1
+        if item == 3:
+            raise ValueError('bad cell')
+        return item * 10
+
+    interrupted, delivered = run(range(10), worker, 4)
+    assert not interrupted
+    assert most == 4
+    assert [index for index, *_ in delivered] == list(range(10))
+    assert [result for _, _, result, _ in delivered] == [0, 10, 20, None, 40, 50, 60, 70, 80, 90]
+    assert isinstance(delivered[3][3], ValueError)
+
+
+def test_a_window_bounds_the_items_held_before_delivery():
+    pulled = []
+    held = []
+
+    def items():
+        for item in range(20):
+            pulled.append(item)
+            held.append(len(pulled) - len(delivered))
+            yield item
+
+    async def worker(item):
+        await asyncio.sleep(0.001 * (item % 3))
+        return item
+
+    delivered = []
+    asyncio.run(dispatch(items(), worker, 8, lambda index, *_: delivered.append(index), window=3))
+    assert delivered == list(range(20))
+    assert max(held) <= 3
+
+
+def test_the_first_interrupt_drains_the_requests_in_flight():
+    async def worker(item):
+        if item == 0:
+            os.kill(os.getpid(), signal.SIGINT)
+        await asyncio.sleep(0.01)
+        return item
+
+    interrupted, delivered = run(range(100), worker, 3)
+    assert interrupted
+    assert [(index, result, error) for index, _, result, error in delivered] == [
+        (0, 0, None), (1, 1, None), (2, 2, None)]
+
+
+def test_a_second_interrupt_cancels_them():
+    async def worker(item):
+        if item == 0:
+            os.kill(os.getpid(), signal.SIGINT)
+            await asyncio.sleep(0.01)
+            os.kill(os.getpid(), signal.SIGINT)
+            return item
+        await asyncio.sleep(10)
+        return item
+
+    interrupted, delivered = run(range(100), worker, 3)
+    assert interrupted
+    assert delivered[0][2:] == (0, None)
+    assert [type(error).__name__ for *_, error in delivered[1:]] == ['CancelledError', 'CancelledError']
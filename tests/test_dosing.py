@@ -0,0 +1,67 @@
+"""Dose parsing and the dosing file (translation/dosing.py)."""
+
+import io
+from decimal import Decimal
+
+import pytest
+
+from translation.columnar import ColumnTable
+from translation.dosing import Dose, Dosing, parse_dose, row_dosing, write_dosing
+from translation.loader import STAGING_COLUMNS, staged_rows
+from translation.pipeline import read_rows
+
+HEADER = 'name_sv,name_en,research_status,dosing_base_g_mg,dosing_max_g_mg,dosing_notes,' \
+         'bioavailability_notes,interaction_risk,is_base_health,category_links\n'
+
+
+@pytest.mark.parametrize('text, dose', [
+    ('500 mg', Dose(Decimal(500), Decimal(500), 'mg')),
+    ('1,5 g', Dose(Decimal('1.5'), Decimal('1.5'), 'g')),
+    ('100-200 mcg', Dose(Decimal(100), Decimal(200), 'mcg')),
+    ('10 Mrd', Dose(Decimal(10) ** 10, Decimal(10) ** 10, 'cfu')),
+    ('2 kapslar', Dose(Decimal(2), Decimal(2), 'caps')),
+    ('-', None),
+    ('N/A', None),
+])
+def test_parse_dose(text, dose):
+    assert parse_dose(text) == dose
+
+
+@pytest.mark.parametrize('text', ['Varierar', '2 tsk', '200-100 mg', '5'])
+def test_parse_dose_rejects(text):
+    with pytest.raises(ValueError):
+        parse_dose(text)
+
+
+def test_row_dosing_converts_the_max_to_the_base_unit():
+    assert row_dosing('500 mg', '1 g') == Dosing(Decimal(500), Decimal(1000), 'mg')
+    assert row_dosing('100-200 mg', '-') == Dosing(Decimal(100), Decimal(200), 'mg')
+    assert row_dosing('2 kapslar', '1 g') == Dosing(None, None, None)
+
+
+def test_the_dosing_file_is_keyed_like_the_loader(tmp_path):
+    csv_text = HEADER + (
+        'Zink,Zinc,Grön,15 mg,30 mg,a,-,Låg.,FALSE,1\n'
+        'Zink,Zinc,Grön,30 mg,50 mg,b,-,Låg.,FALSE,1\n'
+        'Zink,Zinc,Grön,15 mg,30 mg,c,-,Låg.,FALSE,1\n'
+        'B-Komplex,B Complex,Grön,1 dos,1 dos,d,-,Låg.,FALSE,1\n'
+    )
+    table = ColumnTable.read(io.StringIO(csv_text))
+    path = str(tmp_path / 'dose.csv')
+    assert write_dosing(table, path) == (4, 2)
+    dosing = read_rows(path)
+    assert dosing == [
+        ['name_sv', 'dosing_base_val', 'dosing_max_val', 'unit', 'occurrence'],
+        ['Zink', '15', '30', 'mg', '1'],
+        ['Zink', '30', '50', 'mg', '1'],
+        ['Zink', '15', '30', 'mg', '2'],
+        ['B-Komplex', '', '', '', '1'],
+    ]
+    rejects = read_rows(str(tmp_path / 'dose.rejects.csv'))
+    assert rejects[1][:6] == ['B-Komplex', '', '', '', '1', 'dosing_base_g_mg']
+
+    # The staged rows carry the same name_sv, dose values and occurrence
+    rows, _ = staged_rows(table)
+    key = [STAGING_COLUMNS.index(name)
+           for name in ('name_sv', 'dosing_base_val', 'dosing_max_val', 'unit', 'occurrence')]
+    assert [[row[idx] or '' for idx in key] for row in rows] == dosing[1:]
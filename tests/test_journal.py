@@ -0,0 +1,62 @@
+"""Append and replay of the checkpoint journal (translation/journal.py)."""
+
+import json
+
+from translation.journal import Journal, journal_path, source_hash
+from translation.pipeline import COLUMN_INDEX
+
+NOTES = COLUMN_INDEX['dosing_notes']
+
+
+def row(name, notes):
+    return [name, name, 'Blå', '50 mg', '200 mg', notes, '-', 'Låg.', 'FALSE', '1']
+
+
+def journal(tmp_path):
+    return Journal(journal_path(str(tmp_path / 'out.csv')), sync_every=2)
+
+
+def test_replay_restores_appended_records(tmp_path):
+    writer = journal(tmp_path)
+    writer.append([0, 2], 'dosing_notes', 'Serotonin.', 'EN: Serotonin.')
+    writer.append([1], 'interaction_risk', 'Låg.', 'Low.')
+    writer.close()
+
+    rows = [row('5-HTP', 'Serotonin.'), row('Zink', 'Immunförsvar.'), row('5-HTP', 'Serotonin.')]
+    restored = []
+    assert journal(tmp_path).replay(rows, lambda *args: restored.append(args)) == 3
+    assert [r[NOTES] for r in rows] == ['EN: Serotonin.', 'Immunförsvar.', 'EN: Serotonin.']
+    assert rows[1][COLUMN_INDEX['interaction_risk']] == 'Low.'
+    assert restored[0] == (0, 'dosing_notes', source_hash('Serotonin.'), 'EN: Serotonin.')
+
+
+def test_replay_skips_cells_that_no_longer_hold_the_source(tmp_path):
+    writer = journal(tmp_path)
+    writer.append([0, 1], 'dosing_notes', 'Serotonin.', 'EN: Serotonin.')
+    writer.close()
+
+    # Row 1 was edited since; replaying twice changes nothing more
+    rows = [row('5-HTP', 'Serotonin.'), row('5-HTP', 'Serotonin-prekursor.')]
+    assert journal(tmp_path).replay(rows) == 1
+    assert journal(tmp_path).replay(rows) == 0
+    assert [r[NOTES] for r in rows] == ['EN: Serotonin.', 'Serotonin-prekursor.']
+
+
+def test_replay_skips_a_torn_last_line_and_rows_past_the_end(tmp_path):
+    writer = journal(tmp_path)
+    writer.append([0, 5], 'dosing_notes', 'Serotonin.', 'EN: Serotonin.')
+    writer.close()
+    with open(writer.path, 'a', encoding='utf-8') as f:
+        f.write(json.dumps({'rows': [0], 'column': 'dosing_notes'})[:20])
+
+    rows = [row('5-HTP', 'Serotonin.')]
+    assert journal(tmp_path).replay(rows) == 1
+    assert rows[0][NOTES] == 'EN: Serotonin.'
+
+
+def test_discard_removes_the_journal(tmp_path):
+    writer = journal(tmp_path)
+    writer.append([0], 'dosing_notes', 'Serotonin.', 'EN: Serotonin.')
+    writer.discard()
+    assert journal(tmp_path).replay([row('5-HTP', 'Serotonin.')]) == 0
+    assert not (tmp_path / 'out.csv.journal').exists()
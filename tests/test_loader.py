@@ -0,0 +1,159 @@
+"""
+Round trip of translation/loader.py through a local Postgres.
+
+Skipped unless psycopg is installed and DATABASE_URL points at a database
+the test may create a scratch schema in:
+    DATABASE_URL=postgresql://localhost/postgres python -m pytest tests
+The schema holds the enums and the supplements table of complete_schema.sql.
+"""
+
+import csv
+import io
+import os
+import re
+import uuid
+
+import pytest
+
+psycopg = pytest.importorskip('psycopg')
+from psycopg.conninfo import make_conninfo
+
+from translation.columnar import ColumnTable
+from translation.delta import delta_identities, diff, write_delta
+from translation.dosing import row_dosing
+from translation.loader import load, staged_rows
+from translation.pipeline import COLUMN_INDEX, is_data_row, read_rows
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CATALOG = os.path.join(ROOT, 'supplements-english.csv')
+# A name_sv and dose that repeat in the catalog, so rows are told apart by ROW_NUMBER()
+REPEATED = ('Zink', '15 mg', '30 mg')
+
+
+def schema_sql():
+    """The enums and the supplements table from complete_schema.sql."""
+    with open(os.path.join(ROOT, 'complete_schema.sql'), encoding='utf-8') as f:
+        sql = f.read()
+    types = re.findall(r'CREATE TYPE \w+ AS ENUM \([^)]*\);', sql)
+    table = re.search(r'CREATE TABLE supplements \(.*?\n\);', sql, re.S).group(0)
+    return '\n'.join(types + [table])
+
+
+@pytest.fixture
+def conninfo():
+    url = os.environ.get('DATABASE_URL')
+    if not url:
+        pytest.skip('DATABASE_URL is not set')
+    schema = f'loader_test_{uuid.uuid4().hex[:8]}'
+    with psycopg.connect(url, autocommit=True) as conn:
+        conn.execute(f'CREATE SCHEMA {schema}')
+        conn.execute(f'SET search_path TO {schema}')
+        conn.execute(schema_sql())
+    try:
+        yield make_conninfo(url, options=f'-c search_path={schema}')
+    finally:
+        with psycopg.connect(url, autocommit=True) as conn:
+            conn.execute(f'DROP SCHEMA {schema} CASCADE')
+
+
+def read_table(rows):
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(rows)
+    buffer.seek(0)
+    return ColumnTable.read(buffer)
+
+
+def load_table(conninfo, table):
+    rows, _ = staged_rows(table)
+    return load(conninfo, rows)
+
+
+def supplements(conninfo):
+    """The supplements rows by id: (name_sv, base, max, unit, name_en, dosing_notes, level, category_ids)."""
+    with psycopg.connect(conninfo) as conn:
+        return {row[0]: row[1:] for row in conn.execute(
+            'SELECT id, name_sv, dosing_base_val, dosing_max_val, unit::text, name_en, dosing_notes, '
+            'interaction_risk_level::text, category_ids FROM supplements ORDER BY id')}
+
+
+def by_identity(records):
+    """(name_sv, base, max, unit, occurrence) -> (id, record), numbering equal keys by id."""
+    seen = {}
+    result = {}
+    for id_, record in records.items():
+        key = record[:4]
+        seen[key] = seen.get(key, 0) + 1
+        result[key + (seen[key],)] = (id_, record)
+    return result
+
+
+def expected(rows):
+    """What by_identity() should find after rows are loaded: identity -> (name_en, dosing_notes)."""
+    return {identity: (row[COLUMN_INDEX['name_en']], row[COLUMN_INDEX['dosing_notes']] or None)
+            for identity, row in zip(delta_identities(rows), rows) if identity is not None}
+
+
+def repeated_rows(rows):
+    return [idx for idx, row in enumerate(rows)
+            if is_data_row(row) and (row[0], row[COLUMN_INDEX['dosing_base_g_mg']],
+                                     row[COLUMN_INDEX['dosing_max_g_mg']]) == REPEATED]
+
+
+def test_load_then_reload_updates_in_place(conninfo):
+    rows = read_rows(CATALOG)
+    table = read_table(rows)
+    staged = len(staged_rows(table)[0])
+    assert load_table(conninfo, table) == (0, 0, staged)
+    loaded = supplements(conninfo)
+    assert len(loaded) == staged
+
+    found = {identity: (record[4], record[5]) for identity, (_, record) in by_identity(loaded).items()}
+    assert found == expected(rows)
+    first = next(row for row in rows if is_data_row(row))
+    record = loaded[min(loaded)]
+    assert record[0] == first[0]
+    assert record[7] == [int(part) for part in first[COLUMN_INDEX['category_links']].split(';')]
+    assert record[6] in ('Low', 'Medium', 'High')
+
+    assert load_table(conninfo, read_table(rows)) == (staged, 0, 0)
+    assert supplements(conninfo) == loaded
+
+
+def test_delta_updates_deletes_and_inserts(conninfo, tmp_path):
+    old_rows = read_rows(CATALOG)
+    load_table(conninfo, read_table(old_rows))
+    before = by_identity(supplements(conninfo))
+
+    new_rows = [list(row) for row in old_rows]
+    repeated = repeated_rows(new_rows)
+    assert len(repeated) >= 3
+    notes = COLUMN_INDEX['dosing_notes']
+    new_rows[repeated[1]][notes] = 'Edited: the second of the repeated rows.'
+    del new_rows[repeated[2]]
+    new_rows.append(['Testtillskott', 'Test Supplement', 'Green', '100 mg', '200 mg', 'Added row.',
+                     '-', 'Low.', 'FALSE', '1; 2'])
+
+    delta = diff(old_rows, new_rows)
+    delta_file = str(tmp_path / 'delta.csv')
+    write_delta(delta_file, delta, new_rows, old_rows)
+    with open(delta_file, encoding='utf-8', newline='') as f:
+        result = load_table(conninfo, ColumnTable.read(f))
+    assert result == (len(delta.changed), len(delta.removed), len(delta.added))
+    assert len(delta.added) == 1
+    assert len(delta.removed) == 1
+
+    after = by_identity(supplements(conninfo))
+    found = {identity: (record[4], record[5]) for identity, (_, record) in after.items()}
+    assert found == expected(new_rows)
+
+    # Rows kept their ids: the edit landed on the second repeated row, the
+    # last one of the group was deleted and the new row got a new id
+    key = (REPEATED[0],) + tuple(row_dosing(*REPEATED[1:]))
+    group_before = [before[identity][0] for identity in before if identity[:4] == key]
+    group_after = [after[identity][0] for identity in after if identity[:4] == key]
+    assert group_after == group_before[:-1]
+    assert after[key + (2,)][1][5] == 'Edited: the second of the repeated rows.'
+    untouched = [identity for identity in delta.unchanged if identity in before]
+    assert all(after[identity][0] == before[identity][0] for identity in untouched)
+    new_identity = delta.added[0]
+    assert after[new_identity][0] > max(id_ for id_, _ in before.values())
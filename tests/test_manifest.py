@@ -0,0 +1,43 @@
+"""Stat keys of a run's starting files (translation/manifest.py)."""
+
+import os
+
+from translation.manifest import Manifest, manifest_path
+
+
+def test_files_are_unchanged_until_one_is_written(tmp_path):
+    source, output, backup = (str(tmp_path / name) for name in ('source.csv', 'out.csv', 'backup.csv'))
+    for path in (source, output):
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write('a,b\n')
+    files = [source, output, backup]
+    path = manifest_path(output)
+    assert not Manifest(path).unchanged(files)
+
+    Manifest(path).record(files)
+    assert Manifest(path).unchanged(files)
+    assert not Manifest(path).unchanged(files + [str(tmp_path / 'other.csv')])
+
+    # A same-size rewrite still changes mtime and ctime
+    with open(source, 'w', encoding='utf-8') as f:
+        f.write('a,c\n')
+    stat = os.stat(source)
+    os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns - 10 ** 9))
+    assert not Manifest(path).unchanged(files)
+
+
+def test_a_file_that_appears_is_a_change(tmp_path):
+    backup = str(tmp_path / 'backup.csv')
+    path = manifest_path(str(tmp_path / 'out.csv'))
+    Manifest(path).record([backup])
+    assert Manifest(path).unchanged([backup])
+    with open(backup, 'w', encoding='utf-8') as f:
+        f.write('a,b\n')
+    assert not Manifest(path).unchanged([backup])
+
+
+def test_an_unreadable_manifest_is_empty(tmp_path):
+    path = str(tmp_path / 'out.csv.manifest.json')
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('{')
+    assert Manifest(path).files == {}
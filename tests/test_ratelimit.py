@@ -0,0 +1,65 @@
+"""Header parsing and backoff of the rate limiter (translation/ratelimit.py)."""
+
+import email.utils
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from translation.ratelimit import RateLimiter, parse_duration, retry_after
+
+
+def api_error(status_code, headers=None):
+    return SimpleNamespace(status_code=status_code, response=SimpleNamespace(headers=headers or {}))
+
+
+@pytest.mark.parametrize('value, seconds', [('1s', 1), ('6m0s', 360), ('20ms', 0.02), ('1h2m3.5s', 3723.5)])
+def test_parse_duration(value, seconds):
+    assert parse_duration(value) == pytest.approx(seconds)
+
+
+@pytest.mark.parametrize('value', ['', None, 'soon'])
+def test_parse_duration_without_a_duration(value):
+    assert parse_duration(value) is None
+
+
+def test_retry_after_prefers_milliseconds_then_seconds_then_a_date():
+    assert retry_after({'retry-after-ms': '1500', 'retry-after': '9'}) == 1.5
+    assert retry_after({'retry-after-ms': 'x', 'retry-after': '9'}) == 9
+    date = email.utils.formatdate(time.time() + 30, usegmt=True)
+    assert 25 < retry_after({'retry-after': date}) <= 30
+    assert retry_after({'retry-after': 'whenever'}) is None
+    assert retry_after(None) is None
+
+
+def test_observe_adopts_the_reported_limits_and_budget():
+    limiter = RateLimiter(rpm=500, tpm=200_000)
+    limiter.observe({'x-ratelimit-limit-requests': '60', 'x-ratelimit-remaining-requests': '10',
+                     'x-ratelimit-limit-tokens': 'bogus'})
+    assert limiter.requests.capacity == 60
+    assert limiter.requests.level == pytest.approx(10, abs=0.1)
+    assert limiter.tokens.capacity == 200_000
+
+
+def test_observe_blocks_until_an_exhausted_budget_resets():
+    limiter = RateLimiter()
+    before = time.monotonic()
+    limiter.observe({'x-ratelimit-remaining-tokens': '0', 'x-ratelimit-reset-tokens': '2s'})
+    assert limiter.blocked_until >= before + 2
+    assert limiter.reserve() > 1.5
+
+
+def test_backoff_uses_retry_after_and_pauses_every_caller_on_429():
+    limiter = RateLimiter(seed=1)
+    assert limiter.backoff(0, api_error(429, {'retry-after': '3'})) == 3
+    assert limiter.throttled == 1
+    assert limiter.blocked_until > time.monotonic() + 2
+
+
+def test_backoff_is_jittered_exponential_and_capped_without_retry_after():
+    limiter = RateLimiter(base_delay=1.0, max_delay=10.0, seed=1)
+    for attempt, ceiling in ((0, 1), (2, 4), (10, 10)):
+        delay = limiter.backoff(attempt, api_error(500))
+        assert ceiling / 2 <= delay <= ceiling
+    assert limiter.throttled == 0
+    assert limiter.blocked_until == 0.0
@@ -0,0 +1,38 @@
+"""The resume index (translation/resume.py)."""
+
+from translation.resume import ResumeIndex, index_path
+
+
+def index(tmp_path):
+    return ResumeIndex(index_path(str(tmp_path / 'out.csv')))
+
+
+def test_a_saved_cell_is_done_while_its_source_is_unchanged(tmp_path):
+    resume = index(tmp_path)
+    resume.accept('5-HTP', 'dosing_notes', 'Går direkt till hjärnan.', 'Goes directly to the brain.')
+    resume.accept(None, 'dosing_notes', 'Låg.', 'Low.')
+    resume.save()
+
+    loaded = index(tmp_path)
+    assert len(loaded) == 1
+    assert loaded.is_done('5-HTP', 'dosing_notes', 'Går direkt till hjärnan.', 'Goes directly to the brain.')
+    assert not loaded.is_done('5-HTP', 'dosing_notes', 'Går direkt till hjärnan.', 'Går direkt till hjärnan.')
+    assert not loaded.is_done('5-HTP#2', 'dosing_notes', 'Går direkt till hjärnan.', 'Goes directly to the brain.')
+    assert not loaded.is_outdated('5-HTP', 'dosing_notes', 'Går direkt till hjärnan.', 'Goes directly to the brain.')
+
+
+def test_a_cell_whose_source_was_edited_is_outdated_not_done(tmp_path):
+    resume = index(tmp_path)
+    resume.accept('5-HTP', 'dosing_notes', 'Går direkt till hjärnan.', 'Goes directly to the brain.')
+
+    edited = 'Når hjärnan på en timme.'
+    assert not resume.is_done('5-HTP', 'dosing_notes', edited, 'Goes directly to the brain.')
+    assert resume.is_outdated('5-HTP', 'dosing_notes', edited, 'Goes directly to the brain.')
+    # Once the cell is back at its source text it is simply pending
+    assert not resume.is_outdated('5-HTP', 'dosing_notes', edited, edited)
+    assert not resume.is_done('5-HTP', 'dosing_notes', edited, edited)
+
+
+def test_an_index_of_another_version_is_ignored(tmp_path):
+    (tmp_path / 'out.csv.resume.json').write_text('{"version": 0, "cells": {"a\\tb": ["x", "y"]}}')
+    assert len(index(tmp_path)) == 0
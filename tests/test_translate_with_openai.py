@@ -0,0 +1,147 @@
+"""
+Whole runs of translate_with_openai.run() in a scratch directory.
+
+The API is replaced by a fake translate_text() that prefixes 'EN: ', or,
+while failing is set, returns None like an exhausted retry loop.
+"""
+
+import csv
+
+import pytest
+
+pytest.importorskip('openai')
+pytest.importorskip('dotenv')
+
+import translate_with_openai
+from translation.pipeline import COLUMN_INDEX, read_rows
+
+SOURCE = 'Börja utforska - Börja utforska.csv'
+OUTPUT = 'supplements-english.csv'
+NOTES = COLUMN_INDEX['dosing_notes']
+HEADER = ['name_sv', 'name_en', 'research_status', 'dosing_base_g_mg', 'dosing_max_g_mg', 'dosing_notes',
+          'bioavailability_notes', 'interaction_risk', 'is_base_health', 'category_links']
+ROWS = [
+    ['5-HTP', '5-HTP', 'Blå', '50 mg', '200 mg', 'Når hjärnan snabbt.', 'Kombinera ej med SSRI.', 'Hög.', 'FALSE', '5'],
+    ['Zink', 'Zinc', 'Grön', '15 mg', '30 mg', 'Stödjer immunförsvaret.', 'Bäst på tom mage.', 'Låg.', 'FALSE', '2'],
+]
+
+
+class FakeAPI:
+    def __init__(self):
+        self.calls = []
+        self.failing = False
+
+    def translate_text(self, text, column, hits=None):
+        self.calls.append(text)
+        return None if self.failing else f'EN: {text}'
+
+
+@pytest.fixture
+def api(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(translate_with_openai, 'memory', None)
+    fake = FakeAPI()
+    monkeypatch.setattr(translate_with_openai, 'translate_text', fake.translate_text)
+    return fake
+
+
+def write_source(rows):
+    with open(SOURCE, 'w', encoding='utf-8', newline='') as f:
+        csv.writer(f).writerows([HEADER] + rows)
+
+
+def run(*argv):
+    args = translate_with_openai.build_parser().parse_args(['--no-cache', '--detector', 'indicators', *argv])
+    translate_with_openai.run(args)
+    return read_rows(OUTPUT)
+
+
+def test_a_rerun_skips_finished_cells(api):
+    write_source(ROWS)
+    first = run()
+    assert first[1][NOTES] == 'EN: Når hjärnan snabbt.'
+    assert len(api.calls) == 6
+    api.calls.clear()
+    assert run() == first
+    assert api.calls == []
+
+
+def test_an_edited_source_cell_is_translated_again_without_a_snapshot(api, tmp_path):
+    write_source(ROWS)
+    run()
+    api.calls.clear()
+
+    # The output no longer lines up with a snapshot, so alignment keeps the
+    # old translation; the resume index knows it was made from other text
+    (tmp_path / (OUTPUT + '.source')).unlink()
+    edited = [list(row) for row in ROWS]
+    edited[0][NOTES] = 'Når hjärnan på en timme.'
+    write_source(edited)
+    rows = run()
+    assert api.calls == ['Når hjärnan på en timme.']
+    assert rows[1][NOTES] == 'EN: Når hjärnan på en timme.'
+    assert rows[2][NOTES] == 'EN: Stödjer immunförsvaret.'
+
+
+def test_an_edited_source_cell_is_not_filled_in_from_the_backup(api, tmp_path):
+    write_source(ROWS)
+    run()
+    (tmp_path / 'supplements-english-backup.csv').write_bytes((tmp_path / OUTPUT).read_bytes())
+    api.calls.clear()
+
+    edited = [list(row) for row in ROWS]
+    edited[0][NOTES] = 'Når hjärnan på en timme.'
+    write_source(edited)
+    rows = run()
+    assert api.calls == ['Når hjärnan på en timme.']
+    assert rows[1][NOTES] == 'EN: Når hjärnan på en timme.'
+
+
+def test_cells_whose_api_call_failed_are_retried_by_an_incremental_run(api, tmp_path):
+    write_source(ROWS)
+    api.failing = True
+    rows = run()
+    assert rows[1][NOTES] == 'Når hjärnan snabbt.'
+    # Nothing was translated from the failed cells, so the snapshot has them blank
+    snapshot = read_rows(OUTPUT + '.source')
+    assert snapshot[1][NOTES] == ''
+    assert snapshot[1][COLUMN_INDEX['research_status']] == 'Blå'
+
+    api.failing = False
+    api.calls.clear()
+    rows = run('--incremental')
+    assert len(api.calls) == 6
+    assert rows[1][NOTES] == 'EN: Når hjärnan snabbt.'
+    assert read_rows(OUTPUT + '.source') == [HEADER] + ROWS
+    api.calls.clear()
+    run('--incremental')
+    assert api.calls == []
+
+
+def test_an_incremental_run_retries_its_own_failed_cells(api):
+    write_source(ROWS)
+    api.failing = True
+    run('--incremental')
+    api.failing = False
+    api.calls.clear()
+    rows = run('--incremental')
+    assert len(api.calls) == 6
+    assert rows[2][NOTES] == 'EN: Stödjer immunförsvaret.'
+
+
+def test_a_rerun_on_unchanged_files_skips_the_alignment(api, tmp_path, capsys):
+    write_source(ROWS)
+    first = run()
+    (tmp_path / 'supplements-english-backup.csv').write_bytes((tmp_path / OUTPUT).read_bytes())
+    run()
+    capsys.readouterr()
+
+    assert run() == first
+    assert 'no file changed since the last run' in capsys.readouterr().out
+
+    edited = [list(row) for row in ROWS]
+    edited[1][NOTES] = 'Stödjer immunförsvaret kraftigt.'
+    write_source(edited)
+    rows = run()
+    assert 'Aligning' in capsys.readouterr().out
+    assert rows[2][NOTES] == 'EN: Stödjer immunförsvaret kraftigt.'
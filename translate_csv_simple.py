@@ -2,14 +2,21 @@
 """
 Simple translation script for Swedish supplement CSV to English.
 Handles status codes, risk levels, and common Swedish medical terms.
+Usage: python3 translate_csv_simple.py [--input FILE|-] [--output FILE|-] [--workers N | --columnar] [--dosing FILE] [--profile DIR]
 """
 
-import csv
+import argparse
+import functools
 import re
+import sys
 
-# Direct mappings
-STATUS_MAP = {'Grön': 'Green', 'Blå': 'Blue', 'Röd': 'Red'}
-RISK_MAP = {'Låg': 'Low', 'Medium': 'Medium', 'Hög': 'High'}
+from translation.columnar import translate_columnar
+from translation.dosing import rejects_path, write_dosing
+from translation.matchers import TokenReplacer
+from translation.pipeline import RISK_MAP, STATUS_MAP, ExactMapStage, GlossaryStage, Pipeline
+from translation.profiling import Profiler
+from translation.sharding import translate_sharded
+from translation.streaming import STDIO, stream_translate
 
 # Common Swedish to English term replacements
 TERM_REPLACEMENTS = [
@@ -353,63 +360,80 @@ TERM_REPLACEMENTS = [
     (r'\bOg\b', 'Og'),
 ]
 
+# Compiled once per process; see translation/matchers.py
+TERM_MATCHER = TokenReplacer(TERM_REPLACEMENTS)
+
 def translate_text(text):
     """Translate Swedish text to English."""
     if not text or text == '-':
         return text
     
-    result = text
-    for pattern, replacement in TERM_REPLACEMENTS:
-        result = re.sub(pattern, replacement, result, flags=re.IGNORECASE)
-    
-    return result
+    return TERM_MATCHER.replace(text)
+
+# Status/risk columns are exact lookups; dosing and bioavailability notes go
+# through the term replacements
+PIPELINE = Pipeline([
+    ExactMapStage(STATUS_MAP, ['research_status'], name='status'),
+    ExactMapStage(RISK_MAP, ['interaction_risk'], name='risk'),
+    GlossaryStage(translate_text, ['dosing_notes', 'bioavailability_notes']),
+])
 
 def translate_row(row):
     """Translate a single CSV row."""
-    if len(row) < 10:
-        return row
-    
-    translated = list(row)
-    
-    # Translate research_status (index 2)
-    if translated[2] in STATUS_MAP:
-        translated[2] = STATUS_MAP[translated[2]]
-    
-    # Translate interaction_risk (index 7) 
-    if translated[7] in RISK_MAP:
-        translated[7] = RISK_MAP[translated[7]]
-    
-    # Translate text fields (indices 5, 6)
-    for idx in [5, 6]:
-        if translated[idx]:
-            translated[idx] = translate_text(translated[idx])
-    
-    return translated
+    return PIPELINE.translate_row(row)
+
+def replacement_patterns():
+    """The replacement rules as (pattern, regex, replacement) entries, for the --profile report."""
+    return [(pattern, re.compile(pattern, re.IGNORECASE), replacement)
+            for pattern, replacement in TERM_REPLACEMENTS]
 
 def main():
-    input_file = 'Börja utforska - Börja utforska.csv'
-    output_file = 'supplements-english.csv'
+    parser = argparse.ArgumentParser(description='Translate the Swedish supplement CSV with simple term replacements')
+    parser.add_argument('--input', default='Börja utforska - Börja utforska.csv', help="Source CSV ('-' for stdin)")
+    parser.add_argument('--output', default='supplements-english.csv', help="Translated CSV ('-' for stdout)")
+    parser.add_argument('--workers', type=int, default=1,
+                        help='Translate in this many processes (default: 1); the input must be a file')
+    parser.add_argument('--columnar', action='store_true',
+                        help='Load the catalog into dictionary-encoded columns and translate each distinct value once')
+    parser.add_argument('--dosing', metavar='FILE',
+                        help='Also write numeric dose values and units to FILE, rejects next to it (dose.csv -> dose.rejects.csv; implies --columnar)')
+    parser.add_argument('--profile', metavar='DIR',
+                        help='Profile the run and write pstats, tracemalloc snapshots and a report to DIR')
+    args = parser.parse_args()
+    if args.workers > 1 and args.input == STDIO:
+        parser.error('--workers needs a file --input; stdin cannot be split')
+    if args.workers > 1 and args.profile:
+        parser.error('--profile measures a single process; leave out --workers')
+    if args.workers > 1 and (args.columnar or args.dosing):
+        parser.error('--columnar and --dosing run in one process; leave out --workers')
     
-    rows = []
+    log = sys.stderr if args.output == STDIO else sys.stdout
+    # Rows are translated and written one at a time (translation/streaming.py),
+    # or with --columnar one column at a time (translation/columnar.py)
+    translate = translate_columnar if args.columnar or args.dosing else stream_translate
     
-    with open(input_file, 'r', encoding='utf-8') as f:
-        reader = csv.reader(f)
-        for row in reader:
-            if len(row) > 0 and 'name_sv' in row[0].lower():
-                # Header row - keep as is
-                rows.append(row)
-            elif len(row) >= 10:
-                # Data row - translate
-                rows.append(translate_row(row))
-            else:
-                # Keep malformed rows
-                rows.append(row)
+    def on_table(table):
+        # Dose strings parsed once per distinct value; see translation/dosing.py
+        rows, rejected = write_dosing(table, args.dosing)
+        print(f"Dosing values for {rows} rows written to {args.dosing}; "
+              f"{rejected} rejected cells in {rejects_path(args.dosing)}", file=log)
     
-    with open(output_file, 'w', encoding='utf-8', newline='') as f:
-        writer = csv.writer(f)
-        writer.writerows(rows)
+    if args.dosing:
+        translate = functools.partial(translate_columnar, on_table=on_table)
+    if args.profile:
+        # Per-stage timing and memory, plus the cost of each replacement rule
+        profiler = Profiler(args.profile, log)
+        profiler.watch(PIPELINE)
+        profiler.add_patterns('TERM_REPLACEMENTS', 'glossary', replacement_patterns())
+        with profiler:
+            stats = translate(PIPELINE, args.input, args.output)
+    elif args.workers > 1:
+        # Byte ranges of whole records, one process each; see translation/sharding.py
+        stats = translate_sharded(PIPELINE, args.input, args.output, args.workers)
+    else:
+        stats = translate(PIPELINE, args.input, args.output)
     
-    print(f"Translation complete! {len(rows)} rows written to {output_file}")
+    print(f"Translation complete! {stats.rows} rows written to {args.output}", file=log)
 
 if __name__ == '__main__':
     main()
@@ -2,57 +2,76 @@
 """
 Translate only specific cells in CSV that contain Swedish text.
 Updates only those cells, does not rewrite the entire file.
+With --stream the file is read and written one row at a time instead, so
+memory stays flat on large catalogs; '-' reads stdin or writes stdout.
 """
 
-import csv
-import os
+import argparse
+import asyncio
 import sys
 import time
-from dotenv import load_dotenv
-from openai import OpenAI
-
-# Load environment variables
-load_dotenv('.env.local')
-load_dotenv('.env')
-
-# Initialize OpenAI client
-api_key = (
-    os.getenv('OPENAI_API_KEY') or 
-    os.getenv('OPENAI_KEY') or 
-    os.getenv('OAI_API_KEY')
+
+from translation.client import Clients
+from translation.dispatch import dispatch
+from translation.journal import Journal, journal_path
+from translation.langid import DEFAULT_THRESHOLD, NgramDetector
+from translation.matchers import AhoCorasick
+from translation.memory import DEFAULT_PATH as DEFAULT_MEMORY_PATH, TranslationMemory
+from translation.metrics import Metrics
+from translation import ratelimit
+from translation.ratelimit import DEFAULT_RPM, DEFAULT_TPM, RateLimiter
+from translation.pipeline import (
+    RISK_MAP, STATUS_MAP, ExactMapStage, LLMStage, Pipeline, read_rows, write_rows,
 )
+from translation.streaming import STDIO, stream_translate
 
-if not api_key:
+def missing_api_key():
     print("Error: OpenAI API key not found!")
     sys.exit(1)
 
-client = OpenAI(api_key=api_key)
+# The key is looked up, and the OpenAI SDK imported, on the first API request
+clients = Clients(missing_api_key)
+limiter = RateLimiter()
+
+# Every API request and retry made through the limiter is recorded here
+metrics = Metrics('translate_specific_cells')
+limiter.metrics = metrics
+
+# Everything that changes the API output is part of the translation memory key;
+# bump PROMPT_VERSION whenever the prompt text changes
+MODEL = "gpt-4o-mini"
+TEMPERATURE = 0.3
+PROMPT_VERSION = 'translate_specific_cells/1'
 
-# Simple mappings
-STATUS_MAP = {'Grön': 'Green', 'Blå': 'Blue', 'Röd': 'Red'}
-RISK_MAP = {'Låg': 'Low', 'Medium': 'Medium', 'Hög': 'High'}
+# Replaced in main() according to the --cache options; opened on first use
+memory = TranslationMemory()
 
-def has_swedish_text(text):
-    """Check if text contains Swedish words or characters."""
+# Swedish characters and common Swedish words, matched in one pass over the
+# lower-cased text
+SWEDISH_WORDS = ['grön', 'blå', 'röd', 'låg', 'hög', 'är', 'och', 'för', 'med', 'på', 'av', 'till', 'det', 'som', 'kan', 'inte', 'eller', 'vid', 'bättre', 'högre', 'lägre', 'från']
+SWEDISH_MATCHER = AhoCorasick(['å', 'ä', 'ö'] + SWEDISH_WORDS)
+
+def find_swedish_terms(text):
+    """Return (start, term) for every Swedish character or word in text."""
     if not text or text == '-' or text.strip() == '':
-        return False
-    
-    text_lower = text.lower()
-    swedish_chars = ['å', 'ä', 'ö', 'Å', 'Ä', 'Ö']
-    
-    if any(char in text for char in swedish_chars):
-        return True
-    
-    # Common Swedish words
-    swedish_words = ['grön', 'blå', 'röd', 'låg', 'hög', 'är', 'och', 'för', 'med', 'på', 'av', 'till', 'det', 'som', 'kan', 'inte', 'eller', 'vid', 'bättre', 'högre', 'lägre', 'från']
-    
-    if any(word in text_lower for word in swedish_words):
-        return True
+        return []
+    return SWEDISH_MATCHER.findall(text.lower())
+
+def has_swedish_text(text, hits=None):
+    """Check if text contains Swedish words or characters.
     
-    return False
+    Pass the result of find_swedish_terms() as hits to skip re-scanning.
+    """
+    if hits is not None:
+        return bool(hits)
+    if not text or text == '-' or text.strip() == '':
+        return False
+    return SWEDISH_MATCHER.search(text.lower()) is not None
 
-def translate_text(text):
-    """Translate Swedish text to English using OpenAI API."""
+MAX_RETRIES = 3
+
+def lookup_local(text, hits=None):
+    """Return the translation if it needs no API call, otherwise None."""
     if not text or text == '-':
         return text
     
@@ -62,106 +81,285 @@ def translate_text(text):
     if text in RISK_MAP:
         return RISK_MAP[text]
     
-    if not has_swedish_text(text):
+    if not has_swedish_text(text, hits):
         return text
     
+    # Previously translated text resolves locally
+    if memory is not None:
+        return memory.get(text, MODEL, PROMPT_VERSION, TEMPERATURE)
+    return None
+
+def request_params(text):
+    """Keyword arguments for one chat completion request."""
+    return dict(
+        model=MODEL,
+        messages=[
+            {
+                "role": "system",
+                "content": "You are a medical translator. Translate Swedish supplement text to English. Preserve technical terms, dosages, and abbreviations (BBB, SSRI, NAD+, etc.). Only translate, no explanations."
+            },
+            {
+                "role": "user",
+                "content": f"Translate to English:\n\n{text}"
+            }
+        ],
+        temperature=TEMPERATURE,
+        max_tokens=300,
+        timeout=30
+    )
+
+def finish_response(text, response):
+    """Clean up an API response and store it in the translation memory."""
+    if response.choices[0].finish_reason == 'length':
+        raise ValueError('reply cut off at max_tokens')
+    translated = response.choices[0].message.content.strip()
+    if translated.startswith('"') and translated.endswith('"'):
+        translated = translated[1:-1]
+    if memory is not None:
+        memory.put(text, translated, MODEL, PROMPT_VERSION, TEMPERATURE)
+    return translated
+
+def translate_text(text, hits=None):
+    """Translate Swedish text to English using OpenAI API."""
+    local = lookup_local(text, hits)
+    if local is not None:
+        return local
+    
     # API translation
-    max_retries = 3
-    for attempt in range(max_retries):
+    # Outside the retry loop: a missing key or SDK is not worth retrying
+    completions = clients.get().chat.completions
+    for attempt in range(MAX_RETRIES):
+        try:
+            response = ratelimit.create(completions, limiter, request_params(text))
+            return finish_response(text, response)
+        
+        except Exception as e:
+            if attempt < MAX_RETRIES - 1:
+                time.sleep(limiter.backoff(attempt, e))
+            else:
+                print(f"    ✗ Failed to translate: {text[:50]}")
+                return text  # Return original on failure
+
+async def translate_text_async(text, hits=None):
+    """Async translate_text() for --concurrency runs."""
+    local = lookup_local(text, hits)
+    if local is not None:
+        return local
+    
+    completions = clients.get_async().chat.completions
+    for attempt in range(MAX_RETRIES):
         try:
-            response = client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are a medical translator. Translate Swedish supplement text to English. Preserve technical terms, dosages, and abbreviations (BBB, SSRI, NAD+, etc.). Only translate, no explanations."
-                    },
-                    {
-                        "role": "user",
-                        "content": f"Translate to English:\n\n{text}"
-                    }
-                ],
-                temperature=0.3,
-                max_tokens=300,
-                timeout=30
-            )
-            
-            translated = response.choices[0].message.content.strip()
-            if translated.startswith('"') and translated.endswith('"'):
-                translated = translated[1:-1]
-            return translated
+            response = await ratelimit.create_async(completions, limiter, request_params(text))
+            return finish_response(text, response)
         
         except Exception as e:
-            if attempt < max_retries - 1:
-                time.sleep(2)
+            if attempt < MAX_RETRIES - 1:
+                await asyncio.sleep(limiter.backoff(attempt, e))
             else:
                 print(f"    ✗ Failed to translate: {text[:50]}")
                 return text  # Return original on failure
 
+def translate_cell(text, column, hits=None):
+    """LLM stage: translate one cell that contains Swedish text."""
+    return translate_text(text, hits)
+
+async def translate_cell_async(text, column, hits=None):
+    """Async LLM stage used with --concurrency."""
+    return await translate_text_async(text, hits)
+
+# The Swedish catalog the n-gram detector compares translations against
+SOURCE_FILE = 'Börja utforska - Börja utforska.csv'
+
+# Cells that are only an English status/risk word are never re-translated
+ALREADY_ENGLISH = ['low', 'medium', 'high', 'green', 'blue', 'red']
+TRANSLATED_COLUMNS = ['research_status', 'dosing_notes', 'bioavailability_notes', 'interaction_risk']
+
+# Set in main() unless --detector indicators; see translation/langid.py
+detector = None
+
+def detect_swedish(text):
+    """Swedish hits for text; empty for cells that are already English."""
+    if text.lower() in ALREADY_ENGLISH:
+        return []
+    with metrics.phase('detection'):
+        hits = find_swedish_terms(text)
+        if detector is not None:
+            return detector.filter(text, hits)
+        return hits
+
+def export_metrics(args, cells):
+    """Write the metrics files asked for on the command line."""
+    metrics.cells = cells
+    metrics.phases['rate_limit_wait'] = limiter.waited
+    if memory is not None:
+        metrics.set_cache(memory.hits, memory.misses)
+    if args.metrics_json:
+        metrics.write_json(args.metrics_json)
+    if args.metrics_prom:
+        metrics.write_prometheus(args.metrics_prom)
+
+PIPELINE = Pipeline([
+    ExactMapStage(STATUS_MAP, TRANSLATED_COLUMNS, name='status'),
+    ExactMapStage(RISK_MAP, TRANSLATED_COLUMNS, name='risk'),
+    LLMStage(translate_cell, TRANSLATED_COLUMNS, detect=detect_swedish,
+             translate_async=translate_cell_async),
+])
+
 def main():
-    csv_file = 'supplements-english.csv'
+    global detector, memory
+    parser = argparse.ArgumentParser(description='Translate the cells of supplements-english.csv that still contain Swedish')
+    parser.add_argument('--cache', type=str, default=DEFAULT_MEMORY_PATH,
+                        help=f'Translation memory database (default: {DEFAULT_MEMORY_PATH})')
+    parser.add_argument('--no-cache', action='store_true', help='Do not read or write the translation memory')
+    parser.add_argument('--cache-max-entries', type=int, help='Keep at most this many cached translations')
+    parser.add_argument('--cache-max-age-days', type=float, help='Drop cached translations older than this')
+    parser.add_argument('--concurrency', type=int, default=1,
+                        help='Maximum API requests in flight at once (default: 1, sequential)')
+    parser.add_argument('--rpm', type=int, default=DEFAULT_RPM,
+                        help=f'Starting requests-per-minute limit, replaced by the API rate-limit headers (default: {DEFAULT_RPM})')
+    parser.add_argument('--tpm', type=int, default=DEFAULT_TPM,
+                        help=f'Starting tokens-per-minute limit, replaced by the API rate-limit headers (default: {DEFAULT_TPM})')
+    parser.add_argument('--detector', choices=['ngram', 'indicators'], default='ngram',
+                        help='ngram: only translate cells an n-gram model trained on the source/translated CSVs '
+                             'judges Swedish; indicators: any Swedish word or letter (default: ngram)')
+    parser.add_argument('--detector-threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help=f'Minimum Swedish confidence (0-1) for the n-gram detector (default: {DEFAULT_THRESHOLD})')
+    parser.add_argument('--metrics-json', type=str, help='Write the run metrics as JSON to this file')
+    parser.add_argument('--metrics-prom', type=str,
+                        help='Write the run metrics in Prometheus text format to this file (textfile collector)')
+    parser.add_argument('--stream', action='store_true',
+                        help='Read and write one row at a time (no deduplication or journal; '
+                             'repeats are translation memory hits)')
+    parser.add_argument('--input', default='supplements-english.csv', help="CSV to read with --stream ('-' for stdin)")
+    parser.add_argument('--output', default='supplements-english.csv', help="CSV to write with --stream ('-' for stdout)")
+    args = parser.parse_args()
+    limiter.set_limits(args.rpm, args.tpm)
+    memory = None if args.no_cache else TranslationMemory(
+        args.cache, max_entries=args.cache_max_entries, max_age_days=args.cache_max_age_days)
     
-    # Read all rows
-    rows = []
-    cells_to_translate = []
+    translated_file = args.input if args.stream and args.input != STDIO else 'supplements-english.csv'
+    if args.detector == 'ngram':
+        detector = NgramDetector.from_files(SOURCE_FILE, translated_file, args.detector_threshold)
+    
+    if args.stream:
+        log = sys.stderr if args.output == STDIO else sys.stdout
+        stats = stream_translate(PIPELINE, args.input, args.output, args.concurrency)
+        if stats.interrupted:
+            print(f"\n⚠️  Interrupted; {args.output} was left unchanged. Run again to finish "
+                  f"(translated cells are in the translation memory).", file=log)
+        else:
+            print(f"\n✅ Complete! {stats.rows} rows written to {args.output}", file=log)
+            print(f"✅ Cells translated by the API: {PIPELINE.stats['llm']}", file=log)
+        if memory is not None:
+            print(f"✅ Translation memory: {memory.summary()}", file=log)
+        print(f"✅ Rate limiter: {limiter.summary()}", file=log)
+        if detector is not None:
+            print(f"✅ Language detector: {detector.summary()}", file=log)
+        export_metrics(args, sum(PIPELINE.stats.values()))
+        if memory is not None:
+            memory.close()
+        return
+    
+    csv_file = 'supplements-english.csv'
     
     print(f"Reading {csv_file}...")
-    with open(csv_file, 'r', encoding='utf-8') as f:
-        reader = csv.reader(f)
-        for row_num, row in enumerate(reader, 1):
-            rows.append(row)
-            
-            if len(row) >= 10 and 'name_sv' not in row[0].lower():
-                # Check each column that needs translation
-                for col_idx in [2, 5, 6, 7]:
-                    if col_idx < len(row) and row[col_idx] and row[col_idx] != '-':
-                        text = row[col_idx]
-                        # ONLY translate if it's actually Swedish - don't overwrite English
-                        # Simple status/risk mappings are OK to do
-                        if text in STATUS_MAP:
-                            cells_to_translate.append((row_num - 1, col_idx, text))
-                        elif text in RISK_MAP:
-                            cells_to_translate.append((row_num - 1, col_idx, text))
-                        elif has_swedish_text(text):
-                            # Double-check it's not already English
-                            if not (text.lower() in ['low', 'medium', 'high', 'green', 'blue', 'red']):
-                                cells_to_translate.append((row_num - 1, col_idx, text))
-    
-    print(f"\nFound {len(cells_to_translate)} cells that need translation")
+    with metrics.phase('io'):
+        rows = read_rows(csv_file)
+    
+    # Cells translated by an interrupted run are in its journal; it is
+    # synced every 50 cells, as often as the file used to be rewritten
+    journal = Journal(journal_path(csv_file), sync_every=50)
+    with metrics.phase('io'):
+        restored = journal.replay(rows)
+    if restored:
+        print(f"Restored {restored} translated cells from {journal.path}")
+    
+    # ONLY translate if it's actually Swedish - don't overwrite English
+    # Simple status/risk mappings are OK to do
+    # Cells are grouped by (column, text) so each distinct value is translated once
+    cells_to_translate = {}
+    for row_idx, column, text in PIPELINE.cells(rows):
+        if text in STATUS_MAP or text in RISK_MAP:
+            hits = None
+        else:
+            hits = detect_swedish(text)
+            if not hits:
+                continue
+        cells_to_translate.setdefault((column, text), (hits, []))[1].append(row_idx)
+    
+    total_cells = sum(len(row_indexes) for _, row_indexes in cells_to_translate.values())
+    print(f"\nFound {total_cells} cells that need translation ({len(cells_to_translate)} distinct)")
     print(f"Translating only these specific cells...\n")
     
-    # Translate each cell
+    # Translate each distinct cell once and fan it out to every row using it
     translated_count = 0
-    for idx, (row_idx, col_idx, original_text) in enumerate(cells_to_translate, 1):
-        print(f"[{idx}/{len(cells_to_translate)}] Row {row_idx + 1}, Column {col_idx}: {original_text[:60]}...")
-        
-        translated = translate_text(original_text)
-        rows[row_idx][col_idx] = translated
-        translated_count += 1
+    saved_calls = 0
+    
+    def record(idx, column, original_text, row_indexes, translated, stage_name):
+        nonlocal translated_count, saved_calls
+        if translated != original_text:
+            with metrics.phase('io'):
+                journal.append(row_indexes, column, original_text, translated)
+        PIPELINE.fan_out(rows, column, row_indexes, translated)
+        translated_count += len(row_indexes)
+        if stage_name == 'llm':
+            saved_calls += len(row_indexes) - 1
         
         if translated != original_text:
-            print(f"  → {translated[:60]}")
+            shared = f" (+{len(row_indexes) - 1} more rows)" if len(row_indexes) > 1 else ""
+            print(f"  → {translated[:60]}{shared}")
         
-        # Save every 50 cells
         if idx % 50 == 0:
-            print(f"\n  Saving progress... ({idx}/{len(cells_to_translate)} translated)")
-            temp_file = csv_file + '.tmp'
-            with open(temp_file, 'w', encoding='utf-8', newline='') as f:
-                writer = csv.writer(f)
-                writer.writerows(rows)
-            os.replace(temp_file, csv_file)
+            print(f"\n  Progress journaled... ({idx}/{len(cells_to_translate)} translated)")
+    
+    if args.concurrency > 1:
+        # Results come back in order, so the journal stays a clean prefix
+        print(f"Using up to {args.concurrency} concurrent requests\n")
+        
+        async def worker(item):
+            (column, original_text), (hits, row_indexes) = item
+            return await PIPELINE.resolve_async(original_text, column, hits)
+        
+        def on_result(index, item, result, error):
+            (column, original_text), (hits, row_indexes) = item
+            print(f"[{index + 1}/{len(cells_to_translate)}] Row {row_indexes[0] + 1}, {column}: {original_text[:60]}...")
+            if error is not None:
+                print(f"    ✗ Failed to translate: {original_text[:50]} ({error})")
+                return
+            record(index + 1, column, original_text, row_indexes, *result)
         
-        time.sleep(0.2)  # Rate limiting
+        interrupted = asyncio.run(dispatch(cells_to_translate.items(), worker, args.concurrency, on_result))
+        if interrupted:
+            journal.close()
+            print(f"\n  Progress saved to {journal.path}")
+            print(f"  Run the script again to translate the remaining cells.")
+            export_metrics(args, translated_count)
+            if memory is not None:
+                memory.close()
+            sys.exit(0)
+    else:
+        for idx, ((column, original_text), (hits, row_indexes)) in enumerate(cells_to_translate.items(), 1):
+            print(f"[{idx}/{len(cells_to_translate)}] Row {row_indexes[0] + 1}, {column}: {original_text[:60]}...")
+            translated, stage_name = PIPELINE.resolve(original_text, column, hits)
+            record(idx, column, original_text, row_indexes, translated, stage_name)
     
     # Final save
     print(f"\nSaving final version...")
-    temp_file = csv_file + '.tmp'
-    with open(temp_file, 'w', encoding='utf-8', newline='') as f:
-        writer = csv.writer(f)
-        writer.writerows(rows)
-    os.replace(temp_file, csv_file)
+    with metrics.phase('io'):
+        journal.sync()
+        write_rows(csv_file, rows)
+        journal.discard()
     
     print(f"\n✅ Complete! Translated {translated_count} cells.")
+    print(f"✅ API calls saved by deduplication: {saved_calls}")
+    if memory is not None:
+        print(f"✅ Translation memory: {memory.summary()}")
+    print(f"✅ Rate limiter: {limiter.summary()}")
+    if detector is not None:
+        print(f"✅ Language detector: {detector.summary()}")
+    export_metrics(args, translated_count)
+    if memory is not None:
+        memory.close()
     print(f"✅ Updated only the specific cells in {csv_file}")
 
 if __name__ == '__main__':
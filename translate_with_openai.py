@@ -3,34 +3,84 @@
 Translate Swedish supplement CSV to English using OpenAI API.
 Reads API key from .env.local, .env file, or command-line argument.
 Usage: python3 translate_with_openai.py [--api-key YOUR_KEY]
+       python3 translate_with_openai.py --stream [--input FILE|-] [--output FILE|-]
+       python3 translate_with_openai.py --incremental [--input FILE] [--output FILE] [--delta FILE]
 """
 
-import csv
+import asyncio
 import os
 import sys
 import time
 import argparse
-from dotenv import load_dotenv
-from openai import OpenAI
-
-# Parse command-line arguments
-parser = argparse.ArgumentParser(description='Translate Swedish supplement CSV to English using OpenAI API')
-parser.add_argument('--api-key', type=str, help='OpenAI API key (optional if set in .env file)')
-args = parser.parse_args()
-
-# Load environment variables from .env.local or .env
-load_dotenv('.env.local')
-load_dotenv('.env')
-
-# Initialize OpenAI client - check multiple possible variable names
-api_key = (
-    args.api_key or  # Command-line argument
-    os.getenv('OPENAI_API_KEY') or 
-    os.getenv('OPENAI_KEY') or 
-    os.getenv('OAI_API_KEY')
+
+from translation.pipeline import (
+    COLUMN_INDEX, RISK_MAP, STATUS_MAP, ExactMapStage, GlossaryStage, LLMStage, Pipeline,
+    is_data_row, is_header, read_rows, row_identities, write_rows,
+)
+from translation.alignment import TranslatedFile, align
+from translation.batching import (
+    ITEM_OVERHEAD_TOKENS, BatchStats, batch_payload, estimate_tokens, pack, translate_batch,
+    translate_batch_async,
 )
+from translation.client import Clients
+from translation.delta import snapshot_path, translate_delta, write_snapshot
+from translation.dispatch import dispatch
+from translation.journal import Journal, journal_path
+from translation.langid import DEFAULT_THRESHOLD, NgramDetector
+from translation.manifest import Manifest, manifest_path
+from translation.memory import DEFAULT_PATH as DEFAULT_MEMORY_PATH, TranslationMemory
+from translation.metrics import Metrics
+from translation.profiling import Profiler
+from translation import ratelimit
+from translation.ratelimit import DEFAULT_RPM, DEFAULT_TPM, RateLimiter
+from translation.resume import ResumeIndex, content_hash, index_path
+from translation.streaming import STDIO, stream_translate
+from translation.swedish import SWEDISH_INDICATORS, find_swedish_terms, has_swedish_text
 
-if not api_key:
+def build_parser():
+    """Command-line arguments; parsed in main() so the module imports cleanly."""
+    parser = argparse.ArgumentParser(description='Translate Swedish supplement CSV to English using OpenAI API')
+    parser.add_argument('--api-key', type=str, help='OpenAI API key (optional if set in .env file)')
+    parser.add_argument('--rules-first', action='store_true',
+                        help='Run the translate_csv glossary before the API; cells it fully translates are not sent')
+    parser.add_argument('--cache', type=str, default=DEFAULT_MEMORY_PATH,
+                        help=f'Translation memory database (default: {DEFAULT_MEMORY_PATH})')
+    parser.add_argument('--no-cache', action='store_true', help='Do not read or write the translation memory')
+    parser.add_argument('--cache-max-entries', type=int, help='Keep at most this many cached translations')
+    parser.add_argument('--cache-max-age-days', type=float, help='Drop cached translations older than this')
+    parser.add_argument('--concurrency', type=int, default=1,
+                        help='Maximum API requests in flight at once (default: 1, sequential)')
+    parser.add_argument('--batch-tokens', type=int, default=0,
+                        help='Pack cells into requests of about this many prompt tokens (default: 0, one cell per request)')
+    parser.add_argument('--batch-max-cells', type=int, default=40, help='Maximum cells per batched request')
+    parser.add_argument('--rpm', type=int, default=DEFAULT_RPM,
+                        help=f'Starting requests-per-minute limit, replaced by the API rate-limit headers (default: {DEFAULT_RPM})')
+    parser.add_argument('--tpm', type=int, default=DEFAULT_TPM,
+                        help=f'Starting tokens-per-minute limit, replaced by the API rate-limit headers (default: {DEFAULT_TPM})')
+    parser.add_argument('--detector', choices=['ngram', 'indicators'], default='ngram',
+                        help='ngram: only send cells an n-gram model trained on the source/translated CSVs '
+                             'judges Swedish; indicators: any Swedish indicator hit (default: ngram)')
+    parser.add_argument('--detector-threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help=f'Minimum Swedish confidence (0-1) for the n-gram detector (default: {DEFAULT_THRESHOLD})')
+    parser.add_argument('--metrics-json', type=str, help='Write the run metrics as JSON to this file')
+    parser.add_argument('--metrics-prom', type=str,
+                        help='Write the run metrics in Prometheus text format to this file (textfile collector)')
+    parser.add_argument('--profile', metavar='DIR',
+                        help='Profile the run and write pstats, tracemalloc snapshots and a report to DIR')
+    parser.add_argument('--stream', action='store_true',
+                        help='Translate --input into --output one row at a time, in constant memory '
+                             '(no deduplication, batching or journal; the translation memory still applies)')
+    parser.add_argument('--incremental', action='store_true',
+                        help='Translate only the rows of --input added or changed since the last --incremental run')
+    parser.add_argument('--delta', metavar='FILE',
+                        help='With --incremental, write the upserts and deletes for load_supplements.py to FILE')
+    parser.add_argument('--input', default='Börja utforska - Börja utforska.csv',
+                        help="Source CSV for --stream ('-' for stdin) and --incremental")
+    parser.add_argument('--output', default='supplements-english.csv',
+                        help="Translated CSV for --stream ('-' for stdout) and --incremental")
+    return parser
+
+def missing_api_key():
     print("Error: OpenAI API key not found!")
     print("\nPlease provide the API key in one of these ways:")
     print("1. Command-line argument:")
@@ -42,728 +92,658 @@ if not api_key:
     print("   OPENAI_API_KEY=your_api_key_here")
     sys.exit(1)
 
-client = OpenAI(api_key=api_key)
+# The key is looked up, and the OpenAI SDK imported, on the first API request
+clients = Clients(missing_api_key)
+limiter = RateLimiter()
 
-# Simple mappings for status and risk
-STATUS_MAP = {'Grön': 'Green', 'Blå': 'Blue', 'Röd': 'Red'}
-RISK_MAP = {'Låg': 'Low', 'Medium': 'Medium', 'Hög': 'High'}
+# Every API request and retry made through the limiter is recorded here
+metrics = Metrics('translate_with_openai')
+limiter.metrics = metrics
 
-def has_swedish_text(text):
-    """Check if text contains Swedish words or characters."""
-    if not text or text == '-' or text.strip() == '':
-        return False
-    
-    text_lower = text.lower()
-    
-    # Check for Swedish characters (å, ä, ö)
-    swedish_chars = ['å', 'ä', 'ö', 'Å', 'Ä', 'Ö']
-    if any(char in text for char in swedish_chars):
-        return True
-    
-    # Comprehensive list of common Swedish words
-    swedish_indicators = [
-        # Common words
-        'är', 'och', 'för', 'med', 'på', 'av', 'till', 'det', 'som', 'kan',
-        'inte', 'eller', 'vid', 'bättre', 'högre', 'lägre', 'från', 'till',
-        'den', 'en', 'ett', 'de', 'om', 'i', 'att', 'har', 'var', 'så',
-        # Medical/supplement terms (additional)
-        'allergi', 'synaptisk', 'plasticitet', 'senolytisk', 'ionofor',
-        # Medical/supplement terms
-        'prekursor', 'mimetikum', 'neuroplasticitet', 'infektionsskydd',
-        'fettlöslig', 'mitokondriell', 'energi', 'mitokondrier', 'vakenhet',
-        'belastar', 'levern', 'leverenzym', 'immunstöd', 'hämmar', 'kväveoxidsyntas',
-        'neuropati', 'humör', 'metabolit', 'magsyra', 'magsår', 'halsbränna',
-        'matsmältning', 'lugnande', 'renad', 'laxerande', 'kolinkälla', 'kraft',
-        'effektivt', 'luftvägsinfektion', 'kreativitet', 'ångest', 'fokus',
-        'racetam', 'gaser', 'traditionell', 'användning', 'sömn', 'hämmare',
-        'kamomill', 'persilja', 'inflammation', 'muskeltillväxt', 'anabol',
-        'signal', 'kronisk', 'bättre', 'tveksam', 'biotillgänglighet', 'stress',
-        'sömnbärande', 'cykla', 'veckor', 'mat', 'kvällen', 'påverka',
-        'sköldkörtel', 'sederande', 'solskydd', 'lyster', 'karotenoid',
-        'hud', 'ögon', 'naturlig', 'mikroalger', 'immunstärkande', 'långtids',
-        'ökar', 'vita', 'blodkroppar', 'komplex', 'nerver', 'kofaktorer',
-        'signalsubstanser', 'homocystein', 'metylering', 'hjärnatrofi', 'skydd',
-        'inlärning', 'veckor', 'full', 'effekt', 'minne', 'fett', 'fettlösliga',
-        'magbesvär', 'trötthet', 'blodsocker', 'insulin', 'mimic', 'korosolsyra',
-        'hypoglykemi', 'minskad', 'muskelsparande', 'tillväxt', 'diabetisk',
-        'neuropati', 'ages', 'upptag', 'tiamin', 'aktivering', 'dåligt',
-        'tarmflora', 'interagerar', 'enzym', 'snällare', 'magen', 'buffrar',
-        'mjölksyra', 'stickningar', 'ofarliga', 'kräver', 'laddning', 'veckor',
-        'parestesi', 'metylgivare', 'kraftutveckling', 'stödjer', 'produktion',
-        'endast', 'stomach', 'ulcers', 'wounds', 'bränner', 'behov', 'provitamin',
-        'hudskydd', 'omvandlas', 'behov', 'säkrare', 'prostata', 'kolesterol',
-        'växtsterol', 'vitalitet', 'immune', 'nutrient', 'dense', 'allergy',
-        'mdr', 'stomach', 'psychobiotic', 'svartpeppar', 'upptag', 'substances',
-        'glukuronidering', 'affects', 'medication', 'hår', 'naglar', 'interferes',
-        'lab', 'tests', 'thyroid', 'heart', 'växt', 'hair', 'growth', 'b-vitamin',
-        'test', 'interference', 'bitter', 'melon', 'charantin', 'plant', 'birch',
-        'leaf', 'urinary', 'tract', 'detox', 'diuretic', 'blueberry', 'extract',
-        'memory', 'antocyaniner', 'fenugreek', 'libido', 'testofen', 'extract',
-        'after', 'meals', 'fiber', 'saponins', 'boron', 'citrate', 'glycinate',
-        'free', 'testosterone', 'bones', 'lowers', 'shbg', 'bone', 'health',
-        'hormones', 'joints', 'akba', 'lox', 'inhibitor', 'ledsmärta', 'choose',
-        'content', 'broccoli', 'sprout', 'sulforaphane', 'hormone', 'balance',
-        'potent', 'pineapple', 'protein', 'swelling', 'tom', 'stomach', 'injury',
-        'stinging', 'nettle', 'allergy', 'binds', 'shbg', 'root', 'leaves',
-        'immune', 'defense', 'antioxidant', 'liposomal', 'higher', 'uptake',
-        'stays', 'longer', 'expensive', 'effective', 'cayenne', 'thermogenesis',
-        'irritate', 'catuaba', 'bark', 'dopamine', 'brazilian', 'cbd', 'oil',
-        'fullspektrum', 'smärta', 'endocannabinoid', 'system', 'price', 'celastrus',
-        'paniculatus', 'intellect', 'tree', 'ayurvedic', 'nootropic', 'chaga',
-        'mushroom', 'birch', 'chlorella', 'broken', 'cell', 'wall', 'chlorophyll',
-        'måste', 'ha', 'chrysin', 'aromatase', 'inhibitor', 'theoretical', 'poor',
-        'oral', 'uptake', 'cissus', 'quadrangularis', 'bone', 'healing', 'ketosterones',
-        'citikolin', 'citicoline', 'acetylcholine', 'dopamin', 'focus', 'energy',
-        'ökar', 'dopaminereceptorer', 'phospholipids', 'mycket', 'bra', 'bioavailablehet',
-        'lemon', 'balm', 'melissa', 'officinalis', 'calming', 'gaba', 'transaminase',
-        'inhibitor', 'cognition', 'anxiety', 'gaba-t', 'citrulline', 'malate',
-        'pre-workout', 'pump', 'blood', 'flow', 'raising', 'conjugated', 'linoleic',
-        'acid', 'fat', 'loss', 'moderate', 'effect', 'safflower', 'questionable',
-        'humans', 'wrinkle', 'reduction', 'ubiquinone', 'ubiquinol', 'cordyceps',
-        'sinensis', 'oxygen', 'uptake', 'atp', 'mycelium', 'most', 'common',
-        'phytosome', 'piperine', 'required', 'regular', 'has', 'anti-inflammatory',
-        'longvida', 'brain', 'cognition', 'crosses', 'bbb', 'free', 'meriva',
-        'joint', 'clinically', 'studied', 'form', 'd-aspartic', 'acid', 'daa',
-        'temporary', 'boost', 'lh', 'stimulation', 'diminishes', 'short', 'term',
-        'pulse', 'd-chiro-inositol', 'pcos', 'ratio', 'myo', 'secondary', 'messenger',
-        'd-mannose', 'urinary', 'tract', 'infection', 'e.', 'coli', 'binds', 'bacteria',
-        'bladder', 'binder', 'd-serine', 'nmda-receptor', 'schizofreni-studier',
-        'hormonell', 'effekt', 't-cellsaktivering', 'kritisk', 'säsongsdepression',
-        'sad', 'serotoninsyntes', 'receptorer', 'insulinsekretion', 'betacell-funktion',
-        'damiana', 'båda', 'könen', 'avslappnande', 'dgl', 'deglycyrrhizinated',
-        'licorice', 'utan', 'glycyrrhizin', 'höjer', 'ej', 'blodtryck', 'dhea',
-        'hormonprekursor', 'endast', 'konstaterad', 'brist', 'ålder', 'hormonella',
-        'biverkningar', 'äldre', 't', 'östrogen', 'hormonell', 'obalans', 'dim',
-        'diindolylmethane', 'östrogenmetabolism', 'från', 'kålväxter', 'ändra',
-        'balance', 'bra', 'metaboliter', 'akne', 'pms', 'kål', 'devil', 'claw',
-        'ryggvärk', 'artros', 'harpagosid', 'dong', 'quai', 'kvinnlig', 'hälsa',
-        'ginseng', 'grape', 'seed', 'extract', 'blodtryck', 'cirkulation', 'rikt',
-        'opc', 'proantocyanidiner', 'ödem', 'standardiserat', 'kollagenskydd', 'kärl',
-        'dynamine', 'methylliberine', 'snabb', 'snabbare', 'koffein', 'teakrin',
-        'vitamin', 'e', 'immunfunktion', 'äldre', 't-cellsfunktion', 'gamma-tocopherol',
-        'antiinflammatorisk', 'form', 'kompletterar', 'alfa-tokoferol', 'eaa',
-        'essential', 'amino', 'acids', 'stimulerar', 'proteinsyntes', 'mtor', 'kring',
-        'träning', 'ecdysterone', 'spinach', 'cyanotis', 'muskelbyggande', 'anabol',
-        'binder', 'er-beta', 'receptorn', 'echinacea', 'förkylning', 'fagocytos',
-        'autoimmune', 'risk', 'electrolytes', 'na', 'k', 'mg', 'hydrering', 'svettning',
-        'balans', 'viktig', 'enoki', 'dao', 'diamine', 'oxidase', 'histaminintolerans',
-        'bryter', 'ner', 'histamin', 'digestive', 'enzymes', 'digestionsstöd', 'take',
-        'varierar', 'stort', 'gluten', 'digesting', 'dpp-iv', 'vid', 'glutenkänslighet',
-        'celiaki', 'prolin-rika', 'proteiner', 'lactase', 'enzyme', 'laktosintolerans',
-        'intag', 'mjölk', 'epicatechin', 'myostatinhämmare', 'muskler', 'kakao', 'te',
-        'exogenous', 'ketones', 'bhb', 'salts', 'omedelbar', 'ketos', 'hjärnenergi',
-        'innehåller', 'mycket', 'salt', 'magbesvär', 'fasoracetam', 'adhd-forskning',
-        'uppreglerar', 'fenugreek', 'bockhornsklöver', 'amning', 'blockera', 'dht',
-        'dl-phenylalanine', 'dlpa', 'pain', 'endorfiner', 'blandning', 'd-', 'l-form',
-        'pea', 'phenylethylamine', 'kärleksmolekylen', 'bryts', 'ner', 'snabbt', 'mao-b',
-        'kortvarig', 'phenylpiracetam', 'fysisk', 'mental', 'kyla', 'stimulerande',
-        'dopingklassad', 'tävling', 'tolerans', 'snabbt', 'fiber', 'glucomannan',
-        'mättnad', 'gelbildande', 'fisetin', 'hög', 'dos', 'korta', 'intervall',
-        'senolytiskt', 'take', 'fat', 'biotillgänglighet', 'fish', 'oil', 'omega-3',
-        'ledstelhet', 'antiinflammatorisk', 'elderberry', 'sambucus', 'förkylning',
-        'influensa', 'antiviral', 'effekt', 'fo-ti', 'he', 'shou', 'wu', 'grått',
-        'hår', 'vitalitet', 'leverpåverkan', 'försiktig', 'levertoxicitet', 'folic',
-        'acid', 'graviditet', 'celldelning', 'syntetisk', 'maskera', 'b12-brist',
-        'methylfolate', 'foster', 'aktivt', 'folat', 'forskolin', 'coleus', 'forskohlii',
-        'fettförbränning', 'camp', 'standardiserad', 'mage', 'lös', 'phosphatidic',
-        'muskelstyrka', 'direkt', 'signal', 'phosphatidylserine', 'sänker', 'kortisol',
-        'stödjer', 'soja', 'solroslecitin', 'ursprung', 'driven', 'kvällen', 'membranfluiditet',
-        'fucoxanthin', 'från', 'tång', 'tid', 'fennel', 'seed', 'kramp-dämpande',
-        'gaba', 'poor', 'over', 'bbb', 'fysiologiskt', 'stickningar', 'kan', 'förekomma',
-        'pharmagaba', 'fermenterad', 'gh', 'theoreticalt', 'galantamine', 'drömmar',
-        'lucid', 'dreaming', 'alzheimer-medicin', 'även', 'tillskott', 'illamående',
-        'garcinia', 'cambogia', 'hca', 'aptit', 'fettsyntes', 'debatterad', 'ginkgo',
-        'biloba', 'cirkulation', 'hjärna', 'äldre', 'blodflöde', 'minne', 'egb-761',
-        'sexuellt', 'mikrocirkulation', 'blödning', 'panax', 'ginseng', 'erektion',
-        'kväveoxid-mediator', 'amerikansk', 'kylande', 'tcm', 'standardisera', 'ginsenosider',
-        'höja', 'sibirisk', 'eleuthero', 'siberian', 'uthållighet', 'mildare', 'gla',
-        'nattljusolja', 'evening', 'primrose', 'skinproblem', 'eksem', 'omega-6',
-        'glukomannan', 'konjac', 'mättnadskänsla', 'expanderar', 'drick', 'vatten',
-        'kvävningsrisk', 'glukosamin', 'sulfate', 'sulfat', 'hcl', 'broskhälsa',
-        'evidens', 'skaldjursallergy', 'glutathione', 'reducerat', 'reduced', 'dåligt',
-        'oralt', 'setria', 'bättre', 'skinuppljusning', 'liposomalt', 'master',
-        'defenseets', 'bränsle', 'glycerol', 'glycerpump', 'hyperhydrering', 'binder',
-        'vätska', 'muskeln', 'klumpar', 'sig', 'pulver', 'glycine', 'sleepkvalitet',
-        'kollagenbyggsten', 'söt', 'smak', 'tas', 'sänggående', 'kroppstemp', 'goji',
-        'berry', 'lycium', 'zeaxantin', 'gotu', 'kola', 'centella', 'asiatica',
-        'cirkulation', 'kollagensyntes', 'nerver', 'neuroprotektiv', 'grains', 'paradise',
-        'aframomum', 'aktiverar', 'brunt', 'batt', 'krydda', 'ingefärsfamiljen',
-        'pomegranate', 'extract', 'ellagsyra', 'omvandlas', 'urolithin', 'grapefruit',
-        'seed', 'extract', 'kontroversiell', 'konserveringsmedel', 'cyp3a4-hämmare',
-        'gröna', 'kaffebönor', 'green', 'coffee', 'bean', 'klorogensyra', 'lågt',
-        'vikt', 'glukosupptag', 'grönt', 'te', 'egcg', 'påverka', 'extrem', 'dos',
-        'sällsynt', 'skydd', 'polyfenoler', 'guaraná', 'guarana', 'naturligt', 'långsamt',
-        'frisläpps', 'långsammare', 'syntetiskt', 'gullris', 'goldenrod', 'njurar',
-        'urinvägar', 'diuretic', 'gurkmeja', 'hel', 'turmeric', 'root', 'powder',
-        'mild', 'svårupptagen', 'svartpeppar', 'gymnema', 'sylvestre', 'sockerblockerare',
-        'regenerera', 'betaceller', 'sockerbegär', 'sugar', 'destroyer', 'blockerar',
-        'smak', 'hawthorn', 'hjärtsvikt', 'kontraktilitet', 'digoxin-interaktion',
-        'hallonblad', 'raspberry', 'leaf', 'livmoderhälsa', 'traditionell', 'gravidte',
-        'hallonketoner', 'ketones', 'strukturellt', 'lik', 'synefrin', 'capsaicin',
-        'hemp', 'protein', 'veganskt', 'fiberrikt', 'lägre', 'proteinhalt', 'havtornsolja',
-        'sea', 'buckthorn', 'torra', 'slemhinnor', 'underliv', 'hesperidin', 'cirkulation',
-        'vener', 'ofta', 'citrusbioflavonoider', 'hibiskus', 'hibiscus', 'tea', 'fungerar',
-        'mild', 'ace-hämmare', 'koppar', 'higenamine', 'beta-2', 'agonist', 'luftvägar',
-        'wada-förbjuden', 'hjärtklappning', 'hmb', 'beta-hydroxy', 'beta-methylbutyrate',
-        'antikatabolt', 'diet', 'kalciumsalt', 'fri', 'syra', 'holy', 'basil', 'tulsi',
-        'adaptogen', 'hordenin', 'mao-b', 'hämmare', 'förlänger', 'stimulanter', 'horny',
-        'goat', 'weed', 'icariin', 'pde5-hämmare', 'svag', 'standardisera', 'hops',
-        'extract', 'sedativ', 'valeriana', 'huperzine', 'a', 'acetylkolinesterashämmare',
-        'cykla', 'undvika', 'kolinerga', 'biverkningar', 'ache-hämmare', 'hyaluronic',
-        'acid', 'skin', 'fukt', 'binder', 'vatten', 'ledvätska', 'oral', 'fungerar',
-        'fuktighet', 'molekylvikt', 'svårabsorberad', 'indole-3-carbinol', 'i3c',
-        'prekursor', 'mindre', 'stabil', 'ginger', 'root', 'illamående', 'prokinetisk',
-        'tömmer', 'liknar', 'nsaid', 'cox-hämmare', 'gingeroler', 'aktiva', 'ämnet',
-        'blodförtunnande', 'inositol', 'panikanxiety', 'ocd', 'höga', 'doser', 'krävs',
-        'insulinkänslighet', 'cellsignalering', 'ip6', 'hexaphosphate', 'cellhälsa',
-        'kelaterar', 'mineraler', 'pulverform', 'enklast', 'lös', 'inulin', 'fos',
-        'prebiotika', 'kan', 'ge', 'fodmap', 'iodine', 'sköldkörtel', 'hjärna',
-        'kaliumjodid', 'kelp', 'autoimmune', 'tyreoidit', 'balans', 'johannesört',
-        'st.', "john's", 'wort', 'mild', 'många', 'läkemedelsinteraktioner', 'p-piller',
-        'antidepressiva', 'ssri-liknande', 'läkemedelsinteraktion', 'jordbaserad',
-        'soil', 'based', 'organisms', 'sbo', 'tålig', 'sporform', 'bacillus-stammar',
-        'subtilis', 'iron', 'menstruerande', 'kvinnor', 'ersätter', 'förlust', 'bisglycinat',
-        'blodvärde', 'skonsam', 'endast', 'brist', 'oxidativ', 'stress', 'överskott',
-        'heme', 'animaliskt', 'färre', 'magbiverkningar', 'överdosrisk', 'sulfat',
-        'anemi', 'hård', 'toxiskt', 'barn', 'jättenattljusolja', 'pms', 'bröstömhet',
-        'gamma-linolensyra', 'calcium', 'benskörhet', 'kombinera', 'd3', 'k2', 'kärlrisk',
-        'citrate', 'oberoende', 'magsyra', 'risk', 'för', 'kärlförkalkning', 'karbonat',
-        'take', 'kräver', 'syra', 'förstoppning', 'alfa-ketoglutarate', 'ca-akg',
-        'förlänger', 'healthspan', 'sänker', 'biologisk', 'ålder', 'fördröjd', 'frisättning',
-        'sustained', 'release', 'd-glucarate', 'toxiner', 'hämmar', 'beta-glukuronidas',
-        'kan', 'öka', 'utsöndring', 'medicin', 'glukuronidering', 'potassium', 'muskelfunktion',
-        'dos', 'tillskott', 'pga', 'säkerhetsrisk', 'hjärtrisk', 'njursvikt', 'via', 'kost',
-        'njurproblem', 'chamomile', 'apigenin', 'cinnamon', 'ceylon', 'välj', 'lågt',
-        'kumarin', 'caprylic', 'acid', 'candida', 'tarmhälsa', 'fettsyra', 'kokos',
-        'carnitine', 'hjärthälsa', 'angina', 'energiproduktion', 'tmao', 'mitokondriell',
-        'transport', 'casein', 'långsamt', 'natt', 'antikatabolt', 'mjölkallergy', 'catalase',
-        'h2o2-nedbrytning', 'tveksamt', 'kava', 'kavalaktoner', 'leverrisk', 'missbruk',
-        'alkohol', 'keratin', 'solubiliserat', 'solubilized', 'hairstruktur', 'cynatine',
-        'hns', 'varumärke', 'kisel', 'bambu', 'bamboo', 'horsetail', 'nagel-styrka',
-        'rikare', 'åkerfräken', 'orto-kisel', 'klorofyll', 'kroppslukt', 'gröna', 'växter',
-        'alger', 'caffeine', 'anhydrous', 'prestationshöjande', 'snabb', 'absorption',
-        'toleransutveckling', 'sleepstörning', 'adenosin-antagonist', 'theanin', 'jitters',
-        'klassisk', 'stack', 'kolanöt', 'kola', 'nut', 'koffeinkälla', 'traditionell',
-        'stimulant', 'choline', 'bitartrate', 'cellmembran', 'kan', 'öka', 'hydrolyserat',
-        'hydrolyzed', 'peptides', 'tas', 'gärna', 'c-vitamin', 'types', 'bovint', 'marint',
-        'uc-ii', 'autoimmune', 'oral', 'tolerans', 'liten', 'colostrum', 'antikroppar',
-        'ig', 'råmjölk', 'mjölkprotein', 'chondroitin', 'synergi', 'synergistisk',
-        'blodförtunnande', 'copper', 'pigment', 'balansera', 'alltid', 'toxiskt', 'i',
-        'överskott', 'barley', 'grass', 'näring', 'antioxidanter', 'liknar', 'vetegräs',
-        'glutenrisk', 'kre-alkalyn', 'buffered', 'ph-stabilt', 'bevisat', 'monohydrat',
-        'kognitiv', 'fatigue', 'hcl', 'samma', 'effekt', 'mono', 'mindre', 'vattenretention',
-        'theoreticalt', 'sur', 'smak', 'underhållsdos', 'dagligen', 'laddning', 'valfri',
-        'bäst', 'kolhydrater', 'drick', 'extra', 'krom', 'chromium', 'sötsug', 'pikolinat',
-        'picolinate', 'stabilt', 'upptagbart', 'kronärtskocka', 'artichoke', 'galla',
-        'minskar', 'uppblåsthet', 'gallsten', 'cynarin', 'gallflöde', 'kurkumin', 'curcumin',
-        'hjärninflammation', 'plack', 'l-arginine', 'kväveoxid', 'sämre', 'citrulline',
-        'stor', 'del', 'bryts', 'ner', 'herpesutbrott', 'l-citrullin', 'no-boost',
-        'l-cysteine', 'keratinbyggsten', 'svavelaminosyra', 'l-fenylalanin', 'l-phenylalanine',
-        'noradrenalin-prekursor', 'aptitdämpning', 'ej', 'pku', 'l-glutamin', 'l-glutamine',
-        'tarmslemhinna', 'primärt', 'bränsle', 'enterocyter', 'tarmvägg', 'muskelåterhämtning',
-        'tarmceller', 'l-karnitin', 'l-tartrat', 'l-carnitine', 'androgenreceptorer',
-        'muskelvävnad', 'l-lysine', 'l-lysine', 'herpes', 'munsår', 'antagonist',
-        'l-metionin', 'l-methionine', 'essentiell', 'aminosyra', 'l-metylfolat',
-        'l-methylfolate', '5-mthf', 'mthfr-mutation', 'aktiv', 'form', 'kräver', 'omvandling',
-        'l-ornitin', 'l-ornithine', 'ammoniak-detox', 'synergi', 'l-thp', 'l-tetrahydropalmatine',
-        'smärta', 'dopamine-antagonist', 'corydalis', 'sedering', 'l-tryptofan', 'l-tryptophan',
-        'melatonin-prekursor', 'konkurrerar', 'bcaa', 'akut', 'kyla', 'sömnbrist', 'tom',
-        'sköldkörtelinteraktion', 'lactobacillus', 'rhamnosus', 'gg', 'immun', 'allergy',
-        'välstuderad', 'stam', 'lakritsrot', 'deglycyrrhizinerad', 'höjer', 'tryck',
-        'laktoferrin', 'lactoferrin', 'järnbindande', 'lavendelolja', 'lavender', 'oral',
-        'silexan', 'studerat', 'rapar', 'lavendel', 'laxogenin', '5-alpha-hydroxy-laxogenin',
-        'växtanabol', 'kortisolkontroll', 'smilax', 'sieboldii', 'leucin', 'l-leucine',
-        'mtor-trigger', 'viktigaste', 'anabolism', 'lingonextrakt', 'lingonberry', 'resveratrol',
-        'procyanidiner', "lion's", 'mane', 'ngf', 'nervtillväxt', 'fruktkropp', 'varmvattens-',
-        'alkoholextrakt', 'litiumorotat', 'lithium', 'orotate', 'humörsvängningar', 'mikrodos',
-        'läkemedelsdos', 'lutein', 'skinelasticitet', 'blått', 'ljus-skydd', 'zeaxanthin',
-        'ögonhälsa', 'gula', 'fläcken', 'carotenoider', 'skyddar', 'mot', 'luteolin',
-        'neuroprotektion', 'hämmar', 'mikroglia-aktivering', 'lycopene', 'tomater', 'tomat',
-        'tomatextrakt', 'motverkar', 'balansera', 'läkemalva', 'marshmallow', 'slemhinnor',
-        'hosta', 'liknar', 'rödalmsbark', 'irriterad', 'tarm', 'hals', 'slemsubstans',
-        'maca', 'spermieproduktion', 'gelatiniserad', 'gul', 'allmän', 'hälsa', 'standardtypen',
-        'röd', 'boneshälsa', 'påverkar', 'direkt', 'svart', 'magnesium', 'spänning',
-        'lugnar', 'nervsystemet', 'arytmi', 'relaxing', 'vessels', 'insulinresistens',
-        'kofaktor', 'glykolys', 'l-threonate', 'refers', 'total', 'compound', 'approximately',
-        'elemental', 'unique', 'ability', 'cross', 'blood-brain', 'barrier', 'glycinate',
-        'preferably', 'gentle', 'relaxation', 'kombo', 'malate', 'fibromyalgia', 'taurate',
-        'calming', 'taurine', 'increases', 'intracellular', 'magnoliabark', 'magnolia', 'bark',
-        'honokiol', 'magnolol', 'aktivit', 'ämne', 'maitake', 'd-fraction', 'immunaktivering',
-        'fraktion', 'manganese', 'sod', 'neurotoxiskt', 'mycket', 'höga', 'doser', 'manuka',
-        'honey', 'mgo', 'lokal', 'sår', 'socker', 'maskrosblad', 'dandelion', 'vätskedrivande',
-        'kaliumsparande', 'bladen', 'njurarna', 'maskrosrot', 'diuretika', 'mct-olja', 'mct',
-        'oil', 'c8', 'c10', 'ketone', 'production', 'kaprylsyra', 'mest', 'potent', 'start',
-        'discomfort', 'alzheimer-stöd', 'thermogenesis', 'ketoner', 'energiförbrukning',
-        'caprylic', 'börja', 'lågt', 'magras', 'pulver', 'gentler', 'än', 'olja', 'melatonin',
-        'insomning', 'dygnsrytm', 'ofta', 'effektivare', 'kan', 'ge', 'mardrömmar', 'hormon',
-        'drömmar', 'mjölkdistel', 'milk', 'thistle', 'silymarin', 'leverhälsa', 'komplex',
-        'hepatocyter', 'cyp-interaktioner', 'mjölon', 'uva', 'ursi', 'akut', 'arbutin',
-        'bildar', 'hydrokinon', 'korttidsbruk', 'molybdenum', 'sulfiter', 'urinsyra',
-        'essentiellt', 'spårämne', 'monolaurin', 'höljeförsedda', 'kokosolja', 'laurinsyra',
-        'msm', 'methylsulfonylmethane', 'svaveldonator', 'ledhälsa', 'antioxidat', 'tas',
-        'upp', 'väl', 'skönhetsmineral', 'mucuna', 'pruriens', 'l-dopa', 'motivations-boost',
-        'nedreglering', 'muira', 'puama', 'potency', 'wood', 'munkpeppar', 'vitex', 'chasteberry',
-        'progesteron', 'prolaktin', 'myo-inositol', 'släkting', 'n-acetyl', 'l-tyrosin',
-        'nalt', 'mer', 'löslig', 'sämre', 'omvandling', 'tyr', 'water-soluble', 'n-metyltyramin',
-        'n-methyltyramine', 'gastrin', 'n-acetyl', 'cysteine', 'slem', 'lungor', 'tvångssyndrom',
-        'beroende', 'glutamat-modulering', 'n-acetylcystein', 'slemrösande', 'svaveldoft',
-        'biotillgänglig', 'natriumbikarbonat', 'sodium', 'bicarbonate', 'mjölksyrabuffert',
-        'kroppsvikt', 'magsmärtor', 'magkramp', 'diarré', 'nattokinase', 'blodcirkulation',
-        'fibrinolytisk', 'niacin', 'nicotinic', 'acid', 'hdl', 'ldl-kvot', 'flush-varianten',
-        'niacinamide', 'nicotinamide', 'ingen', 'akne', 'skinbarrier', 'rodnad', 'nmn',
-        'nicotinamide', 'mononucleotide', 'morgonen', 'stöd', 'sublingualt', 'liposomalt',
-        'föredras', 'påverkar', 'methylation', 'åldersrelaterad', 'noopept', 'bdnf', 'ngf',
-        'mycket', 'potent', 'mg-dos', 'nässla', 'blad', 'nettle', 'histaminhämmande',
-        'rot', 'bph', 'shbg-bindning', 'odenaturerat', 'undenatured', 'immunmodulering',
-        'ledhälsa', 'verkar', 'tarmen', "peyer's", 'patches', 'oktopamin', 'octopamine',
-        'norepinefrin', 'svagare', 'oleamid', 'oleamide', 'sleepinducering', 'ackumuleras',
-        'sömnbrist', 'olivbladsextrakt', 'olive', 'leaf', 'extract', 'oleuropein', 'herxheimer-reaktion',
-        'epa', 'dha', 'total', 'mängd', 'fatrik', 'måltid', 'skin', 'fukt', 'viktigast',
-        'mood', 'oreganoolja', 'oregano', 'oil', 'starkt', 'irritera', 'slemhinnor', 'slår',
-        'ut', 'goda', 'bakterier', 'stark', 'carvacrol', 'ornitin', 'ammoniak', 'ostronskivling',
-        'oyster', 'mushroom', 'lovastatin', 'statin-liknande', 'ämnen', 'oxgalla', 'ox', 'bile',
-        'fettsmältning', 'utan', 'gallblåsa', 'ersätter', 'galla', 'oxiracetam', 'logik',
-        'stimulans', 'p-5-p', 'pyridoxal-5-phosphate', 'pyridoxal', 'kofaktor', 'neurotransmittorer',
-        'leveromvandling', 'höga', 'neuropati', 'paba', 'b-vitaminkofaktor', 'dela', 'folsyra-molekylen',
-        'sulfamedicin-interaktion', 'förr', 'tiden', 'folat', 'pantetin', 'pantethine', 'aktiv',
-        'b5', 'kolesterol', 'pantotensyra', 'pantothenic', 'akne', 'fettmetabolism', 'papaya',
-        'enzyme', 'papain', 'protein-nedbrytning', 'tuggtabletter', 'vanliga', 'passionsblomma',
-        'passion', 'flower', 'dåsighet', 'pepparmynta', 'peppermint', 'ibs', 'kramp', 'tarm',
-        'enterokapslar', 'bäst', 'refluxrisk', 'kapslad', 'halsbränna', 'phenylalanine',
-        'pkU-varning', 'phgg', 'guar', 'gum', 'väl', 'tolererad', 'gasbildande', 'polygala',
-        'tenuifolia', 'neuroplasticitet', 'unik', 'verkningsmekanism', 'poria', 'cocos',
-        'njurhälsa', 'kinesisk', 'medicin', 'pqq', 'pyrroloquinoline', 'quinone', 'mitokondriell',
-        'biogenes', 'synergi', 'q10', 'skinens', 'mitokondrier', 'nytt', 'inom', 'skinvård',
-        'hjärna', 'hjärta', 'nybildning', 'pramiracetam', 'starkt', 'fettlöslig', 'emotionell',
-        'avtrubbning', 'prebiotika', 'galaktooligosackarider', 'snällare', 'mat', 'bakterier',
-        'pregnenolon', 'pregnenolone', 'master', 'hormone', 'neurosteroid', 'hormonpåverkan',
-        'probiotika', 'allmän', 'multi-strain', 'tarm-immune-axel', 'defenseet', 'probiotic',
-        'longum', 'stressstomach', 'acidophilus', 'allmän', 'maghälsa', 'laktos', 'vanligaste',
-        'reuteri', 'dsm', '17938', 'kolik', 'd-vitaminupptag', 'stam-specifik', 'rhamnosus',
-        'diarré', 'boulardii', 'saccharomyces', 'mot', 'antibiotika-diarré', 'jästsvamp',
-        'dör', 'antibiotika', 'immunesupprimerade', 'prolin', 'l-proline', 'kollagenstruktur',
-        'icke-essentiell', 'bee', 'propolis', 'bikupa-antibiotika', 'munhåla', 'psyllium',
-        'husk', 'sänker', 'cholesterol', 'mättnad', 'måste', 'mycket', 'vatten', 'kan',
-        'påverka', 'medicinupptag', 'pterostilben', 'pterostilbene', 'mer', 'potent', 'analog',
-        'bättre', 'oral', 'pumpakärnolja', 'pumpkin', 'seed', 'oil', 'hairavfall', 'naturlig',
-        'betasitosterol', 'pumpakärnor', 'blåsa', 'pycnogenol', 'pine', 'bark', 'patenterat',
-        'skinelasticitet', 'pigmentering', 'tallbarksextrakt', 'pygeum', 'africanum', 'afrikanskt',
-        'plommon', 'ofta', 'kombinerat', 'saw', 'palmetto', 'hjärtsvikt', 'statin-biverkning',
-        'till', 'hjärtat', 'ubiquinol', 'reducerade', 'aktiva', 'interagerar', 'waran',
-        'quercetin', 'zink-jonofor', 'senolytisk', 'fytosom', 'virusinträde', 'rauwolscine',
-        'alpha-yohimbine', 'liknar', 'yohimbin', 'stereoisomer', 'stark', 'reishi', 'lugn',
-        'mushroom', 'immortality', 'immunmodulerande', 'beta-glukaner', 'resistent', 'stärkelse',
-        'resistant', 'starch', 'butyrat-produktion', 'tarmflora', 'potatismjöl', 'grön',
-        'banan', 'resveratrol', 'anti-aging', 'sirtuin-aktivering', 'sirtuiner', 'hjärnblood',
-        'metabol', 'hälsa', 'ampk', 'trans', 'kräver', 'fett', 'mikronisering', 'cyp450-interaktioner',
-        'rhodiola', 'rosea', 'standardiserad', 'rosavins', 'morgonen', 'stimulerande', 'risprotein',
-        'rice', 'kombinera', 'ärt', 'komplett', 'rutin', 'kärlhälsa', 'hemorrojder', 'glykosid',
-        'rödalm', 'slippery', 'elm', 'slemsubstans', 'mucilage', 'tas', 'rödalmsbark',
-        'tarmslemhinna', 'bildar', 'hindra', 'rödbetsjuice', 'beetroot', 'nitrat', 'vasodilatation',
-        'konc', 'beet', 'root', 'juice', 'concentrate', 'prestation', 'nitratladdning', 'dosering',
-        'ca', 'rödbetspulver', 'powder', 'nitrates', 'endurance', 'standardisera', 'nitratinnehåll',
-        'sänker', 'rödklöver', 'red', 'clover', 'klimakteriet', 'fytoöstrogen', 'rödris',
-        'red', 'yeast', 'rice', 'monacolin', 'q10-brist', 's.', 'boulardii', 'jäst-probiotika',
-        'antibiotika-stomach', 'sabroxy', 'oroxylum', 'indicum', 'dopamineåterupptag', 'saffran',
-        'saffron', 'affron', 'satiereal', 'aptitdämpning', 'påverkar', 'sam', 's-adenosyl',
-        'methionine', 'metylgivare', 'mani', 'bipolär', 'sjukdom', 'sarcosin', 'sarcosine',
-        'glycin-transportörhämmare', 'schizofreni', 'saw', 'palmetto', 'håravfall', 'hämmar',
-        '5-alfa-reduktas', 'förstoring', 'standardiserad', 'fettsyra', 'schisandra', 'berry',
-        'fas', 'detox-stöd', 'scullcap', 'skullcap', 'baikal', 'nervskydd', 'baicalin',
-        'selenium', 'virusförsvar', 'brist', 'ökar', 'virus-virulens', 'selenometionin',
-        'selenomethionine', 'organisk', 'lagras', 'vävnad', 'toxiskt', 'vid', 'överdos',
-        'sellerifröextrakt', 'celery', 'seed', 'extract', '3nb', 'gikt', 'standardiserat',
-        'ftalider', 'serrapeptase', 'ärrvävnad', 'scar', 'tissue', 'enzym', 'shiitake',
-        'ahcc', 'ett', 'extract', 'från', 'denna', 'silverax', 'black', 'cohosh', 'vallningar',
-        'ej', 'serotonin', 'leverrisk', 'smörsyra', 'butyrate', 'tarmhälsa', 'luktar',
-        'illa', 'smör', 'cellenergi', 'sojaisoflavoner', 'soy', 'isoflavones', 'hormonkänslig',
-        'cancer', 'sojaprotein', 'soy', 'protein', 'isoflavoner', 'spermidine', 'främjar',
-        'autofagi', 'vetegroddsextrakt', 'wheat', 'germ', 'extract', 'cellförnyelse',
-        'innehåller', 'gluten', 'vete', 'spirulina', 'tungmetall-detox', 'kontrollera',
-        'renhet', 'toxiner', 'sulbutiamin', 'sulbutiamine', 'motivation', 'syntetisk',
-        'b1-dimer', 'toleransutveckling', 'sulforafan', 'sulforaphane', 'nrf2-aktivering',
-        'kräver', 'myrosinas', 'aktivering', 'svartkumminolja', 'black', 'seed', 'oil',
-        'nigella', 'sativa', 'thymoquinone', 'svartvinbärsolja', 'black', 'currant',
-        'gla-källa', 'synefrin', 'synephrine', 'bitter', 'orange', 'liknar', 'efedrin',
-        'säkrare', 'p-synefrin', 'säkrast', 'sågpalmetto', 'manligt', 'kvinnligt',
-        'blockerar', 'dht', 'tallbarksextrakt', 'tart', 'cherry', 'extract', 'urinsyra',
-        'gikt', 'återhämtning', 'idrott', 'naturligt', 'också', 'antiinflammatorisk',
-        'taurin', 'taurine', 'cellvolym', 'finns', 'energidryck', 'motverkar', 'skak',
-        'osmoregulation', 'tauroursodeoxycholsyra', 'tudca', 'gallflöde', 'skyddar',
-        'celldöd', 'er-stress', 'tautin', 'kramp', 'gaba-agonist', 'teakrin', 'theacrine',
-        'teacrine', 'energi', 'utan', 'krasch', 'mindre', 'tolerans', 'teanin', 'theanine',
-        'avslappning', 'alfavågor', 'teobromin', 'theobromine', 'kakao-extrakt', 'vidgar',
-        'blodkärl', 'lång', 'halveringstid', 'giftigt', 'hundar', 'cocoa', 'flavanoler',
-        'tokotrienoler', 'tocotrienols', 'e-vitaminform', 'antioxidantskydd', 'tokoferoler',
-        'tongkat', 'ali', 'longjack', 'extrakt', 't.ex.', 'lowers', 'tranbär', 'cranberry',
-        'pacs', 'standardized', 'hindrar', 'adhesion', 'dosering', 'avs', 'förhindrar',
-        'e.coli-fäste', 'tranbärsextrakt', 'urinvägshälsa', 'tremella', 'snow', 'fungus',
-        'fukt', 'skönhet', 'tribulus', 'terrestris', 'testo', 'lust', 'muskel', 'protodioscin',
-        'tryptofan', 'säkrare', 'rate-limited', 'turkesterone', 'ajuga', 'ekdysteroid',
-        'plant', 'sterol', 'androgen', 'turkey', 'tail', 'cancer-stöd', 'psk', 'psp',
-        'polysackarider', 'immunstöd', 'cellgifter', 'tyrosin', 'tyrosine', 'krävs',
-        'sköldkörtelhormon', 'drive', 'kognitiv', 'arbetsminne', 'under', 'press',
-        'uridinmonofosfat', 'uridine', 'monophosphate', 'dopaminreceptorer', 'synapser',
-        'dha', 'kolin', 'valeriana', 'valerian', 'oro', 'valerensyra', 'valerianarot',
-        'valerian', 'root', 'gaba-aktivitet', 'dåsighet', 'vanadin', 'vanadium', 'vanadyl',
-        'sulfate', 'spårelement', 'vassleprotein', 'whey', 'protein', 'snabbt', 'post-workout',
-        'högt', 'leucin', 'anabolt', 'vetegroddsextrakt', 'vetegräs', 'wheatgrass', 'ph-balans',
-        'enzymer', 'vitaminer', 'vinpocetin', 'vinpocetine', 'hjärnans', 'syntetisk', 'från',
-        'periwinkle', 'vasodilator', 'vit', 'kidneyböna', 'white', 'kidney', 'bean', 'extract',
-        'kolhydratblockerare', 'amylashämmare', 'före', 'stärkelserik', 'gas', 'uppblåsthet',
-        'njur-böna', 'hämmar', 'alfa-amylas', 'gaser', 'vitamin', 'a', 'skincell-omsättning',
-        'retinol', 'animaliskt', 'maxdos', 'vitamin', 'b1', 'tiamin', 'thiamine', 'kolhydratmetabolism',
-        'vattenlöslig', 'vitamin', 'b12', 'adenosylcobalamin', 'adenosyl', 'mitokondriell',
-        'krebs-cykeln', 'cyanokobalamin', 'cyanocobalamin', 'standardform', 'sämre', 'metyl',
-        'adeno', 'metylkobalamin', 'methylcobalamin', 'nervhälsa', 'sublingualt', 'effektivt',
-        'vitamin', 'b2', 'riboflavin', 'migrän', 'färgar', 'urin', 'neongul', 'vitamin',
-        'b3', 'nicotinic', 'orsakar', 'skinrodnad', 'flush', 'leverpåverkan', 'extrem',
-        'vitamin', 'b5', 'pantotensyra', 'pantothenic', 'binjurar', 'coenzym', 'askorbinsyra',
-        'kissas', 'ut', 'diarré', 'kollagensyntes', 'glow', 'vitamin', 'd3', 'cholecalciferol',
-        'högre', 'doser', 'fat-solublet', 'överdos', 'kan', 'ge', 'hyperkalcemi', 'vitamin',
-        'e', 'blandade', 'tokoferoler', 'mixed', 'tocopherols', 'cellmembran', 'välj',
-        'ej', 'bara', 'alfa', 'vitamin', 'k2', 'artärstelhet', 'förhindrar', 'kalcium',
-        'kärl', 'waran', 'mk-7', 'viktig', 'rikta', 'skelettet', 'lång', 'halveringstid',
-        'vitlök', 'garlic', 'aged', 'allicin', 'plack', 'age', 'vitpilbark', 'white', 'willow',
-        'bark', 'salicin', 'naturlig', 'aspirin', 'magsår', 'salicylat', 'växtsteroler',
-        'plant', 'sterols', 'blockerar', 'upptag', 'wild', 'yam', 'diosgenin', 'labbomvandling',
-        'placebo', 'yerba', 'mate', 'glp-1', 'innehåller', 'teobromin', 'yohimbin', 'yohimbine',
-        'hcl', 'alfa-2', 'antagonist', 'anxiety', 'hjärtklappning', 'dosera', 'försiktigt',
-        'blockerare', 'hjärta', 'zink', 'zinc', 'skinläkning', 'akne', 'pikolinat', 'glycinat',
-        'kopparbalans', 'kelaterad', 'lozenges', 'halsont', 'lokal', 'sugtabletter', 'acetat',
-        'glukonat', 'viktig', 'mannens', 'hälsa', 'kopparbrist', 'modulerar', 'synaptisk',
-        'plasticitet', 'neurotransmittor-modulering', 'insulinlagring', 'insulin-hexamerer',
-        'l-carnosine', 'specifikt', 'slemhinnor', 'löses', 'långsamt', 'lokal', 'zinkpikolinat',
-        'zinc', 'picolinate', 'long-termbruk', 'utmärkt', 'hämma', 'kopparupptag', 'zma',
-        'återhämtning', 'populär', 'åkerfräken', 'kiselkälla', 'hårkomplex', 'äggprotein',
-        'egg', 'white', 'protein', 'medelsnabbt', 'hög', 'bv', 'laktosfritt', 'alternativ',
-        'äppelcidervinäger', 'apple', 'cider', 'vinegar', 'acv', 'kapslar', 'skonar',
-        'tandemaljen', 'ättiksyra', 'insulinsvar', 'ärtprotein', 'pea', 'protein', 'bra',
-        'aminosyraprofil', 'högt', 'arginine'
-    ]
-    
-    # Check for Swedish words (case-insensitive)
-    for word in swedish_indicators:
-        if word in text_lower:
-            return True
-    
-    # Check for Swedish status/risk terms
-    if any(term in text for term in ['Grön', 'Blå', 'Röd', 'Låg', 'Hög', 'Medium']):
-        return True
-    
-    return False
+# Everything that changes the API output is part of the translation memory key;
+# bump PROMPT_VERSION whenever the prompt text changes
+MODEL = "gpt-4o-mini"  # Using mini for cost efficiency
+TEMPERATURE = 0.3
+PROMPT_VERSION = 'translate_with_openai/1'
+# Batched replies come from BATCH_SYSTEM_PROMPT, so they are cached apart
+# from single-cell ones and only reused by batched runs
+BATCH_PROMPT_VERSION = PROMPT_VERSION + '+batch'
+
+# Replaced in run() according to the --cache options; opened on first use
+memory = TranslationMemory()
+
+MAX_RETRIES = 5
+
+SYSTEM_PROMPT = "You are a medical translator specializing in supplement and health terminology. Translate Swedish text to English, preserving technical terms, dosages, and medical accuracy. Keep abbreviations (like BBB, SSRI, NAD+, etc.) unchanged. Only translate the text, do not add explanations."
+USER_PROMPT = "Translate this Swedish supplement information to English. Preserve all technical terms, dosages, and abbreviations exactly:\n\n"
+BATCH_SYSTEM_PROMPT = SYSTEM_PROMPT + ' You receive a JSON array of {"i": index, "text": Swedish text} objects. Reply with only a JSON array of {"i": index, "text": English translation} objects: one per input item, with the same indexes.'
+
+# Translations resolved ahead of the main pass by --batch-tokens
+prefetched = {}
+
+# Set in run() unless --detector indicators; see translation/langid.py
+detector = None
 
-def translate_text(text, field_name="text"):
-    """Translate Swedish text to English using OpenAI API."""
+# Set by main() with --profile; see translation/profiling.py
+profiler = None
+
+def apply_simple_mappings(text):
+    """Replace status and risk words in text that is already English."""
+    result = text
+    for swedish, english in STATUS_MAP.items():
+        result = result.replace(swedish, english)
+    for swedish, english in RISK_MAP.items():
+        result = result.replace(swedish, english)
+    return result
+
+def lookup_local(text, hits=None):
+    """Return the translation if it needs no API call, otherwise None."""
     if not text or text == '-' or text.strip() == '':
         return text
     
     # Always translate if it contains Swedish characters or common Swedish words
-    if not has_swedish_text(text):
+    if not has_swedish_text(text, hits):
         # Likely already in English, just apply simple mappings
-        result = text
-        for swedish, english in STATUS_MAP.items():
-            result = result.replace(swedish, english)
-        for swedish, english in RISK_MAP.items():
-            result = result.replace(swedish, english)
-        return result
+        return apply_simple_mappings(text)
+    
+    if text in prefetched:
+        return prefetched[text]
+    
+    # Previously translated text resolves locally
+    if memory is not None:
+        return memory.get(text, MODEL, PROMPT_VERSION, TEMPERATURE)
+    return None
+
+def request_params(text):
+    """Keyword arguments for one chat completion request."""
+    return dict(
+        model=MODEL,
+        messages=[
+            {"role": "system", "content": SYSTEM_PROMPT},
+            {"role": "user", "content": USER_PROMPT + text}
+        ],
+        temperature=TEMPERATURE,
+        max_tokens=500,
+        timeout=60  # Increased to 60 second timeout
+    )
+
+def batch_request_params(texts):
+    """Keyword arguments for one batched chat completion request."""
+    # Room for every translation at twice its source length
+    expected = sum(estimate_tokens(text) + ITEM_OVERHEAD_TOKENS for text in texts)
+    return dict(
+        model=MODEL,
+        messages=[
+            {"role": "system", "content": BATCH_SYSTEM_PROMPT},
+            {"role": "user", "content": batch_payload(texts)}
+        ],
+        temperature=TEMPERATURE,
+        max_tokens=min(16000, 2 * expected + 50),
+        timeout=120
+    )
+
+def finish_response(text, response):
+    """Clean up an API response and store it in the translation memory."""
+    if response.choices[0].finish_reason == 'length':
+        raise ValueError('reply cut off at max_tokens')
+    translated = response.choices[0].message.content.strip()
+    
+    # Remove quotes if the API added them
+    if translated.startswith('"') and translated.endswith('"'):
+        translated = translated[1:-1]
+    
+    if memory is not None:
+        memory.put(text, translated, MODEL, PROMPT_VERSION, TEMPERATURE)
+    return translated
+
+def retry_delay(attempt, error):
+    """Seconds to wait before the next attempt, or None to give up."""
+    if attempt < MAX_RETRIES - 1:
+        # Retry-After if the server sent one, else jittered exponential backoff
+        wait_time = limiter.backoff(attempt, error)
+        print(f"    ⚠️  API error (attempt {attempt + 1}/{MAX_RETRIES}): {str(error)[:80]}... Retrying in {wait_time:.1f}s")
+        return wait_time
+    print(f"    ✗ Failed after {MAX_RETRIES} attempts, leaving the cell for the next run")
+    return None
+
+def translate_text(text, field_name="text", hits=None):
+    """Translate Swedish text to English using OpenAI API.
+    
+    hits is an optional find_swedish_terms() result for text, reused instead
+    of scanning the text again. Returns None if every attempt failed, so
+    the cell stays untranslated and is not journaled or marked done.
+    """
+    local = lookup_local(text, hits)
+    if local is not None:
+        return local
     
     # Retry logic for API calls
-    max_retries = 5
-    for attempt in range(max_retries):
+    # Outside the retry loop: a missing key or SDK is not worth retrying
+    completions = clients.get().chat.completions
+    for attempt in range(MAX_RETRIES):
         try:
-            response = client.chat.completions.create(
-                model="gpt-4o-mini",  # Using mini for cost efficiency
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are a medical translator specializing in supplement and health terminology. Translate Swedish text to English, preserving technical terms, dosages, and medical accuracy. Keep abbreviations (like BBB, SSRI, NAD+, etc.) unchanged. Only translate the text, do not add explanations."
-                    },
-                    {
-                        "role": "user",
-                        "content": f"Translate this Swedish supplement information to English. Preserve all technical terms, dosages, and abbreviations exactly:\n\n{text}"
-                    }
-                ],
-                temperature=0.3,
-                max_tokens=500,
-                timeout=60  # Increased to 60 second timeout
-            )
-            
-            translated = response.choices[0].message.content.strip()
-            
-            # Remove quotes if the API added them
-            if translated.startswith('"') and translated.endswith('"'):
-                translated = translated[1:-1]
-            
-            return translated
+            response = ratelimit.create(completions, limiter, request_params(text))
+            return finish_response(text, response)
         
         except Exception as e:
-            error_msg = str(e)
-            if attempt < max_retries - 1:
-                wait_time = (attempt + 1) * 3  # Exponential backoff: 3s, 6s, 9s, 12s
-                print(f"    ⚠️  API error (attempt {attempt + 1}/{max_retries}): {error_msg[:80]}... Retrying in {wait_time}s")
-                time.sleep(wait_time)
-            else:
-                print(f"    ✗ Failed after {max_retries} attempts, using fallback")
-                # Fallback: return original with simple mappings applied
-                result = text
-                for swedish, english in STATUS_MAP.items():
-                    result = result.replace(swedish, english)
-                for swedish, english in RISK_MAP.items():
-                    result = result.replace(swedish, english)
-                return result
-
-def translate_row(row, row_num, skip_if_english=False):
+            wait_time = retry_delay(attempt, e)
+            if wait_time is None:
+                return None
+            time.sleep(wait_time)
+
+async def translate_text_async(text, field_name="text", hits=None):
+    """Async translate_text() for --concurrency runs."""
+    local = lookup_local(text, hits)
+    if local is not None:
+        return local
+    
+    completions = clients.get_async().chat.completions
+    for attempt in range(MAX_RETRIES):
+        try:
+            response = await ratelimit.create_async(completions, limiter, request_params(text))
+            return finish_response(text, response)
+        
+        except Exception as e:
+            wait_time = retry_delay(attempt, e)
+            if wait_time is None:
+                return None
+            await asyncio.sleep(wait_time)
+
+def request_batch(texts):
+    """Send one batched request and return the reply content.
+    
+    API errors are retried here; a reply that does not parse is left to
+    translate_batch(), which splits the batch.
+    """
+    completions = clients.get().chat.completions
+    for attempt in range(MAX_RETRIES):
+        try:
+            response = ratelimit.create(completions, limiter, batch_request_params(texts))
+            return response.choices[0].message.content
+        except Exception as e:
+            if attempt == MAX_RETRIES - 1:
+                raise
+            time.sleep(limiter.backoff(attempt, e))
+
+async def request_batch_async(texts):
+    completions = clients.get_async().chat.completions
+    for attempt in range(MAX_RETRIES):
+        try:
+            response = await ratelimit.create_async(completions, limiter, batch_request_params(texts))
+            return response.choices[0].message.content
+        except Exception as e:
+            if attempt == MAX_RETRIES - 1:
+                raise
+            await asyncio.sleep(limiter.backoff(attempt, e))
+
+def prefetch_batches(pipeline, plan, budget, max_cells, concurrency=1):
+    """Translate every cell bound for the API in batched requests.
+    
+    Results land in prefetched (and the translation memory, under
+    BATCH_PROMPT_VERSION), so the main pass resolves them without further
+    API calls. Returns the BatchStats.
+    """
+    stats = BatchStats(estimate_tokens(SYSTEM_PROMPT + USER_PROMPT), estimate_tokens(BATCH_SYSTEM_PROMPT))
+    texts = []
+    for column, text in plan:
+        if text in prefetched or not pipeline.reaches(text, column, 'llm'):
+            continue
+        # Cells that resolve locally are resolved again in the main pass
+        if lookup_local(text) is not None:
+            continue
+        cached = memory.get(text, MODEL, BATCH_PROMPT_VERSION, TEMPERATURE) if memory is not None else None
+        if cached is not None:
+            prefetched[text] = cached
+        else:
+            texts.append(text)
+    texts = list(dict.fromkeys(texts))
+    stats.add_cells(texts)
+    batches = pack(texts, budget, max_cells)
+    print(f"Batching {len(texts)} API-bound cells into {len(batches)} requests...")
+    
+    def remember(batch, translations):
+        # Single-cell translations are stored by translate_text() itself
+        if memory is not None:
+            for text, translated in zip(batch, translations):
+                memory.put(text, translated, MODEL, BATCH_PROMPT_VERSION, TEMPERATURE)
+    
+    def store(batch, translations):
+        # Cells whose request failed (None) are tried again in the main pass
+        prefetched.update((text, translated) for text, translated in zip(batch, translations)
+                          if translated is not None)
+    
+    if concurrency > 1:
+        async def worker(batch):
+            return await translate_batch_async(batch, request_batch_async, translate_text_async, stats, remember)
+        
+        def on_result(index, batch, translations, error):
+            if error is not None:
+                print(f"  ✗ Batch {index + 1} failed: {error}; its cells go through the main pass")
+                return
+            store(batch, translations)
+            print(f"  ✓ Batch {index + 1}/{len(batches)}: {len(batch)} cells")
+        
+        if asyncio.run(dispatch(batches, worker, concurrency, on_result)):
+            print(f"  Batching interrupted - remaining cells go through the main pass")
+    else:
+        for index, batch in enumerate(batches, 1):
+            store(batch, translate_batch(batch, request_batch, translate_text, stats, remember))
+            print(f"  ✓ Batch {index}/{len(batches)}: {len(batch)} cells")
+    return stats
+
+def translate_cell(text, column, hits=None):
+    """LLM stage: translate one cell that contains Swedish text; None if the API failed."""
+    print(f"  → Translating {column}...")
+    return translate_text(text, column, hits)
+
+async def translate_cell_async(text, column, hits=None):
+    """Async LLM stage used with --concurrency."""
+    print(f"  → Translating {column}...")
+    return await translate_text_async(text, column, hits)
+
+def detect_swedish(text):
+    """Swedish indicator hits for text, dropped if the n-gram detector judges it English."""
+    with metrics.phase('detection'):
+        hits = find_swedish_terms(text)
+        if detector is not None:
+            return detector.filter(text, hits)
+        return hits
+
+def load_detector(args, source_file, translated_file, log, rows=None):
+    """The n-gram detector for --detector ngram, or None to use the indicators alone.
+    
+    rows, if given, are the (source, translated) rows of the two files, already read.
+    """
+    if args.detector != 'ngram':
+        return None
+    if rows is None:
+        model = NgramDetector.from_files(source_file, translated_file, args.detector_threshold)
+    else:
+        model = NgramDetector.from_rows(*rows, threshold=args.detector_threshold)
+    if model is None:
+        print(f"  Language detector: too few translated cells in {translated_file} to train on - "
+              f"using Swedish indicators only", file=log)
+    else:
+        print(f"  Language detector: n-gram model trained on {model.training_cells} translated cells", file=log)
+    return model
+
+def export_metrics(args, pipeline, cells):
+    """Write the metrics files asked for on the command line."""
+    metrics.cells = cells
+    metrics.phases['rate_limit_wait'] = limiter.waited
+    if memory is not None:
+        metrics.set_cache(memory.hits, memory.misses)
+    if args.metrics_json:
+        metrics.write_json(args.metrics_json)
+    if args.metrics_prom:
+        metrics.write_prometheus(args.metrics_prom)
+
+def build_pipeline(rules_first=False):
+    """Status/risk exact maps, optionally the glossary, then the OpenAI API.
+    
+    Only cells where the detector finds Swedish text reach the API; the rest
+    are left as they are.
+    """
+    stages = [
+        ExactMapStage(STATUS_MAP, ['research_status'], name='status'),
+        ExactMapStage(RISK_MAP, ['interaction_risk'], name='risk'),
+    ]
+    if rules_first:
+        # Cells the glossary fully translates never reach the API
+        import translate_csv
+        stages.append(GlossaryStage(translate_csv.translate_text, ['dosing_notes', 'bioavailability_notes'],
+                                    final=False, detect=has_swedish_text))
+    stages.append(LLMStage(translate_cell, ['dosing_notes', 'bioavailability_notes', 'interaction_risk'],
+                           detect=detect_swedish, translate_async=translate_cell_async))
+    pipeline = Pipeline(stages)
+    if profiler is not None:
+        # What each indicator term (and glossary pattern) costs, for the --profile report
+        profiler.watch(pipeline)
+        profiler.add_indicators('llm', find_swedish_terms, detector.is_swedish if detector is not None else None,
+                                SWEDISH_INDICATORS)
+        if rules_first:
+            profiler.add_patterns('GLOSSARY', 'glossary', translate_csv.glossary_patterns())
+    return pipeline
+
+PIPELINE = build_pipeline()
+
+def translate_row(row, row_num=None):
     """Translate a single CSV row."""
-    if len(row) < 10:
-        return row
-    
-    translated = list(row)
-    
-    # Column 2: research_status (simple mapping)
-    if translated[2] in STATUS_MAP:
-        translated[2] = STATUS_MAP[translated[2]]
-    
-    # Column 5: dosing_notes (always check and translate if Swedish)
-    if translated[5] and translated[5] != '-':
-        if has_swedish_text(translated[5]) or not skip_if_english:
-            print(f"  → Translating dosing_notes...")
-            translated[5] = translate_text(translated[5], "dosing_notes")
-            time.sleep(0.1)  # Rate limiting
-    
-    # Column 6: bioavailability_notes (always check and translate if Swedish)
-    if translated[6] and translated[6] != '-':
-        if has_swedish_text(translated[6]) or not skip_if_english:
-            print(f"  → Translating bioavailability_notes...")
-            translated[6] = translate_text(translated[6], "bioavailability_notes")
-            time.sleep(0.1)  # Rate limiting
-    
-    # Column 7: interaction_risk (translate if needed)
-    if translated[7] and translated[7] != '-':
-        # First apply simple mappings
-        if translated[7] in RISK_MAP:
-            translated[7] = RISK_MAP[translated[7]]
-        elif has_swedish_text(translated[7]) or not skip_if_english:
-            # May contain additional Swedish text
-            print(f"  → Translating interaction_risk...")
-            translated[7] = translate_text(translated[7], "interaction_risk")
-            time.sleep(0.1)  # Rate limiting
+    return PIPELINE.translate_row(row)
+
+def stream_main(args, pipeline):
+    """--stream: translate args.input into args.output without holding the catalog in memory.
     
-    return translated
+    Repeated values are not grouped; with the translation memory on, each
+    one after the first is a cache hit. An interrupted run leaves the
+    output file as it was, and a rerun gets the finished cells from the memory.
+    """
+    # Status lines go to stderr when the CSV itself goes to stdout
+    log = sys.stderr if args.output == STDIO else sys.stdout
+    if args.batch_tokens > 0:
+        print("⚠️  --batch-tokens is ignored with --stream", file=log)
+    print(f"Streaming {args.input} → {args.output}...", file=log)
+    
+    def on_row(stats):
+        if stats.rows % 100 == 0:
+            print(f"  ... {stats.rows} rows written", file=log)
+    
+    stats = stream_translate(pipeline, args.input, args.output, args.concurrency, on_row)
+    if stats.interrupted:
+        print(f"\n⚠️  Interrupted after {stats.rows} rows; {args.output} was left unchanged.", file=log)
+        print(f"  Translations so far are in the translation memory; run again to finish.", file=log)
+    else:
+        print(f"\n✓ Translation complete! {stats.rows} rows ({stats.data_rows} data rows) written to {args.output}",
+              file=log)
+    print(f"  Rate limiter: {limiter.summary()}", file=log)
+    if detector is not None:
+        print(f"  Language detector: {detector.summary()}", file=log)
+    for stage in pipeline.stages:
+        print(f"  Cells resolved by {stage.name}: {pipeline.stats[stage.name]}", file=log)
+    if memory is not None:
+        print(f"  Translation memory: {memory.summary()}", file=log)
+    export_metrics(args, pipeline, sum(pipeline.stats.values()))
+    if memory is not None:
+        memory.close()
+
+def incremental_main(args, pipeline):
+    """--incremental: translate only the rows of args.input that changed since the last run.
+    
+    The source is diffed against the snapshot the last run left next to
+    args.output (translation/delta.py); other rows are copied from
+    args.output. An interrupted run leaves the output, snapshot and delta
+    file as they were.
+    """
+    snapshot = snapshot_path(args.output)
+    if os.path.exists(snapshot):
+        print(f"Diffing {args.input} against {snapshot}...")
+    else:
+        print(f"No snapshot at {snapshot} yet - translating every row of {args.input}")
+    try:
+        delta = translate_delta(pipeline, args.input, args.output, args.delta)
+    except KeyboardInterrupt:
+        print(f"\n⚠️  Interrupted; {args.output} was left unchanged.")
+        print(f"  Translations so far are in the translation memory; run again to finish.")
+    else:
+        print(f"\n✓ {args.output} updated: {len(delta.added)} rows added, {len(delta.changed)} changed, "
+              f"{len(delta.removed)} removed, {len(delta.unchanged)} unchanged")
+        if args.delta:
+            print(f"  Delta for load_supplements.py written to {args.delta}")
+    print(f"  Rate limiter: {limiter.summary()}")
+    if detector is not None:
+        print(f"  Language detector: {detector.summary()}")
+    for stage in pipeline.stages:
+        print(f"  Cells resolved by {stage.name}: {pipeline.stats[stage.name]}")
+    if memory is not None:
+        print(f"  Translation memory: {memory.summary()}")
+    export_metrics(args, pipeline, sum(pipeline.stats.values()))
+    if memory is not None:
+        memory.close()
 
 def main():
+    global profiler
+    parser = build_parser()
+    args = parser.parse_args()
+    if args.incremental and args.stream:
+        parser.error('--incremental and --stream are separate modes; choose one')
+    if args.incremental and STDIO in (args.input, args.output):
+        parser.error('--incremental reads and rewrites files; --input and --output cannot be -')
+    if args.delta and not args.incremental:
+        parser.error('--delta needs --incremental')
+    if not args.profile:
+        run(args)
+        return
+    log = sys.stderr if args.stream and args.output == STDIO else sys.stdout
+    profiler = Profiler(args.profile, log)
+    with profiler:
+        run(args)
+
+def run(args):
+    global memory, detector
+    clients.api_key = args.api_key
+    limiter.set_limits(args.rpm, args.tpm)
+    memory = None if args.no_cache else TranslationMemory(
+        args.cache, max_entries=args.cache_max_entries, max_age_days=args.cache_max_age_days)
+    
+    if args.stream:
+        log = sys.stderr if args.output == STDIO else sys.stdout
+        detector = load_detector(args, 'Börja utforska - Börja utforska.csv', 'supplements-english.csv', log)
+        stream_main(args, build_pipeline(rules_first=args.rules_first))
+        return
+    
+    if args.incremental:
+        detector = load_detector(args, args.input, args.output, sys.stdout)
+        incremental_main(args, build_pipeline(rules_first=args.rules_first))
+        return
+    
     output_file = 'supplements-english.csv'
     backup_file = 'supplements-english-backup.csv'
     original_file = 'Börja utforska - Börja utforska.csv'
     
-    # Priority: Use existing output file if it has correct row count, otherwise use backup or original
-    with open(original_file, 'r', encoding='utf-8') as f:
-        original_rows = sum(1 for _ in f)
+    # Cells accepted by earlier runs are in the resume index; values
+    # translated since its last save are in the journal. Journal records
+    # point at rows of the output as it is on disk, so it is replayed
+    # before the output is aligned with the source.
+    resume = ResumeIndex(index_path(output_file))
+    journal = Journal(journal_path(output_file))
+    output_rows = None
+    translated_files = []
+    snapshot = snapshot_path(output_file)
+    # If no file changed since the last run ended, its output still lines
+    # up with the source (translation/manifest.py)
+    start_files = [original_file, output_file, snapshot, backup_file]
+    manifest = Manifest(manifest_path(output_file))
+    in_sync = manifest.unchanged(start_files) and os.path.exists(output_file)
+    with metrics.phase('io'):
+        source_rows = read_rows(original_file)
+        if os.path.exists(output_file):
+            output_rows = [list(row) for row in read_rows(output_file)]
+            output_identities = row_identities(output_rows)
+            
+            def restore(row_idx, column, source_digest, text):
+                resume.accept_hashed(output_identities[row_idx], column, source_digest, content_hash(text))
+            
+            restored = journal.replay(output_rows, restore)
+            if restored:
+                print(f"✓ Restored {restored} translated cells from {journal.path}")
+        if not in_sync:
+            if output_rows is not None:
+                snapshot_rows = read_rows(snapshot) if os.path.exists(snapshot) else None
+                translated_files.append(TranslatedFile(output_rows, snapshot_rows))
+            if os.path.exists(backup_file):
+                translated_files.append(TranslatedFile(read_rows(backup_file)))
     
-    # Check if output file exists - ALWAYS check for translations FIRST before copying anything
-    if os.path.exists(output_file):
-        with open(output_file, 'r', encoding='utf-8') as f:
-            output_rows = sum(1 for _ in f)
-        
-        # ALWAYS check if file has any English translations (sample first 30 rows)
-        # This check happens BEFORE we decide to copy over the file
-        has_translations = False
-        with open(output_file, 'r', encoding='utf-8') as f:
-            reader = csv.reader(f)
-            sample_count = 0
-            english_count = 0
-            for row in reader:
-                if len(row) >= 10 and 'name_sv' not in row[0].lower():
-                    sample_count += 1
-                    # Check if this row has English text (no Swedish chars in key fields)
-                    # Check column 5 (dosing_notes) and 6 (bioavailability_notes)
-                    row_is_english = False
-                    if row[5] and row[5] != '-':
-                        has_swedish_chars = any(c in row[5] for c in ['å', 'ä', 'ö', 'Å', 'Ä', 'Ö'])
-                        has_swedish_words = any(word in row[5].lower() for word in ['är', 'och', 'för', 'med', 'på', 'av', 'till', 'det', 'som', 'kan', 'inte', 'eller', 'vid', 'bättre', 'högre', 'lägre', 'från', 'grön', 'blå', 'röd', 'låg', 'hög'])
-                        if not has_swedish_chars and not has_swedish_words:
-                            row_is_english = True
-                    if row[6] and row[6] != '-':
-                        has_swedish_chars = any(c in row[6] for c in ['å', 'ä', 'ö', 'Å', 'Ä', 'Ö'])
-                        has_swedish_words = any(word in row[6].lower() for word in ['är', 'och', 'för', 'med', 'på', 'av', 'till', 'det', 'som', 'kan', 'inte', 'eller', 'vid', 'bättre', 'högre', 'lägre', 'från'])
-                        if not has_swedish_chars and not has_swedish_words:
-                            row_is_english = True
-                    
-                    if row_is_english:
-                        english_count += 1
-                    
-                    if sample_count >= 30:
-                        break
-            # If at least 30% of sampled rows are in English, consider file partially translated
-            if sample_count > 0 and english_count / sample_count >= 0.3:
-                has_translations = True
-        
-        # If file has translations, NEVER overwrite it, regardless of row count
-        if has_translations:
-            print(f"✓ Using existing {output_file} with {output_rows} rows")
-            if abs(output_rows - original_rows) <= 1:
-                print(f"  File contains partial translations - will only translate remaining Swedish text")
-            else:
-                print(f"  ⚠️  Row count differs ({output_rows} vs {original_rows}), but file has translations")
-                print(f"  Keeping existing file and will only translate remaining Swedish text")
-            print(f"  (Skipping rows that are already fully translated)\n")
-        # If file has correct row count but no translations, use it
-        elif abs(output_rows - original_rows) <= 1:
-            print(f"✓ Using existing {output_file} with {output_rows} rows")
-            print(f"  Will only translate fields that still contain Swedish text...")
-            print(f"  (Skipping rows that are already fully translated)\n")
-        # File has wrong row count and no translations - can use backup or original
-        elif os.path.exists(backup_file):
-            with open(backup_file, 'r', encoding='utf-8') as f:
-                backup_rows = sum(1 for _ in f)
-            if backup_rows == original_rows:
-                print(f"⚠️  {output_file} has {output_rows} rows (expected {original_rows})")
-                print(f"  File has no translations - using backup file instead")
-                print(f"✓ Using backup file ({backup_file}) with {backup_rows} rows")
-                import shutil
-                shutil.copy2(backup_file, output_file)
-                print(f"  Copied backup to {output_file}\n")
-            else:
-                print(f"⚠️  Both files have wrong row counts. Using original file...")
-                import shutil
-                shutil.copy2(original_file, output_file)
-                print(f"  Copied original to {output_file}\n")
-        else:
-            print(f"⚠️  {output_file} has {output_rows} rows (expected {original_rows})")
-            print(f"   File has no translations - using original file...")
-            import shutil
-            shutil.copy2(original_file, output_file)
-            print(f"  Copied original to {output_file}\n")
-    elif os.path.exists(backup_file):
-        with open(backup_file, 'r', encoding='utf-8') as f:
-            backup_rows = sum(1 for _ in f)
-        if backup_rows == original_rows:
-            print(f"✓ Using backup file ({backup_file}) with {backup_rows} rows as starting point")
-            import shutil
-            shutil.copy2(backup_file, output_file)
-            print(f"  Copied backup to {output_file}\n")
-        else:
-            print(f"⚠️  Backup file has {backup_rows} rows (expected {original_rows})")
-            print(f"   Using original file...")
-            import shutil
-            shutil.copy2(original_file, output_file)
-            print(f"  Copied original to {output_file}\n")
+    # Rows are matched to the source by content, not line numbers
+    # (translation/alignment.py), so translations survive inserted,
+    # deleted and reordered rows
+    if in_sync:
+        print(f"{output_file} lines up with {original_file}; no file changed since the last run")
+        rows = output_rows
     else:
-        print(f"Starting fresh translation from {original_file}...")
-        import shutil
-        shutil.copy2(original_file, output_file)
-        print(f"  Copied original to {output_file}\n")
+        if translated_files:
+            print(f"Aligning {output_file} with {original_file}...")
+        else:
+            print(f"Starting fresh translation from {original_file}...")
+        alignment = align(source_rows, translated_files)
+        rows = alignment.rows
+        if translated_files:
+            print(f"  {alignment.matched} rows matched, {alignment.added} new, "
+                  f"{alignment.dropped} no longer in the source; {alignment.cells} translated cells kept")
+            if alignment.stale:
+                print(f"  {alignment.stale} translations of since-edited source cells will be redone")
+    if rows != output_rows:
+        with metrics.phase('io'):
+            journal.sync()
+            write_rows(output_file, rows)
+            resume.save()
+        # The journal's records are in the aligned output now
+        journal.discard()
+        print(f"  Wrote aligned rows to {output_file}\n")
+    
+    detector = load_detector(args, original_file, output_file, sys.stdout, (source_rows, rows))
+    pipeline = build_pipeline(rules_first=args.rules_first)
     
-    rows = []
     total_rows = 0
-    translated_count = 0
-    needs_translation_count = 0
-    
-    print(f"\nReading CSV file: {output_file}...")
-    with open(output_file, 'r', encoding='utf-8') as f:
-        reader = csv.reader(f)
-        for row_num, row in enumerate(reader, 1):
-            if len(row) > 0 and 'name_sv' in row[0].lower():
-                # Header row - keep as is
-                rows.append(row)
-                print(f"Found header row at line {row_num}")
-            elif len(row) >= 10:
-                # Data row - check if it needs translation
-                total_rows += 1
-                
-                try:
-                    # Check if any field still has Swedish text
-                    needs_translation = False
-                    swedish_fields = []
-                    
-                    if row[5] and row[5] != '-' and has_swedish_text(row[5]):
-                        needs_translation = True
-                        swedish_fields.append('dosing_notes')
-                    if row[6] and row[6] != '-' and has_swedish_text(row[6]):
-                        needs_translation = True
-                        swedish_fields.append('bioavailability_notes')
-                    if row[7] and row[7] != '-':
-                        # Check if it's just a simple status that needs mapping
-                        if row[7] in RISK_MAP:
-                            # Just needs simple mapping, not full translation
-                            pass
-                        elif has_swedish_text(row[7]):
-                            needs_translation = True
-                            swedish_fields.append('interaction_risk')
-                    
-                    if needs_translation:
-                        needs_translation_count += 1
-                        print(f"\nRow {row_num}: Needs translation ({', '.join(swedish_fields)})")
-                        translated = translate_row(row, row_num, skip_if_english=True)
-                        rows.append(translated)
-                        translated_count += 1
-                    else:
-                        # Already translated, just apply simple mappings and skip
-                        translated = list(row)
-                        if translated[2] in STATUS_MAP:
-                            translated[2] = STATUS_MAP[translated[2]]
-                        if translated[7] in RISK_MAP:
-                            translated[7] = RISK_MAP[translated[7]]
-                        rows.append(translated)
-                        # Skip silently - no need to print for already translated rows
-                        if total_rows % 100 == 0:  # Show progress every 100 skipped rows
-                            print(f"  ... {total_rows} rows processed (skipping already translated rows)")
-                    
-                    # Progress update and save every 10 rows (more frequent saves)
-                    if total_rows % 10 == 0:
-                        print(f"\n=== Progress: {total_rows} rows processed, {translated_count} translated ===")
-                        # Save progress periodically to temp file first, then rename (safer)
-                        try:
-                            temp_file = output_file + '.tmp'
-                            with open(temp_file, 'w', encoding='utf-8', newline='') as f:
-                                writer = csv.writer(f)
-                                writer.writerows(rows)
-                            # Atomic rename
-                            os.replace(temp_file, output_file)
-                            print(f"  ✓ Progress saved to {output_file}\n")
-                        except Exception as e:
-                            print(f"  ✗ Error saving progress: {e}\n")
-                
-                except KeyboardInterrupt:
-                    print(f"\n\n⚠️  Interrupted by user. Saving progress...")
-                    try:
-                        temp_file = output_file + '.tmp'
-                        with open(temp_file, 'w', encoding='utf-8', newline='') as f:
-                            writer = csv.writer(f)
-                            writer.writerows(rows)
-                        os.replace(temp_file, output_file)
-                        print(f"  ✓ Progress saved ({total_rows} rows). You can resume by running the script again.")
-                    except Exception as e:
-                        print(f"  ✗ Error saving: {e}")
-                    sys.exit(0)
-                except Exception as e:
-                    print(f"\n  ✗ Error processing row {row_num}: {e}")
-                    print(f"  Continuing with next row...")
-                    # Add row as-is to prevent data loss
-                    rows.append(row)
-            else:
-                # Keep malformed rows as-is
-                rows.append(row)
+    for row_num, row in enumerate(rows, 1):
+        if is_header(row):
+            print(f"Found header row at line {row_num}")
+        elif is_data_row(row):
+            total_rows += 1
+    identities = row_identities(rows)
+    
+    def source_text(row_idx, column):
+        # Aligned rows are the source rows, in order
+        return source_rows[row_idx][COLUMN_INDEX[column]]
+    
+    # A cell that still holds the translation accepted for an earlier
+    # source text is translated again from its current source
+    outdated = 0
+    for row_idx, column, text in list(pipeline.cells(rows)):
+        source = source_text(row_idx, column)
+        if resume.is_outdated(identities[row_idx], column, source, text):
+            rows[row_idx][COLUMN_INDEX[column]] = source
+            outdated += 1
+    if outdated:
+        print(f"  {outdated} cells whose source text changed will be translated again (resume index)")
+    
+    # Planning pass: every distinct (column, text) is translated once and the
+    # result is fanned out to all rows that share it. Cells whose text is
+    # the accepted translation of their source text are finished and skipped.
+    plan = {}
+    finished = 0
+    for (column, text), row_indexes in pipeline.plan(rows).items():
+        pending = [row_idx for row_idx in row_indexes
+                   if not resume.is_done(identities[row_idx], column, source_text(row_idx, column), text)]
+        finished += len(row_indexes) - len(pending)
+        if pending:
+            plan[(column, text)] = pending
+    total_cells = sum(len(row_indexes) for row_indexes in plan.values())
+    print(f"Found {total_cells} translatable cells ({len(plan)} distinct)")
+    if finished:
+        print(f"  Skipping {finished} cells already translated (resume index)")
+    
+    batch_stats = None
+    if args.batch_tokens > 0:
+        batch_stats = prefetch_batches(pipeline, plan, args.batch_tokens, args.batch_max_cells,
+                                       args.concurrency)
+    
+    translated_rows = set()
+    translated_values = 0
+    saved_calls = 0
+    cells_done = 0
+    # (row index, column) of the cells left untranslated by a failed API call
+    failed_cells = []
+    
+    def save_progress(message):
+        try:
+            journal.close()
+            resume.save()
+            export_metrics(args, pipeline, cells_done)
+            print(message)
+        except Exception as e:
+            print(f"  ✗ Error saving progress: {e}\n")
+    
+    def record(done, column, text, row_indexes, translated, stage_name):
+        """Fan one translated value out to its rows and journal it; synced every 10 values."""
+        nonlocal translated_values, saved_calls, cells_done
+        if translated != text:
+            with metrics.phase('io'):
+                journal.append(row_indexes, column, text, translated)
+            for row_idx in row_indexes:
+                resume.accept(identities[row_idx], column, source_text(row_idx, column), translated)
+        pipeline.fan_out(rows, column, row_indexes, translated)
+        cells_done += len(row_indexes)
+        if stage_name == 'unchanged' and pipeline.reaches(text, column, 'llm'):
+            failed_cells.extend((row_idx, column) for row_idx in row_indexes)
+        if stage_name not in ('llm', 'glossary'):
+            return
+        translated_values += 1
+        translated_rows.update(row_indexes)
+        if stage_name == 'llm':
+            saved_calls += len(row_indexes) - 1
+        shared = f" (shared by {len(row_indexes)} rows)" if len(row_indexes) > 1 else ""
+        print(f"  ✓ [{done}/{len(plan)}] {column}{shared}: {translated[:60]}")
+        
+        # Progress update and save every 10 translated values
+        if translated_values % 10 == 0:
+            print(f"\n=== Progress: {done}/{len(plan)} distinct cells processed, {translated_values} translated ===")
+            print(f"  ✓ Progress journaled to {journal.path}\n")
+    
+    if args.concurrency > 1:
+        # Up to --concurrency requests in flight; results are recorded in plan
+        # order, so every checkpoint holds a clean prefix of the work
+        print(f"Translating with up to {args.concurrency} concurrent requests...")
+        
+        async def worker(item):
+            (column, text), _ = item
+            return await pipeline.resolve_async(text, column)
+        
+        def on_result(index, item, result, error):
+            (column, text), row_indexes = item
+            if error is not None:
+                print(f"\n  ✗ Error translating {column} in row {row_indexes[0] + 1}: {error}")
+                print(f"  Continuing with next cell...")
+                failed_cells.extend((row_idx, column) for row_idx in row_indexes)
+                return
+            record(index + 1, column, text, row_indexes, *result)
+        
+        interrupted = asyncio.run(dispatch(plan.items(), worker, args.concurrency, on_result))
+        if interrupted:
+            save_progress(f"  ✓ Progress saved. You can resume by running the script again.")
+            sys.exit(0)
+    else:
+        for done, ((column, text), row_indexes) in enumerate(plan.items(), 1):
+            try:
+                translated, stage_name = pipeline.resolve(text, column)
+                record(done, column, text, row_indexes, translated, stage_name)
+            
+            except KeyboardInterrupt:
+                print(f"\n\n⚠️  Interrupted by user. Saving progress...")
+                save_progress(f"  ✓ Progress saved ({done - 1}/{len(plan)} distinct cells). You can resume by running the script again.")
+                sys.exit(0)
+            except Exception as e:
+                print(f"\n  ✗ Error translating {column} in row {row_indexes[0] + 1}: {e}")
+                print(f"  Continuing with next cell...")
+                failed_cells.extend((row_idx, column) for row_idx in row_indexes)
     
     print(f"\nWriting final translated CSV to {output_file}...")
     try:
-        temp_file = output_file + '.tmp'
-        with open(temp_file, 'w', encoding='utf-8', newline='') as f:
-            writer = csv.writer(f)
-            writer.writerows(rows)
-        os.replace(temp_file, output_file)
+        with metrics.phase('io'):
+            journal.sync()
+            write_rows(output_file, rows)
+            # The output's rows now follow the source, except for the
+            # failed cells; see translation/delta.py
+            write_snapshot(output_file, source_rows, failed_cells)
+            resume.save()
+            manifest.record(start_files)
     except Exception as e:
         print(f"  ✗ Error writing final file: {e}")
         raise
+    # Everything in the journal is now in the CSV and the resume index
+    journal.discard()
     
-    skipped_count = total_rows - needs_translation_count
+    translated_count = len(translated_rows)
+    skipped_count = total_rows - translated_count
     print(f"\n{'='*60}")
     print(f"✓ Translation complete!")
     print(f"{'='*60}")
     print(f"  Total data rows: {total_rows}")
     print(f"  Rows already translated (skipped): {skipped_count}")
-    print(f"  Rows needing translation: {needs_translation_count}")
     print(f"  Rows translated in this run: {translated_count}")
+    print(f"  Distinct cells translated: {translated_values}")
+    print(f"  API calls saved by deduplication: {saved_calls}")
+    if batch_stats is not None:
+        print(f"  Batching: {batch_stats.summary()}")
+    print(f"  Rate limiter: {limiter.summary()}")
+    if detector is not None:
+        print(f"  Language detector: {detector.summary()}")
+    for stage in pipeline.stages:
+        print(f"  Cells resolved by {stage.name}: {pipeline.stats[stage.name]}")
+    if memory is not None:
+        print(f"  Translation memory: {memory.summary()}")
+    export_metrics(args, pipeline, cells_done)
+    if memory is not None:
+        memory.close()
     print(f"  Output file: {output_file}")
     print(f"{'='*60}")
 
@@ -0,0 +1,3 @@
+"""
+Shared building blocks for the translate_*.py scripts.
+"""
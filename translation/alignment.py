@@ -0,0 +1,109 @@
+"""
+Alignment of earlier translated catalog files with the current source.
+
+The translated columns of a row change, but KEY_COLUMNS never do: no
+translation stage touches them. Each earlier translated file (the output,
+then the backup) is indexed by those cells in a hash table. Every source
+row then looks up its matches, one per file. Repeated keys are matched in
+file order. Matches do not depend on line numbers, so translations
+survive inserted, deleted and reordered rows.
+
+For each translated column, the aligned row takes the first match whose
+cell differs from the source cell, i.e. was translated. A partly
+translated output is thus completed from the backup. When the source
+snapshot of an incremental run (translation/delta.py) lines up with the
+output, an output cell is only kept if the snapshot shows it was made
+from the current source text; otherwise the cell is stale and is not
+taken from the backup either. Without a snapshot an edited cell keeps its
+earlier translation. Source rows without a match are kept as they are,
+for the run to translate. Header and malformed rows come from the source.
+"""
+
+from collections import namedtuple
+
+from translation.pipeline import COLUMNS, is_data_row
+
+KEY_COLUMNS = ['name_sv', 'name_en', 'dosing_base_g_mg', 'dosing_max_g_mg', 'is_base_health', 'category_links']
+KEY_INDEXES = [COLUMNS.index(name) for name in KEY_COLUMNS]
+TRANSLATED_INDEXES = [idx for idx, name in enumerate(COLUMNS) if name not in KEY_COLUMNS]
+
+# rows: the aligned rows; matched/added: source data rows with and without a
+# match; dropped: rows of the first file no source row matched; cells:
+# translations carried over; stale: translations of an earlier source text
+Alignment = namedtuple('Alignment', ['rows', 'matched', 'added', 'dropped', 'cells', 'stale'])
+
+
+def row_key(row):
+    return tuple(row[idx] for idx in KEY_INDEXES)
+
+
+def _lines_up(rows, source_rows):
+    return len(rows) == len(source_rows) and all(row_key(row) == row_key(source)
+                                                 for row, source in zip(rows, source_rows))
+
+
+class TranslatedFile:
+    """The data rows of an earlier translated file, by row_key().
+
+    source_rows, if given, are the source the file was translated from
+    (its snapshot). They are used only if they line up with the file row
+    for row.
+    """
+
+    def __init__(self, rows, source_rows=None):
+        data = [row for row in rows if is_data_row(row)]
+        sources = [row for row in source_rows if is_data_row(row)] if source_rows else []
+        if not _lines_up(data, sources):
+            sources = [None] * len(data)
+        self.buckets = {}
+        for row, source in zip(data, sources):
+            self.buckets.setdefault(row_key(row), []).append((row, source))
+
+    def take(self, row):
+        """Remove and return the (row, source row or None) matching source row; None if none."""
+        candidates = self.buckets.get(row_key(row))
+        if not candidates:
+            return None
+        for i, (_, source) in enumerate(candidates):
+            # A repeated key goes to the row translated from this very source, if known
+            if source == row:
+                return candidates.pop(i)
+        return candidates.pop(0)
+
+    def remaining(self):
+        return sum(len(candidates) for candidates in self.buckets.values())
+
+
+def align(source_rows, files):
+    """Align source_rows with files, a list of TranslatedFile, best first; returns an Alignment."""
+    rows = []
+    matched = added = cells = stale = 0
+    for row in source_rows:
+        if not is_data_row(row):
+            rows.append(list(row))
+            continue
+        matches = [match for match in (f.take(row) for f in files) if match is not None]
+        if matches:
+            matched += 1
+        else:
+            added += 1
+        aligned = list(row)
+        for idx in TRANSLATED_INDEXES:
+            text = row[idx]
+            if not text or text == '-':
+                continue
+            for old_row, old_source in matches:
+                old_text = old_row[idx]
+                if not old_text or old_text == '-' or old_text == text:
+                    continue
+                if old_source is not None and old_source[idx] != text:
+                    # Translated from since-edited text; a later file can
+                    # only be older still
+                    stale += 1
+                    break
+                aligned[idx] = old_text
+                cells += 1
+                break
+        rows.append(aligned)
+    dropped = files[0].remaining() if files else 0
+    return Alignment(rows, matched, added, dropped, cells, stale)
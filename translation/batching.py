@@ -0,0 +1,174 @@
+"""
+Multi-cell batched prompts for the OpenAI translation scripts.
+
+Instead of one request per cell (each repeating the whole system prompt),
+cells are packed into batches up to a prompt-token budget and sent as one
+indexed JSON array. The reply must be a JSON array with one entry per
+index; if it is not, the batch is split in half and retried, down to one
+cell per request.
+
+Token counts are estimates (about four characters per token), which is
+close enough for packing and for the end-of-run savings report.
+"""
+
+import json
+import re
+
+CHARS_PER_TOKEN = 4
+# Per-item cost of the {"i": n, "text": ...} wrapper in the batch payload
+ITEM_OVERHEAD_TOKENS = 8
+
+_FENCE = re.compile(r'^```(?:json)?\s*|\s*```$')
+
+
+class BatchError(ValueError):
+    """A batch reply that does not hold exactly one translation per index."""
+
+
+def estimate_tokens(text):
+    """Rough token count for text."""
+    return len(text) // CHARS_PER_TOKEN + 1
+
+
+def pack(texts, budget, max_items=None):
+    """Split texts, in order, into batches of at most budget estimated tokens.
+
+    A text larger than the budget gets a batch of its own.
+    """
+    batches = []
+    batch = []
+    used = 0
+    for text in texts:
+        cost = estimate_tokens(text) + ITEM_OVERHEAD_TOKENS
+        full = max_items is not None and len(batch) >= max_items
+        if batch and (used + cost > budget or full):
+            batches.append(batch)
+            batch = []
+            used = 0
+        batch.append(text)
+        used += cost
+    if batch:
+        batches.append(batch)
+    return batches
+
+
+def batch_payload(texts):
+    """The indexed JSON array sent to the model."""
+    return json.dumps([{'i': i, 'text': text} for i, text in enumerate(texts)], ensure_ascii=False)
+
+
+def parse_reply(content, count):
+    """Return the count translations of a batch reply, in index order.
+
+    Raises BatchError if the reply is not a JSON array of {"i", "text"}
+    objects covering every index exactly once.
+    """
+    try:
+        items = json.loads(_FENCE.sub('', content.strip()))
+    except (TypeError, ValueError) as e:
+        raise BatchError(f'reply is not JSON: {e}')
+    if not isinstance(items, list) or len(items) != count:
+        raise BatchError(f'expected a JSON array of {count} items')
+    translations = [None] * count
+    for item in items:
+        if not isinstance(item, dict) or not isinstance(item.get('text'), str):
+            raise BatchError('array items must be {"i": n, "text": "..."} objects')
+        index = item.get('i')
+        if not isinstance(index, int) or not 0 <= index < count or translations[index] is not None:
+            raise BatchError(f'bad or repeated index {index!r}')
+        translations[index] = item['text']
+    return translations
+
+
+class BatchStats:
+    """Requests and estimated prompt tokens used, against one request per cell.
+
+    single_overhead and batch_overhead are the estimated prompt tokens of a
+    request besides the cell text(s): system prompt and instructions.
+    """
+
+    def __init__(self, single_overhead, batch_overhead):
+        self.single_overhead = single_overhead
+        self.batch_overhead = batch_overhead
+        self.cells = 0
+        self.requests = 0
+        self.splits = 0
+        self.prompt_tokens = 0
+        self.baseline_tokens = 0
+
+    def single_tokens(self, text):
+        return self.single_overhead + estimate_tokens(text)
+
+    def batch_tokens(self, texts):
+        return self.batch_overhead + sum(estimate_tokens(text) + ITEM_OVERHEAD_TOKENS for text in texts)
+
+    def add_cells(self, texts):
+        self.cells += len(texts)
+        self.baseline_tokens += sum(self.single_tokens(text) for text in texts)
+
+    def add_request(self, texts):
+        self.requests += 1
+        if len(texts) == 1:
+            self.prompt_tokens += self.single_tokens(texts[0])
+        else:
+            self.prompt_tokens += self.batch_tokens(texts)
+
+    @property
+    def saved_requests(self):
+        return self.cells - self.requests
+
+    @property
+    def saved_tokens(self):
+        return self.baseline_tokens - self.prompt_tokens
+
+    def summary(self):
+        """One-line savings summary for the end-of-run report."""
+        return (f"{self.cells} cells in {self.requests} requests "
+                f"({self.saved_requests} requests and ~{self.saved_tokens:,} prompt tokens saved, "
+                f"{self.splits} batches split)")
+
+
+def translate_batch(texts, request, single, stats, on_reply=None):
+    """Translate texts with one batched request, splitting on bad replies.
+
+    request(texts) sends one batch and returns the reply content; single(text)
+    translates one cell the ordinary way. on_reply(texts, translations), if
+    given, is called for every batch the model answered correctly (not for
+    single-cell fallbacks). Returns translations in order.
+    """
+    if len(texts) == 1:
+        stats.add_request(texts)
+        return [single(texts[0])]
+    stats.add_request(texts)
+    try:
+        translations = parse_reply(request(texts), len(texts))
+    except Exception as e:
+        print(f"    ⚠️  Batch of {len(texts)} cells failed ({str(e)[:80]}), splitting...")
+    else:
+        if on_reply is not None:
+            on_reply(texts, translations)
+        return translations
+    stats.splits += 1
+    middle = len(texts) // 2
+    return (translate_batch(texts[:middle], request, single, stats, on_reply)
+            + translate_batch(texts[middle:], request, single, stats, on_reply))
+
+
+async def translate_batch_async(texts, request, single, stats, on_reply=None):
+    """translate_batch() with coroutine request and single functions."""
+    if len(texts) == 1:
+        stats.add_request(texts)
+        return [await single(texts[0])]
+    stats.add_request(texts)
+    try:
+        translations = parse_reply(await request(texts), len(texts))
+    except Exception as e:
+        print(f"    ⚠️  Batch of {len(texts)} cells failed ({str(e)[:80]}), splitting...")
+    else:
+        if on_reply is not None:
+            on_reply(texts, translations)
+        return translations
+    stats.splits += 1
+    middle = len(texts) // 2
+    return (await translate_batch_async(texts[:middle], request, single, stats, on_reply)
+            + await translate_batch_async(texts[middle:], request, single, stats, on_reply))
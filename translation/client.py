@@ -0,0 +1,65 @@
+"""
+Lazily created OpenAI clients for the translation scripts.
+
+Importing a script must not need credentials or the OpenAI SDK: the .env
+files are read, the key is looked up and the SDK is imported only when
+the first API request is about to be sent. Runs that resolve every cell
+from rules or the translation memory never touch any of it.
+"""
+
+import asyncio
+import os
+
+KEY_VARIABLES = ('OPENAI_API_KEY', 'OPENAI_KEY', 'OAI_API_KEY')
+
+
+def find_api_key(explicit=None):
+    """Return the API key from explicit, .env.local/.env or the environment, or None."""
+    if explicit:
+        return explicit
+    from dotenv import load_dotenv
+    load_dotenv('.env.local')
+    load_dotenv('.env')
+    for name in KEY_VARIABLES:
+        if os.getenv(name):
+            return os.getenv(name)
+    return None
+
+
+class Clients:
+    """The OpenAI and AsyncOpenAI clients of one script, created on first use.
+
+    missing_key() is called (and is expected to exit) if a client is needed
+    and no key can be found. Set api_key to use a key given on the command
+    line. The SDK's own retries are off: the scripts retry through their
+    rate limiter, which honours Retry-After for every caller at once.
+    """
+
+    def __init__(self, missing_key):
+        self.missing_key = missing_key
+        self.api_key = None
+        self._client = None
+        self._async_client = None
+        self._async_loop = None
+
+    def _key(self):
+        key = find_api_key(self.api_key)
+        if not key:
+            self.missing_key()
+        return key
+
+    def get(self):
+        if self._client is None:
+            from openai import OpenAI
+            self._client = OpenAI(api_key=self._key(), max_retries=0)
+        return self._client
+
+    def get_async(self):
+        # One client per event loop: its pooled connections belong to the
+        # loop they were opened on, and every asyncio.run() starts a new one
+        loop = asyncio.get_running_loop()
+        if self._async_client is None or self._async_loop is not loop:
+            from openai import AsyncOpenAI
+            self._async_client = AsyncOpenAI(api_key=self._key(), max_retries=0)
+            self._async_loop = loop
+        return self._async_client
@@ -0,0 +1,176 @@
+"""
+Incremental translation: only the catalog rows that changed since the last run.
+
+A run in this mode keeps a snapshot of the source catalog next to the
+output (snapshot_path()). On the next run, the source is diffed against
+that snapshot row by row, and rows are matched by identity:
+  - name_sv plus the row's parsed dose values (translation/dosing.py)
+  - numbered in file order when repeated, the way row_identities() numbers
+    names
+Rows whose identity is new are added. Rows whose cells differ from the
+snapshot are changed. Identities missing from the source are removed.
+Only added and changed rows go through the pipeline; every other row is
+taken from the previous output as it is. Neither name_sv nor the dose
+columns are translated, so output rows have the same identities as their
+source rows. A cell the model stage leaves untranslated (its API call
+failed) is blanked in the snapshot, so the next run sees its row as
+changed and translates it again.
+
+The delta file lists what changed for the database loader
+(load_supplements.py): the translated row of each added or changed row,
+with op 'upsert', and the last output row of each removed row, with op
+'delete'. Each row also carries its identity's occurrence number.
+"""
+
+import os
+from collections import Counter, namedtuple
+
+from translation.dosing import BASE_COLUMN, MAX_COLUMN, row_dosing
+from translation.pipeline import COLUMN_INDEX, COLUMNS, is_data_row, read_rows, write_rows
+
+OP_UPSERT = 'upsert'
+OP_DELETE = 'delete'
+# Columns the delta file adds after the catalog columns
+DELTA_COLUMNS = ['op', 'occurrence']
+
+# Identities of the rows of a diff, each list in file order
+Delta = namedtuple('Delta', ['added', 'changed', 'removed', 'unchanged'])
+
+
+def snapshot_path(output_path):
+    """Where the source snapshot of output_path's last run goes."""
+    return output_path + '.source'
+
+
+def delta_identities(rows):
+    """Return an identity for each data row (None for other rows).
+
+    An identity is (name_sv, dosing base, dosing max, unit, occurrence);
+    occurrence numbers rows with the same values from 1, in file order.
+    """
+    base_idx = COLUMN_INDEX[BASE_COLUMN]
+    max_idx = COLUMN_INDEX[MAX_COLUMN]
+    dosings = {}
+    seen = Counter()
+    identities = []
+    for row in rows:
+        if not is_data_row(row):
+            identities.append(None)
+            continue
+        doses = (row[base_idx], row[max_idx])
+        dosing = dosings.get(doses)
+        if dosing is None:
+            dosing = dosings[doses] = row_dosing(*doses)
+        key = (row[0],) + tuple(dosing)
+        seen[key] += 1
+        identities.append(key + (seen[key],))
+    return identities
+
+
+def _by_identity(rows):
+    return {identity: row for identity, row in zip(delta_identities(rows), rows) if identity is not None}
+
+
+def diff(old_rows, new_rows):
+    """Compare two versions of the source catalog; returns a Delta."""
+    old = _by_identity(old_rows)
+    added, changed, unchanged = [], [], []
+    new_identities = delta_identities(new_rows)
+    for identity, row in zip(new_identities, new_rows):
+        if identity is None:
+            continue
+        if identity not in old:
+            added.append(identity)
+        elif old[identity] != row:
+            changed.append(identity)
+        else:
+            unchanged.append(identity)
+    present = set(new_identities)
+    removed = [identity for identity in old if identity not in present]
+    return Delta(added, changed, removed, unchanged)
+
+
+def write_snapshot(output_path, source_rows, failed=()):
+    """Write source_rows as the snapshot of output_path.
+
+    failed lists the (row index, column) of cells the model stage left
+    untranslated; they are blanked, as no output cell was made from them.
+    """
+    rows = [list(row) for row in source_rows]
+    for row_idx, column in failed:
+        rows[row_idx][COLUMN_INDEX[column]] = ''
+    write_rows(snapshot_path(output_path), rows)
+
+
+def translate_rows(pipeline, rows):
+    """Translate rows in place, each distinct (column, text) once.
+
+    Returns the (row index, column) of every cell left as it was although
+    the model stage takes it, i.e. whose API call failed.
+    """
+    failed = []
+    for (column, text), row_indexes in pipeline.plan(rows).items():
+        translated, stage_name = pipeline.resolve(text, column)
+        pipeline.fan_out(rows, column, row_indexes, translated)
+        if stage_name == 'unchanged' and pipeline.reaches(text, column, 'llm'):
+            failed.extend((row_idx, column) for row_idx in row_indexes)
+    return failed
+
+
+def translate_delta(pipeline, source_path, output_path, delta_path=None):
+    """Bring output_path up to date with source_path; returns the Delta.
+
+    Without a snapshot (or an output) from an earlier run, every row is
+    added. The output, the snapshot and the delta file are written once
+    all rows are translated; an interrupted run writes nothing.
+    """
+    source_rows = read_rows(source_path)
+    snapshot = snapshot_path(output_path)
+    old_source = []
+    old_output = []
+    if os.path.exists(snapshot) and os.path.exists(output_path):
+        old_source = read_rows(snapshot)
+        old_output = read_rows(output_path)
+    delta = diff(old_source, source_rows)
+    previous = _by_identity(old_output)
+    # An unchanged row the old output lacks is translated again
+    stale = [identity for identity in delta.unchanged if identity not in previous]
+    if stale:
+        stale_set = set(stale)
+        delta = delta._replace(changed=delta.changed + stale,
+                               unchanged=[identity for identity in delta.unchanged if identity not in stale_set])
+
+    reuse = set(delta.unchanged)
+    rows = []
+    pending = []
+    pending_indexes = []
+    for identity, row in zip(delta_identities(source_rows), source_rows):
+        if identity in reuse:
+            rows.append(list(previous[identity]))
+        else:
+            rows.append(list(row))
+            if identity is not None:
+                pending.append(rows[-1])
+                pending_indexes.append(len(rows) - 1)
+    failed = translate_rows(pipeline, pending)
+
+    write_rows(output_path, rows)
+    write_snapshot(output_path, source_rows,
+                   [(pending_indexes[pending_idx], column) for pending_idx, column in failed])
+    if delta_path:
+        write_delta(delta_path, delta, rows, old_output or old_source)
+    return delta
+
+
+def write_delta(path, delta, rows, old_rows):
+    """Write the upserts (from rows) and deletes (from old_rows) of delta to path."""
+    upserts = set(delta.added) | set(delta.changed)
+    records = [COLUMNS + DELTA_COLUMNS]
+    for identity, row in zip(delta_identities(rows), rows):
+        if identity in upserts:
+            records.append(row[:len(COLUMNS)] + [OP_UPSERT, identity[-1]])
+    removed = set(delta.removed)
+    for identity, row in zip(delta_identities(old_rows), old_rows):
+        if identity in removed:
+            records.append(row[:len(COLUMNS)] + [OP_DELETE, identity[-1]])
+    write_rows(path, records)
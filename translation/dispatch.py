@@ -0,0 +1,92 @@
+"""
+Bounded-concurrency dispatcher for async translation requests.
+
+dispatch() runs an async worker over a list or iterator of items with at
+most `concurrency` requests in flight and hands results back in input
+order, so callers can checkpoint a clean prefix of the work. The first Ctrl-C stops
+new requests and drains the ones in flight; a second Ctrl-C cancels them.
+"""
+
+import asyncio
+import signal
+
+
+async def dispatch(items, worker, concurrency, on_result, window=None):
+    """Run worker(item) for every item with bounded concurrency.
+
+    on_result(index, item, result, error) is called in input order; error is
+    the exception the worker raised, if any (result is then None). Returns
+    True if the run was interrupted.
+
+    Items are pulled from the iterable as they are launched. With window set,
+    at most that many items are held between launch and delivery, so a
+    stream of any length is processed in bounded memory; a slow item then
+    holds back launches until it is delivered.
+    """
+    items = iter(items)
+    exhausted = False
+    pending = {}  # item index -> item, until delivered
+    loop = asyncio.get_running_loop()
+    stop = asyncio.Event()
+    in_flight = {}  # task -> item index
+    finished = {}
+    launched = 0
+    delivered = 0
+
+    def on_sigint():
+        if stop.is_set():
+            print("\n⚠️  Second interrupt - cancelling requests in flight...")
+            for task in in_flight:
+                task.cancel()
+        else:
+            print(f"\n⚠️  Interrupted - finishing {len(in_flight)} request(s) in flight, then saving...")
+            stop.set()
+
+    try:
+        loop.add_signal_handler(signal.SIGINT, on_sigint)
+        handles_sigint = True
+    except (NotImplementedError, RuntimeError):
+        # Not available on this platform or outside the main thread
+        handles_sigint = False
+
+    stop_waiter = asyncio.ensure_future(stop.wait())
+    try:
+        while True:
+            while not exhausted and len(in_flight) < concurrency and not stop.is_set() \
+                    and (window is None or launched - delivered < window):
+                try:
+                    item = next(items)
+                except StopIteration:
+                    exhausted = True
+                    break
+                pending[launched] = item
+                in_flight[asyncio.ensure_future(worker(item))] = launched
+                launched += 1
+            if not in_flight:
+                break
+
+            # Once stopping, only the requests in flight are waited on
+            waiting = set(in_flight) if stop.is_set() else set(in_flight) | {stop_waiter}
+            done, _ = await asyncio.wait(waiting, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task is stop_waiter:
+                    continue
+                index = in_flight.pop(task)
+                if task.cancelled():
+                    finished[index] = (None, asyncio.CancelledError())
+                elif task.exception() is not None:
+                    finished[index] = (None, task.exception())
+                else:
+                    finished[index] = (task.result(), None)
+
+            # Deliver the completed prefix in input order
+            while delivered in finished:
+                result, error = finished.pop(delivered)
+                on_result(delivered, pending.pop(delivered), result, error)
+                delivered += 1
+    finally:
+        stop_waiter.cancel()
+        if handles_sigint:
+            loop.remove_signal_handler(signal.SIGINT)
+
+    return stop.is_set()
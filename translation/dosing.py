@@ -0,0 +1,215 @@
+"""
+Numeric dosing values parsed from the catalog's dose columns.
+
+dosing_base_g_mg and dosing_max_g_mg hold strings such as '500 mg',
+'1.5 g', '10 Mrd' or 'Varierar'. The supplements table stores
+dosing_base_val and dosing_max_val as NUMERIC plus a unit_type enum (see
+complete_schema.sql), so the strings are parsed here once, at ETL time,
+instead of by every consumer.
+
+Each distinct cell is parsed once with one compiled pattern: the columns
+come from translation/columnar.py, where a column's distinct values are
+its categories. A row's values are then normalized once per distinct
+(base, max) pair:
+  - a range ('100-200 mg') gives its low end as the base and its high
+    end as the max
+  - units are mapped to unit_type; 'Mrd'/'M'/'B' counts of bacteria are
+    CFU
+  - mass units that differ between the two columns are converted to the
+    base column's unit
+Empty cells ('', '-', 'N/A') give NULL values. Cells that cannot be
+parsed, or units outside unit_type (e.g. 'tsk', 'koppar', 'SPK'), go to
+the reject report instead, and the row gets NULL values.
+"""
+
+import csv
+import os
+import re
+from collections import namedtuple
+from decimal import Decimal
+
+BASE_COLUMN = 'dosing_base_g_mg'
+MAX_COLUMN = 'dosing_max_g_mg'
+
+# Unit spellings -> unit_type values ('mg', 'g', 'IU', 'mcg', 'ml', 'tabs', 'caps', 'cfu')
+UNIT_ALIASES = {
+    'mg': 'mg', 'g': 'g', 'gram': 'g', 'mcg': 'mcg', 'µg': 'mcg', 'ug': 'mcg',
+    'iu': 'IU', 'ie': 'IU', 'ml': 'ml', 'tabs': 'tabs', 'tabletter': 'tabs',
+    'caps': 'caps', 'kapslar': 'caps', 'cfu': 'cfu',
+}
+# Counts written as '10 Mrd' or '100M CFU' are colony-forming units
+COUNT_SCALES = {'mrd': Decimal(10) ** 9, 'mdr': Decimal(10) ** 9, 'b': Decimal(10) ** 9,
+                'm': Decimal(10) ** 6}
+MASS_IN_MG = {'mcg': Decimal('0.001'), 'mg': Decimal(1), 'g': Decimal(1000)}
+EMPTY = {'', '-', 'n/a'}
+# A row identity (delta_identities() in translation/delta.py) as CSV fields
+IDENTITY_COLUMNS = ['name_sv', 'dosing_base_val', 'dosing_max_val', 'unit', 'occurrence']
+
+DOSE_PATTERN = re.compile(
+    r'(?P<low>\d+(?:[.,]\d+)?)'
+    r'(?:\s*(?:-|–)\s*(?P<high>\d+(?:[.,]\d+)?))?'
+    r'\s*(?:(?P<scale>mrd|mdr|b|m)\b)?'
+    r'\s*(?P<unit>[a-zµ]+)?',
+    re.IGNORECASE)
+
+# One parsed cell; high equals low unless the cell is a range
+Dose = namedtuple('Dose', ['low', 'high', 'unit'])
+# One row's values for the supplements table; None is NULL
+Dosing = namedtuple('Dosing', ['base', 'max', 'unit'])
+
+
+def _number(text):
+    return Decimal(text.replace(',', '.'))
+
+
+def parse_dose(text):
+    """Parse one dose cell into a Dose; None for an empty cell.
+
+    Raises ValueError with the reason when the cell cannot be parsed.
+    """
+    text = text.strip()
+    if text.lower() in EMPTY:
+        return None
+    match = DOSE_PATTERN.fullmatch(text)
+    if match is None:
+        raise ValueError('not a number and unit')
+    low = _number(match['low'])
+    high = _number(match['high']) if match['high'] else low
+    if high < low:
+        raise ValueError('range ends below its start')
+    unit = match['unit']
+    scale = match['scale']
+    if scale:
+        if unit and unit.lower() != 'cfu':
+            raise ValueError(f"count of unknown unit '{unit}'")
+        factor = COUNT_SCALES[scale.lower()]
+        return Dose(low * factor, high * factor, 'cfu')
+    if not unit:
+        raise ValueError('no unit')
+    normalized = UNIT_ALIASES.get(unit.lower())
+    if normalized is None:
+        raise ValueError(f"unit '{unit}' is not a unit_type")
+    return Dose(low, high, normalized)
+
+
+def combine(base, maximum):
+    """Dosing for a row from its parsed base and max cells (Dose or None).
+
+    Raises ValueError when the two units cannot be reconciled.
+    """
+    if base is None and maximum is None:
+        return Dosing(None, None, None)
+    if base is None:
+        return Dosing(None, maximum.high, maximum.unit)
+    if maximum is None:
+        return Dosing(base.low, base.high if base.high != base.low else None, base.unit)
+    high = maximum.high
+    if maximum.unit != base.unit:
+        if base.unit not in MASS_IN_MG or maximum.unit not in MASS_IN_MG:
+            raise ValueError(f"units differ ({base.unit}, {maximum.unit})")
+        high = high * MASS_IN_MG[maximum.unit] / MASS_IN_MG[base.unit]
+    return Dosing(base.low, high, base.unit)
+
+
+def row_dosing(base_text, max_text):
+    """Dosing for one row's two dose cells; NULL values if they are rejected."""
+    try:
+        return combine(parse_dose(base_text), parse_dose(max_text))
+    except ValueError:
+        return Dosing(None, None, None)
+
+
+def format_value(value):
+    """A NUMERIC literal without exponent or trailing zeros; '' for NULL."""
+    return '' if value is None else format(value.normalize(), 'f')
+
+
+def identity_fields(identity):
+    """The IDENTITY_COLUMNS fields of a row identity."""
+    name, base, maximum, unit, occurrence = identity
+    return [name, format_value(base), format_value(maximum), unit or '', str(occurrence)]
+
+
+def parse_column(column):
+    """Parse a Categorical dose column once per category.
+
+    Returns (doses, errors): doses[code] is the Dose or None, errors maps
+    a code to its reason for the categories that failed.
+    """
+    doses = []
+    errors = {}
+    for code, text in enumerate(column.categories):
+        try:
+            doses.append(parse_dose(text))
+        except ValueError as e:
+            doses.append(None)
+            errors[code] = str(e)
+    return doses, errors
+
+
+def table_dosing(table):
+    """Dosing per data row of a ColumnTable, and the reject report.
+
+    Returns (dosings, rejects): one Dosing per data row, and one
+    (data row index, column, value, reason) per rejected cell or row.
+    """
+    base_column = table.columns[BASE_COLUMN]
+    max_column = table.columns[MAX_COLUMN]
+    base_doses, base_errors = parse_column(base_column)
+    max_doses, max_errors = parse_column(max_column)
+    empty = Dosing(None, None, None)
+    combined = {}  # (base code, max code) -> (Dosing, reason)
+    dosings = []
+    rejects = []
+    for idx, pair in enumerate(zip(base_column.codes, max_column.codes)):
+        base_code, max_code = pair
+        if base_code in base_errors or max_code in max_errors:
+            if base_code in base_errors:
+                rejects.append((idx, BASE_COLUMN, base_column.categories[base_code], base_errors[base_code]))
+            if max_code in max_errors:
+                rejects.append((idx, MAX_COLUMN, max_column.categories[max_code], max_errors[max_code]))
+            dosings.append(empty)
+            continue
+        result = combined.get(pair)
+        if result is None:
+            try:
+                result = combined[pair] = (combine(base_doses[base_code], max_doses[max_code]), None)
+            except ValueError as e:
+                result = combined[pair] = (empty, str(e))
+        dosing, reason = result
+        if reason is not None:
+            value = f'{base_column.categories[base_code]} / {max_column.categories[max_code]}'
+            rejects.append((idx, f'{BASE_COLUMN}+{MAX_COLUMN}', value, reason))
+        dosings.append(dosing)
+    return dosings, rejects
+
+
+def rejects_path(path):
+    """Where the reject report for dosing file path goes."""
+    root, ext = os.path.splitext(path)
+    return f'{root}.rejects{ext or ".csv"}'
+
+
+def _write_csv(path, header, records):
+    temp_file = path + '.tmp'
+    with open(temp_file, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(header)
+        writer.writerows(records)
+    os.replace(temp_file, path)
+
+
+def write_dosing(table, path, reject_path=None):
+    """Write the table's dosing values to path and its rejects to reject_path.
+
+    Each row is written as its identity: name_sv, the dosing values and
+    the occurrence number, the key load_supplements.py matches supplements
+    by. Returns (rows written, rejected cells).
+    """
+    _, rejects = table_dosing(table)
+    identities = table.identities()
+    _write_csv(path, IDENTITY_COLUMNS, (identity_fields(identity) for identity in identities))
+    _write_csv(reject_path or rejects_path(path), IDENTITY_COLUMNS + ['column', 'value', 'reason'],
+               (identity_fields(identities[idx]) + [column, value, reason]
+                for idx, column, value, reason in rejects))
+    return len(identities), len(rejects)
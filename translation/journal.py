@@ -0,0 +1,101 @@
+"""
+Append-only checkpoint journal for translation runs.
+
+Instead of rewriting the whole output CSV at every checkpoint, each
+translated value is appended to a journal next to it as one JSON line:
+the row indexes it fans out to, the column, a hash of the source text and
+the translation. The journal is fsynced in batches, compacted into the CSV
+once at the end of the run and then removed. A run that finds a journal
+replays it first, so an interrupted or crashed run resumes where it
+stopped.
+
+Records only apply where the cell still holds the source they were made
+from, so replaying a journal twice, or onto a file that changed since, is
+harmless.
+"""
+
+import hashlib
+import json
+import os
+
+from translation.pipeline import COLUMN_INDEX
+
+
+def journal_path(output_path):
+    return output_path + '.journal'
+
+
+def source_hash(text):
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()[:16]
+
+
+class Journal:
+    """Appends translation records, fsyncing every sync_every records.
+
+    The file is opened on the first append.
+    """
+
+    def __init__(self, path, sync_every=10):
+        self.path = path
+        self.sync_every = sync_every
+        self.pending = 0
+        self.records = 0
+        self._file = None
+
+    def append(self, row_indexes, column, source, translated):
+        """Record that column of row_indexes changed from source to translated."""
+        if self._file is None:
+            self._file = open(self.path, 'a', encoding='utf-8')
+        record = {'rows': list(row_indexes), 'column': column, 'source': source_hash(source),
+                  'text': translated}
+        self._file.write(json.dumps(record, ensure_ascii=False) + '\n')
+        self.records += 1
+        self.pending += 1
+        if self.pending >= self.sync_every:
+            self.sync()
+
+    def sync(self):
+        """Flush and fsync the records appended since the last sync."""
+        if self._file is None or not self.pending:
+            return
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self.pending = 0
+
+    def close(self):
+        if self._file is not None:
+            self.sync()
+            self._file.close()
+            self._file = None
+
+    def replay(self, rows, on_restore=None):
+        """Apply the journal's records to rows; returns the number of cells restored.
+
+        on_restore(row_index, column, source_hash, text), if given, is called
+        for every restored cell. A torn last line (a crash mid-write) is
+        skipped.
+        """
+        if not os.path.exists(self.path):
+            return 0
+        restored = 0
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                idx = COLUMN_INDEX[record['column']]
+                for row_idx in record['rows']:
+                    if row_idx < len(rows) and idx < len(rows[row_idx]) \
+                            and source_hash(rows[row_idx][idx]) == record['source']:
+                        rows[row_idx][idx] = record['text']
+                        restored += 1
+                        if on_restore is not None:
+                            on_restore(row_idx, record['column'], record['source'], record['text'])
+        return restored
+
+    def discard(self):
+        """Remove the journal once its records are compacted into the output file."""
+        self.close()
+        if os.path.exists(self.path):
+            os.remove(self.path)
@@ -0,0 +1,141 @@
+"""
+Character n-gram scores for telling Swedish from English catalog text.
+
+The indicator detector in translation/swedish.py flags a cell on any
+substring hit. Its list holds one- and two-letter words and English terms,
+so nearly every English cell is flagged and sent to the API. This model
+is trained on the catalog itself: the Swedish source cells against their
+English translations in supplements-english.csv, using only the cells
+whose translation differs from the source. It scores each cell with a
+naive Bayes log-likelihood ratio over character 1- to 4-grams.
+
+The scripts use it as a second opinion. A cell goes to the API only if
+the indicators flag it and the model's confidence that it is Swedish
+reaches the threshold. Without enough translated cells to train on,
+from_files() returns None and the indicators decide alone.
+"""
+
+import math
+from collections import Counter
+
+from translation.pipeline import COLUMN_INDEX, is_data_row, read_rows, row_identities
+
+NGRAM_SIZES = (1, 2, 3, 4)
+SMOOTHING = 0.5
+# Missing a Swedish cell leaves it untranslated, while a false alarm costs
+# one API call, so the default leans towards sending. Naive Bayes
+# confidences are extreme: on the catalog, no translated English cell
+# scores above 0.05.
+DEFAULT_THRESHOLD = 0.1
+# Fewer translated cells than this is not enough to train on
+MIN_TRAINING_PAIRS = 50
+TRAINING_COLUMNS = ['dosing_notes', 'bioavailability_notes', 'interaction_risk']
+
+
+def ngrams(text):
+    """Character n-grams of the lower-cased text, padded with a space at each end."""
+    padded = f' {text.lower()} '
+    for n in NGRAM_SIZES:
+        for i in range(len(padded) - n + 1):
+            yield padded[i:i + n]
+
+
+def training_pairs(source_rows, translated_rows, columns=TRAINING_COLUMNS):
+    """(Swedish, English) cell pairs of rows matched by identity whose text was translated."""
+    translated = {identity: row for identity, row in zip(row_identities(translated_rows), translated_rows)
+                  if identity is not None}
+    pairs = []
+    for identity, row in zip(row_identities(source_rows), source_rows):
+        other = translated.get(identity)
+        if other is None:
+            continue
+        for column in columns:
+            idx = COLUMN_INDEX[column]
+            if row[idx] and row[idx] != '-' and row[idx] != other[idx]:
+                pairs.append((row[idx], other[idx]))
+    return pairs
+
+
+class NgramDetector:
+    """Naive Bayes Swedish/English scorer over character n-grams.
+
+    confidence(text) is the probability that text is Swedish. Scores are
+    cached per text, so scoring a column with many repeated values costs
+    one pass per distinct value. `overruled` holds the distinct texts
+    filter() kept from the API.
+    """
+
+    def __init__(self, swedish_texts, english_texts, threshold=DEFAULT_THRESHOLD):
+        # Both are lists of cell texts
+        self.threshold = threshold
+        swedish = Counter(gram for text in swedish_texts for gram in ngrams(text))
+        english = Counter(gram for text in english_texts for gram in ngrams(text))
+        vocabulary = len(swedish.keys() | english.keys())
+        swedish_total = sum(swedish.values()) + SMOOTHING * vocabulary
+        english_total = sum(english.values()) + SMOOTHING * vocabulary
+        # Per-gram log P(gram | Swedish) - log P(gram | English)
+        self.weights = {
+            gram: math.log((swedish[gram] + SMOOTHING) / swedish_total)
+            - math.log((english[gram] + SMOOTHING) / english_total)
+            for gram in swedish.keys() | english.keys()
+        }
+        self.unseen = math.log(english_total / swedish_total)
+        self.training_cells = len(swedish_texts)
+        self.overruled = set()
+        self._cache = {}
+
+    @classmethod
+    def from_files(cls, source_path, translated_path, threshold=DEFAULT_THRESHOLD):
+        """Train on a source CSV and its translation; None if they share too few translated cells."""
+        try:
+            source_rows = read_rows(source_path)
+            translated_rows = read_rows(translated_path)
+        except FileNotFoundError:
+            return None
+        return cls.from_rows(source_rows, translated_rows, threshold)
+
+    @classmethod
+    def from_rows(cls, source_rows, translated_rows, threshold=DEFAULT_THRESHOLD):
+        """from_files() on rows already read."""
+        source_rows = [row for row in source_rows if is_data_row(row)]
+        translated_rows = [row for row in translated_rows if is_data_row(row)]
+        pairs = training_pairs(source_rows, translated_rows)
+        if len(pairs) < MIN_TRAINING_PAIRS:
+            return None
+        return cls([sv for sv, _ in pairs], [en for _, en in pairs], threshold)
+
+    def log_ratio(self, text):
+        """log P(text | Swedish) - log P(text | English)."""
+        weights = self.weights
+        unseen = self.unseen
+        return sum(weights.get(gram, unseen) for gram in ngrams(text))
+
+    def confidence(self, text):
+        """Probability (0-1) that text is Swedish; 0 for empty and '-' cells."""
+        score = self._cache.get(text)
+        if score is None:
+            if not text or text == '-' or not text.strip():
+                score = 0.0
+            else:
+                # Clamped so exp() cannot overflow on long cells
+                score = 1 / (1 + math.exp(-max(-50.0, min(50.0, self.log_ratio(text)))))
+            self._cache[text] = score
+        return score
+
+    def scores(self, texts):
+        """Confidence for every text of a column, in order."""
+        return [self.confidence(text) for text in texts]
+
+    def is_swedish(self, text):
+        return self.confidence(text) >= self.threshold
+
+    def filter(self, text, hits):
+        """Return hits if the model agrees text is Swedish, otherwise []."""
+        if hits and not self.is_swedish(text):
+            self.overruled.add(text)
+            return []
+        return hits
+
+    def summary(self):
+        return (f"{len(self.overruled)} distinct flagged values judged English and not sent "
+                f"(threshold {self.threshold:.2f}, trained on {self.training_cells} translated cells)")
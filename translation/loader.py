@@ -0,0 +1,250 @@
+"""
+Bulk load of a translated catalog CSV into the supplements table.
+
+scripts/import-supplements.ts inserts the catalog through the API a batch
+of rows at a time and parses every cell again on the way. Here the CSV is
+turned into one COPY ... FROM STDIN stream into a temporary staging
+table. One UPDATE and one INSERT then upsert the staged rows into
+supplements, all in a single transaction. Values are mapped to the
+schema's types (complete_schema.sql) once per distinct cell, through the
+dictionary-encoded columns of translation/columnar.py:
+  - research_status and interaction_risk_level to their enums
+  - category_links ('1; 6') to category_ids INT[]
+  - is_base_health to BOOLEAN
+  - the dose columns to dosing_base_val, dosing_max_val and unit, through
+    translation/dosing.py
+
+Rows are matched by identity: name_sv plus the parsed dose values,
+numbered when repeated (delta_identities() in translation/delta.py). The
+n-th row with an identity updates the n-th supplement with those values,
+oldest first. Rows without a match are inserted. A delta file from an
+incremental run carries an op ('upsert' or 'delete') and the occurrence
+number with each row; matched 'delete' rows are deleted.
+
+load() needs psycopg (3); script() writes the same load as a psql script.
+"""
+
+from translation.delta import DELTA_COLUMNS, OP_DELETE, OP_UPSERT
+from translation.dosing import format_value, table_dosing
+from translation.pipeline import RISK_MAP, STATUS_MAP
+
+# Enum values in complete_schema.sql
+RESEARCH_STATUSES = ('Green', 'Blue', 'Yellow', 'Red')
+RISK_LEVELS = ('Low', 'Medium', 'High')
+BOOLEANS = {'true': 't', 'false': 'f'}
+
+STAGING_TABLE = 'supplements_staging'
+STAGING_COLUMNS = [
+    'ord', 'op', 'occurrence', 'name_sv', 'name_en', 'research_status', 'dosing_base_val', 'dosing_max_val', 'unit',
+    'dosing_notes', 'bioavailability_notes', 'interaction_risk_text', 'interaction_risk_level',
+    'is_base_health', 'category_ids',
+]
+# The staged columns written to supplements
+TARGET_COLUMNS = STAGING_COLUMNS[3:]
+
+CREATE_STAGING = f"""
+CREATE TEMP TABLE {STAGING_TABLE} (
+    ord INT NOT NULL,
+    op TEXT NOT NULL,
+    occurrence INT NOT NULL,
+    name_sv TEXT,
+    name_en TEXT NOT NULL,
+    research_status research_status_type,
+    dosing_base_val NUMERIC,
+    dosing_max_val NUMERIC,
+    unit unit_type,
+    dosing_notes TEXT,
+    bioavailability_notes TEXT,
+    interaction_risk_text TEXT,
+    interaction_risk_level risk_level_type,
+    is_base_health BOOLEAN,
+    category_ids INT[]
+) ON COMMIT DROP;
+"""
+
+COPY_STAGING = f"COPY {STAGING_TABLE} ({', '.join(STAGING_COLUMNS)}) FROM STDIN"
+
+# Pairs every staged row with the id of the supplement it updates, if any
+MATCH_STAGED = f"""
+CREATE TEMP TABLE supplements_matched ON COMMIT DROP AS
+SELECT st.*, s.id
+FROM {STAGING_TABLE} st
+LEFT JOIN (SELECT id, name_sv, dosing_base_val, dosing_max_val, unit,
+                  ROW_NUMBER() OVER (PARTITION BY name_sv, dosing_base_val, dosing_max_val, unit
+                                     ORDER BY id) AS occurrence
+           FROM supplements) s
+  ON s.name_sv IS NOT DISTINCT FROM st.name_sv
+ AND s.dosing_base_val IS NOT DISTINCT FROM st.dosing_base_val
+ AND s.dosing_max_val IS NOT DISTINCT FROM st.dosing_max_val
+ AND s.unit IS NOT DISTINCT FROM st.unit
+ AND s.occurrence = st.occurrence;
+"""
+
+_DEFAULTED = {
+    'research_status': "COALESCE(m.research_status, 'Blue')",
+    'interaction_risk_level': "COALESCE(m.interaction_risk_level, 'Low')",
+    'is_base_health': 'COALESCE(m.is_base_health, FALSE)',
+}
+_VALUES = [_DEFAULTED.get(column, f'm.{column}') for column in TARGET_COLUMNS]
+
+UPDATE_MATCHED = f"""
+UPDATE supplements s SET
+    {', '.join(f'{column} = {value}' for column, value in zip(TARGET_COLUMNS, _VALUES))}
+FROM supplements_matched m
+WHERE s.id = m.id AND m.op = '{OP_UPSERT}';
+"""
+
+DELETE_MATCHED = f"""
+DELETE FROM supplements s
+USING supplements_matched m
+WHERE s.id = m.id AND m.op = '{OP_DELETE}';
+"""
+
+INSERT_UNMATCHED = f"""
+INSERT INTO supplements ({', '.join(TARGET_COLUMNS)})
+SELECT {', '.join(_VALUES)}
+FROM supplements_matched m
+WHERE m.id IS NULL AND m.op = '{OP_UPSERT}'
+ORDER BY m.ord;
+"""
+
+
+def research_status(text):
+    """research_status_type value of a status cell, or None."""
+    value = STATUS_MAP.get(text.strip(), text.strip())
+    return value if value in RESEARCH_STATUSES else None
+
+
+def risk_level(text):
+    """risk_level_type value of an interaction_risk cell ('Medium. Bleeding.' -> 'Medium').
+
+    The level is the cell's first sentence. Cells without one fall back to
+    the rules of scripts/import-supplements.ts.
+    """
+    level = text.split('.', 1)[0].strip()
+    level = RISK_MAP.get(level, level)
+    if level in RISK_LEVELS:
+        return level
+    lower = text.lower()
+    if 'high' in lower or 'hög' in lower:
+        return 'High'
+    if 'medium' in lower or 'medel' in lower:
+        return 'Medium'
+    return 'Low'
+
+
+def category_ids(text):
+    """INT[] literal of a category_links cell ('1; 6' -> '{1,6}'); None if empty.
+
+    Raises ValueError on a link that is not a number.
+    """
+    ids = [part.strip() for part in text.split(';') if part.strip()]
+    if not ids:
+        return None
+    return '{' + ','.join(str(int(part)) for part in ids) + '}'
+
+
+def _text(value):
+    return value if value else None
+
+
+def copy_field(value):
+    """One field of COPY's text format; None is NULL."""
+    if value is None:
+        return '\\N'
+    return (value.replace('\\', '\\\\').replace('\t', '\\t')
+            .replace('\n', '\\n').replace('\r', '\\r'))
+
+
+def staged_rows(table):
+    """Staging rows of a ColumnTable, and the rejects.
+
+    Returns (rows, rejects): rows are lists of STAGING_COLUMNS values
+    (strings, None for NULL), rejects are (identity, column, value,
+    reason) like the dosing reject report. Rows without name_en are left
+    out; a bad category link leaves category_ids NULL. The op and
+    occurrence of a delta file's rows come from its DELTA_COLUMNS; other
+    rows are upserts.
+    """
+    columns = table.columns
+    statuses = columns['research_status'].map(research_status).decode()
+    levels = columns['interaction_risk'].map(risk_level).decode()
+    health = columns['is_base_health'].map(lambda text: BOOLEANS.get(text.strip().lower())).decode()
+    links = columns['category_links']
+    link_ids = []
+    link_errors = {}
+    for code, text in enumerate(links.categories):
+        try:
+            link_ids.append(category_ids(text))
+        except ValueError:
+            link_ids.append(None)
+            link_errors[code] = 'category link is not a number'
+    dosings, dose_rejects = table_dosing(table)
+    identities = table.identities()
+    rejects = [(identities[idx], column, value, reason) for idx, column, value, reason in dose_rejects]
+
+    names_sv = columns['name_sv'].decode()
+    names_en = columns['name_en'].decode()
+    dosing_notes = columns['dosing_notes'].decode()
+    bioavailability = columns['bioavailability_notes'].decode()
+    risk_texts = columns['interaction_risk'].decode()
+    rows = []
+    for idx, code in enumerate(links.codes):
+        if not names_en[idx].strip():
+            rejects.append((identities[idx], 'name_en', '', 'name_en is empty'))
+            continue
+        if code in link_errors:
+            rejects.append((identities[idx], 'category_links', links.categories[code], link_errors[code]))
+        op, occurrence = table.extra.get(idx, [OP_UPSERT, identities[idx][-1]])[:len(DELTA_COLUMNS)]
+        if op not in (OP_UPSERT, OP_DELETE) or not str(occurrence).isdigit():
+            rejects.append((identities[idx], 'op', op, 'not a delta operation'))
+            continue
+        dosing = dosings[idx]
+        rows.append([
+            str(idx), op, str(occurrence), _text(names_sv[idx]), names_en[idx], statuses[idx],
+            format_value(dosing.base) or None, format_value(dosing.max) or None, dosing.unit,
+            _text(dosing_notes[idx]), _text(bioavailability[idx]), _text(risk_texts[idx]), levels[idx],
+            health[idx], link_ids[code],
+        ])
+    return rows, rejects
+
+
+def copy_lines(rows):
+    """Yield the COPY text-format lines of staging rows."""
+    for row in rows:
+        yield '\t'.join(copy_field(value) for value in row) + '\n'
+
+
+def script(rows):
+    """Yield a psql script that loads rows in one transaction."""
+    yield 'BEGIN;\n'
+    yield CREATE_STAGING
+    yield COPY_STAGING + ';\n'
+    yield from copy_lines(rows)
+    yield '\\.\n'
+    yield MATCH_STAGED
+    yield UPDATE_MATCHED
+    yield DELETE_MATCHED
+    yield INSERT_UNMATCHED
+    yield 'COMMIT;\n'
+
+
+def load(conninfo, rows):
+    """Load rows into supplements over one connection; returns (updated, deleted, inserted).
+
+    Needs psycopg; raises ImportError without it.
+    """
+    import psycopg
+    with psycopg.connect(conninfo) as conn, conn.cursor() as cur:
+        cur.execute(CREATE_STAGING)
+        with cur.copy(COPY_STAGING) as copy:
+            for line in copy_lines(rows):
+                copy.write(line)
+        cur.execute(MATCH_STAGED)
+        cur.execute(UPDATE_MATCHED)
+        updated = cur.rowcount
+        cur.execute(DELETE_MATCHED)
+        deleted = cur.rowcount
+        cur.execute(INSERT_UNMATCHED)
+        inserted = cur.rowcount
+    return updated, deleted, inserted
@@ -0,0 +1,58 @@
+"""
+Stat keys of the files a translate_with_openai run starts from.
+
+Aligning the output with the source (translation/alignment.py) reads the
+source, the output, the output's snapshot and the backup in full. A run
+that ends leaves its output lined up with the source, so as long as none
+of those files changes, the next alignment has nothing to do. The
+manifest records each file's size, mtime and ctime when a run ends; the
+next start compares them with one stat() per file and, if all match,
+skips reading the snapshot and the backup and aligning. The source and
+the output are still read, for their cells. ctime is part of the key
+because shutil.copy2 preserves mtime.
+"""
+
+import json
+import os
+
+MANIFEST_VERSION = 2
+
+
+def manifest_path(output_path):
+    return output_path + '.manifest.json'
+
+
+def _stat_key(path):
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return [st.st_size, st.st_mtime_ns, st.st_ctime_ns]
+
+
+class Manifest:
+    """Stat keys by file path, loaded from and saved to a JSON file."""
+
+    def __init__(self, path):
+        self.path = path
+        self.files = {}
+        if os.path.exists(path):
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+            except ValueError:
+                data = {}
+            if data.get('version') == MANIFEST_VERSION:
+                self.files = data['files']
+
+    def unchanged(self, paths):
+        """True if every file in paths (missing ones included) is as last recorded."""
+        return all(path in self.files and self.files[path] == _stat_key(path) for path in paths)
+
+    def record(self, paths):
+        """Record the files in paths as they are now and save the manifest."""
+        self.files = {path: _stat_key(path) for path in paths}
+        temp_file = self.path + '.tmp'
+        with open(temp_file, 'w', encoding='utf-8') as f:
+            json.dump({'version': MANIFEST_VERSION, 'files': self.files}, f)
+        os.replace(temp_file, self.path)
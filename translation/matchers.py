@@ -0,0 +1,212 @@
+"""
+Compiled text matchers used by the rule-based translators.
+
+Each matcher is built once per process from its term table and then scans a
+cell in a single pass, so the cost per cell does not grow with the size of
+the table.
+"""
+
+import re
+from collections import deque
+
+
+def _trie_pattern(node):
+    """Build a regex fragment from a character trie, longest branch first."""
+    branches = []
+    for char in sorted(node):
+        if char == '':
+            continue
+        branches.append(re.escape(char) + _trie_pattern(node[char]))
+    if not branches:
+        return ''
+    # The terminal marker becomes an empty alternative at the end so the
+    # regex engine always prefers the longer term when both match.
+    if '' in node:
+        branches.append('')
+    if len(branches) == 1:
+        return branches[0]
+    return '(?:' + '|'.join(branches) + ')'
+
+
+class GlossaryMatcher:
+    """Case-insensitive, longest-match-first glossary replacement.
+
+    All terms are folded into one trie-shaped regex, so a cell is scanned
+    once no matter how many entries the glossary holds. When two entries
+    differ only by case, the first one wins.
+    """
+
+    def __init__(self, glossary):
+        self.replacements = {}
+        for source, target in glossary.items():
+            if source:
+                self.replacements.setdefault(source.lower(), target)
+
+        trie = {}
+        for term in self.replacements:
+            node = trie
+            for char in term:
+                node = node.setdefault(char, {})
+            node[''] = True
+
+        self.pattern = re.compile(_trie_pattern(trie), re.IGNORECASE) if trie else None
+
+    def _replace(self, match):
+        found = match.group(0)
+        return self.replacements.get(found.lower(), found)
+
+    def replace(self, text):
+        """Return text with every glossary term replaced in one pass."""
+        if not text or self.pattern is None:
+            return text
+        return self.pattern.sub(self._replace, text)
+
+    def finditer(self, text):
+        """Yield (start, end, term) for each glossary hit in text."""
+        if not text or self.pattern is None:
+            return
+        for match in self.pattern.finditer(text):
+            yield match.start(), match.end(), match.group(0).lower()
+
+
+class AhoCorasick:
+    """Multi-pattern substring matcher (Aho-Corasick automaton).
+
+    Finds every occurrence of every term in one left-to-right pass over the
+    text, so the scan costs the same for 50 terms or 5,000. Matching is
+    exact; callers lower-case both terms and text for case-insensitive use.
+    """
+
+    def __init__(self, terms):
+        self.terms = list(dict.fromkeys(term for term in terms if term))
+        goto = [{}]
+        outputs = [()]
+        for term in self.terms:
+            state = 0
+            for char in term:
+                nxt = goto[state].get(char)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto.append({})
+                    outputs.append(())
+                    goto[state][char] = nxt
+                state = nxt
+            outputs[state] += (term,)
+
+        # Breadth-first pass to link each state to its longest proper suffix
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, nxt in goto[state].items():
+                queue.append(nxt)
+                link = fail[state]
+                while link and char not in goto[link]:
+                    link = fail[link]
+                fail[nxt] = goto[link].get(char, 0)
+                outputs[nxt] += outputs[fail[nxt]]
+
+        self._goto = goto
+        self._fail = fail
+        self._outputs = outputs
+
+    def finditer(self, text):
+        """Yield (start, term) for every match, ordered by end position."""
+        goto, fail, outputs = self._goto, self._fail, self._outputs
+        state = 0
+        for end, char in enumerate(text, 1):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for term in outputs[state]:
+                yield end - len(term), term
+
+    def findall(self, text):
+        """Return a list of (start, term) for every match in text."""
+        return list(self.finditer(text)) if text else []
+
+    def search(self, text):
+        """Return the first (start, term) match in text, or None."""
+        if text:
+            for hit in self.finditer(text):
+                return hit
+        return None
+
+
+# Splits text into alternating [word, separator, word, ...] items, matching
+# the \b word boundaries used by the replacement rules.
+_TOKEN_SPLIT = re.compile(r'(\W+)')
+_PLAIN_RULE = re.compile(r'\\b(\w(?:[^\\.^$*+?{}\[\]|()]*\w)?)\\b')
+
+
+class TokenReplacer:
+    """Whole-word replacement rules applied through a token hash map.
+
+    Takes the ordered (pattern, replacement) rules of translate_csv_simple,
+    where each pattern is a case-insensitive \\bword\\b or \\bmulti word\\b.
+    The text is split on word boundaries once; each token, and each
+    multi-word window up to the longest phrase, is looked up in a
+    case-folded dict, longest window first. Tokens no rule matches keep
+    their original casing.
+
+    A matched span resolves to exactly what the ordered regex rules would
+    produce for it, so chains such as 'kreatin' -> 'creatine' -> 'Creatine'
+    survive. Results are memoized per span. Rules that are not plain word
+    patterns (e.g. \\bNAD\\+\\b) run as regexes after the token pass.
+    """
+
+    def __init__(self, rules):
+        self.rules = [(re.compile(pattern, re.IGNORECASE), replacement)
+                      for pattern, replacement in rules]
+        self.keys = {}
+        self.residual = []
+        for compiled, replacement in self.rules:
+            plain = _PLAIN_RULE.fullmatch(compiled.pattern)
+            if plain:
+                key = plain.group(1).lower()
+                self.keys.setdefault(key, len(_TOKEN_SPLIT.split(key)))
+            else:
+                self.residual.append((compiled, replacement))
+        # Window sizes in split items (words plus separators), longest first
+        self.spans = sorted(set(self.keys.values()), reverse=True)
+        self._resolved = {}
+
+    def _resolve(self, span):
+        """Apply every rule in order to one matched span, memoized."""
+        result = self._resolved.get(span)
+        if result is None:
+            result = span
+            for compiled, replacement in self.rules:
+                result = compiled.sub(replacement, result)
+            self._resolved[span] = result
+        return result
+
+    def replace(self, text):
+        """Return text with every rule applied in a single token pass."""
+        if not text:
+            return text
+        keys = self.keys
+        items = _TOKEN_SPLIT.split(text)
+        count = len(items)
+        out = []
+        i = 0
+        while i < count:
+            # Words sit at even positions; separators pass straight through
+            if i % 2 == 0 and items[i]:
+                for span in self.spans:
+                    if i + span <= count:
+                        window = items[i] if span == 1 else ''.join(items[i:i + span])
+                        if window.lower() in keys:
+                            out.append(self._resolve(window))
+                            i += span
+                            break
+                else:
+                    out.append(items[i])
+                    i += 1
+            else:
+                out.append(items[i])
+                i += 1
+        result = ''.join(out)
+        for compiled, replacement in self.residual:
+            result = compiled.sub(replacement, result)
+        return result
@@ -0,0 +1,141 @@
+"""
+Persistent translation memory for the OpenAI translation scripts.
+
+Translations are stored in a SQLite file keyed by the normalized source text,
+model, prompt version and temperature, so a re-run (or a run after a crash)
+resolves previously translated cells locally instead of calling the API.
+The database runs in WAL mode with a busy timeout, so several processes can
+read and write the same file at once.
+"""
+
+import hashlib
+import sqlite3
+import time
+import unicodedata
+
+DEFAULT_PATH = '.translation-memory.sqlite3'
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS translations (
+    key TEXT PRIMARY KEY,
+    source TEXT NOT NULL,
+    translation TEXT NOT NULL,
+    model TEXT NOT NULL,
+    prompt_version TEXT NOT NULL,
+    temperature REAL NOT NULL,
+    created_at REAL NOT NULL,
+    last_used REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS translations_last_used ON translations (last_used);
+CREATE INDEX IF NOT EXISTS translations_created_at ON translations (created_at);
+"""
+
+
+def normalize(text):
+    """Normalize source text for lookup: NFC, trimmed, single spaces."""
+    return ' '.join(unicodedata.normalize('NFC', text).split())
+
+
+def memory_key(text, model, prompt_version, temperature):
+    """Return the cache key for one translation request."""
+    raw = '\x1f'.join([normalize(text), model, str(prompt_version), repr(float(temperature))])
+    return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+
+class TranslationMemory:
+    """On-disk cache of API translations with size- and age-based eviction.
+
+    max_entries keeps only the most recently used entries; max_age_days drops
+    entries created longer ago than that. Either may be None for no limit.
+    The database is opened on first use, so creating one is free.
+    """
+
+    def __init__(self, path=DEFAULT_PATH, max_entries=None, max_age_days=None):
+        self.path = path
+        self.max_entries = max_entries
+        self.max_age_days = max_age_days
+        self.hits = 0
+        self.misses = 0
+        self._conn = None
+        # Keys hit since the last flush; last_used is written in batches
+        self._touched = set()
+
+    def _connect(self):
+        if self._conn is None:
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+            self.evict()
+        return self._conn
+
+    def get(self, text, model, prompt_version, temperature):
+        """Return the stored translation for text, or None."""
+        key = memory_key(text, model, prompt_version, temperature)
+        row = self._connect().execute(
+            'SELECT translation FROM translations WHERE key = ?', (key,)).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._touched.add(key)
+        return row[0]
+
+    def put(self, text, translation, model, prompt_version, temperature):
+        """Store a successful translation."""
+        key = memory_key(text, model, prompt_version, temperature)
+        now = time.time()
+        conn = self._connect()
+        with conn:
+            conn.execute(
+                'INSERT OR REPLACE INTO translations '
+                '(key, source, translation, model, prompt_version, temperature, created_at, last_used) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                (key, normalize(text), translation, model, str(prompt_version), float(temperature), now, now))
+
+    def flush(self):
+        """Write the last-used time of entries hit since the previous flush."""
+        if not self._touched or self._conn is None:
+            return
+        now = time.time()
+        with self._conn:
+            self._conn.executemany('UPDATE translations SET last_used = ? WHERE key = ?',
+                                   [(now, key) for key in self._touched])
+        self._touched.clear()
+
+    def evict(self):
+        """Drop entries past max_age_days, then beyond max_entries. Returns the count removed."""
+        conn = self._connect()
+        self.flush()
+        removed = 0
+        with conn:
+            if self.max_age_days is not None:
+                cutoff = time.time() - self.max_age_days * 86400
+                removed += conn.execute('DELETE FROM translations WHERE created_at < ?', (cutoff,)).rowcount
+            if self.max_entries is not None:
+                removed += conn.execute(
+                    'DELETE FROM translations WHERE key NOT IN '
+                    '(SELECT key FROM translations ORDER BY last_used DESC LIMIT ?)',
+                    (self.max_entries,)).rowcount
+        return removed
+
+    def __len__(self):
+        return self._connect().execute('SELECT COUNT(*) FROM translations').fetchone()[0]
+
+    @property
+    def hit_rate(self):
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def summary(self):
+        """One-line hit-rate summary for the end-of-run report."""
+        lookups = self.hits + self.misses
+        return f"{self.hits}/{lookups} lookups served from cache ({self.hit_rate:.1%})"
+
+    def close(self):
+        if self._conn is not None:
+            self.flush()
+            self._conn.close()
+            self._conn = None
+
@@ -0,0 +1,177 @@
+"""
+Structured run metrics for the OpenAI translation scripts.
+
+A Metrics object collects, for one run:
+  - a latency histogram of API requests, and their prompt/completion tokens
+  - API errors and retries by error class
+  - translation memory hits and misses, and cells per second
+  - time spent per phase (detection, API, file I/O)
+
+and writes them as a JSON summary and as a Prometheus textfile-collector
+file, so scheduled catalog refreshes can be graphed and alerted on.
+
+API calls are reported by translation.ratelimit: assign the Metrics to
+RateLimiter.metrics and every create()/create_async() and backoff() is
+recorded. The API phase is the sum of request latencies; with concurrent
+requests it can exceed the wall-clock time.
+"""
+
+import contextlib
+import json
+import os
+import time
+from collections import Counter
+
+# Upper bounds (seconds) of the latency histogram buckets
+LATENCY_BUCKETS = (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+PROMETHEUS_PREFIX = 'catalog_translation'
+
+
+class Histogram:
+    """Cumulative-bucket histogram in the Prometheus sense."""
+
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * len(self.buckets)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, value):
+        self.count += 1
+        self.sum += value
+        self.max = max(self.max, value)
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+
+    def to_dict(self):
+        return {
+            'count': self.count,
+            'sum': self.sum,
+            'mean': self.sum / self.count if self.count else 0.0,
+            'max': self.max,
+            'buckets': {str(bound): count for bound, count in zip(self.buckets, self.counts)},
+        }
+
+
+class Metrics:
+    """Counters, the API latency histogram and phase timers of one run."""
+
+    def __init__(self, job):
+        self.job = job
+        self.started = time.time()
+        self._start = time.perf_counter()
+        self.latency = Histogram()
+        self.requests = Counter()  # outcome -> count
+        self.errors = Counter()  # error class -> failed requests
+        self.retries = Counter()  # error class -> retries scheduled
+        self.tokens = Counter()  # 'prompt' / 'completion' -> tokens
+        self.phases = Counter()  # phase -> seconds
+        self.cache = Counter()  # 'hit' / 'miss' -> lookups
+        self.cells = 0
+
+    def observe_request(self, seconds, response=None, error=None):
+        """Record one API request; response (if any) carries the token usage."""
+        self.latency.observe(seconds)
+        self.phases['api'] += seconds
+        if error is not None:
+            self.requests['error'] += 1
+            self.errors[type(error).__name__] += 1
+            return
+        self.requests['ok'] += 1
+        usage = getattr(response, 'usage', None)
+        if usage is not None:
+            self.tokens['prompt'] += usage.prompt_tokens or 0
+            self.tokens['completion'] += usage.completion_tokens or 0
+
+    def observe_retry(self, error):
+        self.retries[type(error).__name__] += 1
+
+    @contextlib.contextmanager
+    def phase(self, name):
+        """Add the time spent in the with block to phase name."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] += time.perf_counter() - start
+
+    def set_cache(self, hits, misses):
+        self.cache['hit'] = hits
+        self.cache['miss'] = misses
+
+    def summary(self):
+        """The run's metrics as a JSON-serialisable dict."""
+        wall = time.perf_counter() - self._start
+        return {
+            'job': self.job,
+            'started': self.started,
+            'wall_seconds': wall,
+            'cells': self.cells,
+            'cells_per_second': self.cells / wall if wall else 0.0,
+            'api': {
+                'requests': dict(self.requests),
+                'latency_seconds': self.latency.to_dict(),
+                'errors': dict(self.errors),
+                'retries': dict(self.retries),
+                'tokens': dict(self.tokens),
+            },
+            'cache': dict(self.cache),
+            'phase_seconds': dict(self.phases),
+        }
+
+    def write_json(self, path):
+        _write_atomic(path, json.dumps(self.summary(), indent=2) + '\n')
+
+    def write_prometheus(self, path):
+        """Write the run in the Prometheus text format, for node_exporter's textfile collector."""
+        summary = self.summary()
+        job = _label_value(self.job)
+        lines = []
+
+        def metric(name, kind, help_text, samples):
+            full = f'{PROMETHEUS_PREFIX}_{name}'
+            lines.append(f'# HELP {full} {help_text}')
+            lines.append(f'# TYPE {full} {kind}')
+            for suffix, labels, value in samples:
+                label_text = ','.join([f'job="{job}"'] + [f'{k}="{_label_value(v)}"' for k, v in labels])
+                lines.append(f'{full}{suffix}{{{label_text}}} {value}')
+
+        cumulative = [('_bucket', [('le', str(bound))], count)
+                      for bound, count in zip(self.latency.buckets, self.latency.counts)]
+        metric('api_request_duration_seconds', 'histogram', 'Latency of chat completion requests in the last run.',
+               cumulative + [('_bucket', [('le', '+Inf')], self.latency.count),
+                             ('_sum', [], self.latency.sum), ('_count', [], self.latency.count)])
+        metric('api_requests', 'gauge', 'API requests in the last run by outcome.',
+               [('', [('outcome', outcome)], count) for outcome, count in sorted(self.requests.items())])
+        metric('api_errors', 'gauge', 'Failed API requests in the last run by error class.',
+               [('', [('error', error)], count) for error, count in sorted(self.errors.items())])
+        metric('retries', 'gauge', 'Retries scheduled in the last run by error class.',
+               [('', [('error', error)], count) for error, count in sorted(self.retries.items())])
+        metric('tokens', 'gauge', 'Tokens reported by the API in the last run.',
+               [('', [('kind', kind)], count) for kind, count in sorted(self.tokens.items())])
+        metric('cache_lookups', 'gauge', 'Translation memory lookups in the last run.',
+               [('', [('result', result)], count) for result, count in sorted(self.cache.items())])
+        metric('phase_seconds', 'gauge', 'Seconds spent per phase in the last run (api sums request latencies).',
+               [('', [('phase', phase)], seconds) for phase, seconds in sorted(self.phases.items())])
+        metric('cells', 'gauge', 'Cells processed in the last run.', [('', [], self.cells)])
+        metric('cells_per_second', 'gauge', 'Cells processed per wall-clock second in the last run.',
+               [('', [], summary['cells_per_second'])])
+        metric('run_duration_seconds', 'gauge', 'Wall-clock duration of the last run.',
+               [('', [], summary['wall_seconds'])])
+        metric('last_run_timestamp_seconds', 'gauge', 'Unix time the last run finished.',
+               [('', [], time.time())])
+        _write_atomic(path, '\n'.join(lines) + '\n')
+
+
+def _label_value(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _write_atomic(path, text):
+    # The textfile collector may read at any moment; never expose a partial file
+    temp_file = path + '.tmp'
+    with open(temp_file, 'w', encoding='utf-8') as f:
+        f.write(text)
+    os.replace(temp_file, path)
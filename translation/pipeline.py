@@ -0,0 +1,272 @@
+"""
+Shared translation pipeline for the supplement catalog CSV.
+
+A run reads the catalog once, passes every translatable cell through an
+ordered list of stages and writes the result once. Stages are ordered
+cheapest first (exact map, glossary, LLM); the first stage that resolves a
+cell wins, and cells no stage resolves are left unchanged.
+
+A stage is any callable stage(text, column, hits=None) returning the
+translated text, or None to hand the cell on to the next stage. hits is an
+optional Swedish-detector result the caller already has for text. A stage
+also carries a name (used in the run statistics) and the set of column
+names it applies to.
+"""
+
+import asyncio
+import csv
+import os
+from collections import Counter
+
+COLUMNS = [
+    'name_sv', 'name_en', 'research_status', 'dosing_base_g_mg', 'dosing_max_g_mg',
+    'dosing_notes', 'bioavailability_notes', 'interaction_risk', 'is_base_health',
+    'category_links',
+]
+COLUMN_INDEX = {name: idx for idx, name in enumerate(COLUMNS)}
+
+STATUS_MAP = {'Grön': 'Green', 'Blå': 'Blue', 'Röd': 'Red'}
+RISK_MAP = {'Låg': 'Low', 'Medium': 'Medium', 'Hög': 'High'}
+
+
+def is_header(row):
+    """Check if row is the catalog header (it sits mid-file, not on line 1)."""
+    return len(row) > 0 and 'name_sv' in row[0].lower()
+
+
+def is_data_row(row):
+    """Check if row is a complete data row."""
+    return len(row) >= len(COLUMNS) and not is_header(row)
+
+
+def row_identities(rows):
+    """Return a stable identity for each data row (None for other rows).
+
+    name_sv is not unique in the catalog, so repeated names are numbered
+    in file order: 'Biotin', 'Biotin#2', ...
+    """
+    seen = Counter()
+    identities = []
+    for row in rows:
+        if not is_data_row(row):
+            identities.append(None)
+            continue
+        seen[row[0]] += 1
+        identities.append(row[0] if seen[row[0]] == 1 else f'{row[0]}#{seen[row[0]]}')
+    return identities
+
+
+def read_rows(path):
+    """Read every row of a catalog CSV, header and malformed rows included."""
+    with open(path, 'r', encoding='utf-8') as f:
+        return list(csv.reader(f))
+
+
+def write_rows(path, rows):
+    """Write rows to path via a temp file and an atomic rename."""
+    temp_file = path + '.tmp'
+    with open(temp_file, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerows(rows)
+    os.replace(temp_file, path)
+
+
+class ExactMapStage:
+    """Resolve cells whose whole text is a key of a fixed mapping."""
+
+    def __init__(self, mapping, columns, name='exact'):
+        self.mapping = mapping
+        self.columns = set(columns)
+        self.name = name
+
+    def __call__(self, text, column, hits=None):
+        return self.mapping.get(text)
+
+
+class GlossaryStage:
+    """Rewrite cells with a rule-based translate(text) function.
+
+    With final=False the result only counts as resolved when detect(result)
+    finds no Swedish left; otherwise the original text goes to the next stage.
+    """
+
+    def __init__(self, translate, columns, name='glossary', final=True, detect=None):
+        self.translate = translate
+        self.columns = set(columns)
+        self.name = name
+        self.final = final
+        self.detect = detect
+
+    def __call__(self, text, column, hits=None):
+        result = self.translate(text)
+        if self.final or self.detect is None or not self.detect(result):
+            return result
+        return None
+
+
+class LLMStage:
+    """Send cells to a model-backed translate(text, column, hits) function.
+
+    If detect is given, only cells where detect(text) finds Swedish are sent;
+    its hits are passed on so the text is not scanned twice. Other cells are
+    left unresolved. Hits supplied by the caller skip detection altogether.
+    translate_async, if given, is the coroutine used by async runs.
+    """
+
+    def __init__(self, translate, columns, name='llm', detect=None, translate_async=None):
+        self.translate = translate
+        self.translate_async = translate_async
+        self.columns = set(columns)
+        self.name = name
+        self.detect = detect
+
+    def _wants(self, text, hits):
+        if hits is None and self.detect is not None:
+            hits = self.detect(text)
+        return self.detect is None or bool(hits), hits
+
+    def accepts(self, text, hits=None):
+        """True if this stage would send text to the model."""
+        return self._wants(text, hits)[0]
+
+    def __call__(self, text, column, hits=None):
+        wanted, hits = self._wants(text, hits)
+        if not wanted:
+            return None
+        return self.translate(text, column, hits)
+
+    async def call_async(self, text, column, hits=None):
+        wanted, hits = self._wants(text, hits)
+        if not wanted:
+            return None
+        if self.translate_async is None:
+            return self.translate(text, column, hits)
+        return await self.translate_async(text, column, hits)
+
+
+class Pipeline:
+    """An ordered list of stages applied to the catalog's data rows."""
+
+    def __init__(self, stages):
+        self.stages = list(stages)
+        self.columns = [name for name in COLUMNS
+                        if any(name in stage.columns for stage in self.stages)]
+        self.stats = Counter()
+        # Stage that resolved the most recent cell, and per column for the
+        # most recent translate_row() call
+        self.last_stage = None
+        self.resolved_by = {}
+
+    def _finish(self, text, result, stage_name):
+        self.stats[stage_name] += 1
+        self.last_stage = stage_name
+        return (text if result is None else result), stage_name
+
+    def resolve(self, text, column, hits=None):
+        """Return (translation, stage name) for one cell."""
+        for stage in self.stages:
+            if column not in stage.columns:
+                continue
+            result = stage(text, column, hits)
+            if result is not None:
+                return self._finish(text, result, stage.name)
+        return self._finish(text, None, 'unchanged')
+
+    async def resolve_async(self, text, column, hits=None):
+        """Like resolve(), awaiting stages that have an async variant.
+
+        Safe to run concurrently; use the returned stage name rather than
+        last_stage, which is shared between calls.
+        """
+        for stage in self.stages:
+            if column not in stage.columns:
+                continue
+            if hasattr(stage, 'call_async'):
+                result = await stage.call_async(text, column, hits)
+            else:
+                result = stage(text, column, hits)
+            if result is not None:
+                return self._finish(text, result, stage.name)
+        return self._finish(text, None, 'unchanged')
+
+    def reaches(self, text, column, stage_name, hits=None):
+        """True if no stage before stage_name resolves the cell and it accepts it.
+
+        Used to collect the cells a model-backed stage will receive, e.g. to
+        batch them, without running that stage.
+        """
+        for stage in self.stages:
+            if column not in stage.columns:
+                continue
+            if stage.name == stage_name:
+                return not hasattr(stage, 'accepts') or stage.accepts(text, hits)
+            if stage(text, column, hits) is not None:
+                return False
+        return False
+
+    def translate_cell(self, text, column, hits=None):
+        """Translate one cell through the first stage that resolves it."""
+        return self.resolve(text, column, hits)[0]
+
+    async def translate_row_async(self, row):
+        """Like translate_row(), resolving the row's cells concurrently.
+
+        Does not set resolved_by, so concurrent calls do not interfere.
+        """
+        if not is_data_row(row):
+            return row
+        translated = list(row)
+        targets = [(COLUMN_INDEX[column], column) for column in self.columns
+                   if translated[COLUMN_INDEX[column]] and translated[COLUMN_INDEX[column]] != '-']
+        results = await asyncio.gather(*(self.resolve_async(translated[idx], column)
+                                         for idx, column in targets))
+        for (idx, _), (text, _) in zip(targets, results):
+            translated[idx] = text
+        return translated
+
+    def cells(self, rows):
+        """Yield (row_index, column, text) for each translatable cell."""
+        for row_idx, row in enumerate(rows):
+            if not is_data_row(row):
+                continue
+            for column in self.columns:
+                text = row[COLUMN_INDEX[column]]
+                if text and text != '-':
+                    yield row_idx, column, text
+
+    def translate_row(self, row):
+        """Return a translated copy of row; header and malformed rows pass through."""
+        self.resolved_by = {}
+        if not is_data_row(row):
+            return row
+        translated = list(row)
+        for column in self.columns:
+            idx = COLUMN_INDEX[column]
+            if translated[idx] and translated[idx] != '-':
+                translated[idx] = self.translate_cell(translated[idx], column)
+                self.resolved_by[column] = self.last_stage
+        return translated
+
+    def plan(self, rows):
+        """Group the translatable cells of rows by (column, text).
+
+        Returns a dict, in first-seen order, mapping each distinct
+        (column, text) to the row indexes that hold it, so every distinct
+        value is translated once and fanned out with fan_out().
+        """
+        plan = {}
+        for row_idx, column, text in self.cells(rows):
+            plan.setdefault((column, text), []).append(row_idx)
+        return plan
+
+    def fan_out(self, rows, column, row_indexes, text):
+        """Write one translated value into column of every listed row."""
+        idx = COLUMN_INDEX[column]
+        for row_idx in row_indexes:
+            rows[row_idx][idx] = text
+
+    def run(self, input_path, output_path):
+        """Read input_path once, translate every row and write output_path once."""
+        rows = [self.translate_row(row) for row in read_rows(input_path)]
+        write_rows(output_path, rows)
+        return rows
@@ -0,0 +1,316 @@
+"""
+Profiling mode for the translation scripts (--profile DIR).
+
+A Profiler wraps one run and writes to DIR:
+  - run.pstats: cProfile statistics of the whole run, for pstats/snakeviz
+  - memory.snapshot: a tracemalloc snapshot of what is still allocated at
+    the end of the run
+  - memory-<stage>.snapshot: a snapshot taken after replaying the texts a
+    stage saw through that stage alone
+  - report.txt: time and memory per stage, the costliest functions, and
+    the cost of every glossary pattern and indicator term over the corpus
+
+Stages are watched by wrapping them: each call is timed and its transient
+allocation peak recorded. The run itself traces one frame per allocation:
+with deeper tracebacks tracemalloc resolves the line number of every frame
+on every allocation, which slows the run down many times over and skews
+the cProfile numbers. Each stage is instead replayed on its own afterwards
+for its snapshot. Model-backed stages (those with call_async) are not
+replayed, since that would call the API again.
+
+Per-pattern costs are measured after the run on the distinct texts the
+stage saw: each pattern is scanned on its own, since the compiled
+matchers fold the whole table into one pass. Patterns that never match,
+or match without changing the text, are candidates for pruning.
+"""
+
+import cProfile
+import io
+import os
+import pstats
+import sys
+import time
+import tracemalloc
+from collections import Counter
+
+# Frames kept per allocation in the stage replays
+TRACEBACK_FRAMES = 16
+# Each pattern's scan is timed this many times and the fastest kept
+PATTERN_REPEATS = 3
+TOP_FUNCTIONS = 25
+TOP_PATTERNS = 20
+TOP_ALLOCATIONS = 5
+
+
+class StageProfile:
+    """A pipeline stage that records its calls, time and allocations.
+
+    Attributes the pipeline reads (columns, name, accepts, ...) come from
+    the wrapped stage. Async calls are timed including the time spent
+    waiting on the event loop, and their memory is not measured, since
+    other requests allocate at the same time.
+    """
+
+    def __init__(self, stage):
+        self.stage = stage
+        self.calls = 0
+        self.seconds = 0.0
+        self.async_calls = 0
+        self.peak = 0  # largest transient allocation of a single sync call, bytes
+        self.run_peak = 0  # tracemalloc.reset_peak() hides the run's peak from the Profiler
+        self.texts = Counter()  # text -> calls
+        self.seen_in = {}  # text -> first column it was seen in, for replay()
+
+    def __getattr__(self, name):
+        return getattr(self.stage, name)
+
+    def _count(self, text, column):
+        self.calls += 1
+        self.texts[text] += 1
+        self.seen_in.setdefault(text, column)
+
+    def __call__(self, text, column, hits=None):
+        self._count(text, column)
+        tracing = tracemalloc.is_tracing()
+        if tracing:
+            before, run_peak = tracemalloc.get_traced_memory()
+            self.run_peak = max(self.run_peak, run_peak)
+            tracemalloc.reset_peak()
+        start = time.perf_counter()
+        try:
+            return self.stage(text, column, hits)
+        finally:
+            self.seconds += time.perf_counter() - start
+            if tracing:
+                _, peak = tracemalloc.get_traced_memory()
+                self.peak = max(self.peak, peak - before)
+                self.run_peak = max(self.run_peak, peak)
+
+    async def call_async(self, text, column, hits=None):
+        self._count(text, column)
+        self.async_calls += 1
+        start = time.perf_counter()
+        try:
+            if hasattr(self.stage, 'call_async'):
+                return await self.stage.call_async(text, column, hits)
+            return self.stage(text, column, hits)
+        finally:
+            self.seconds += time.perf_counter() - start
+
+    def replay(self):
+        """Run the distinct texts seen through the stage alone; returns (snapshot, peak bytes)."""
+        tracemalloc.start(TRACEBACK_FRAMES)
+        try:
+            for text, column in self.seen_in.items():
+                self.stage(text, column)
+            _, peak = tracemalloc.get_traced_memory()
+            return tracemalloc.take_snapshot(), peak
+        finally:
+            tracemalloc.stop()
+
+
+def pattern_costs(patterns, texts):
+    """Scan texts with each (label, compiled, replacement) pattern on its own.
+
+    texts maps text -> occurrences. Returns one (label, seconds, matches,
+    changed) tuple per pattern, costliest first; seconds is the fastest of
+    PATTERN_REPEATS scans of the distinct texts, matches and changed count
+    occurrences, changed only those where the replacement differs from the
+    matched text.
+    """
+    costs = []
+    for label, compiled, replacement in patterns:
+        seconds = float('inf')
+        for _ in range(PATTERN_REPEATS):
+            start = time.perf_counter()
+            found = [(text, list(compiled.finditer(text))) for text in texts]
+            seconds = min(seconds, time.perf_counter() - start)
+        matches = changed = 0
+        for text, hits in found:
+            for match in hits:
+                matches += texts[text]
+                if match.expand(replacement) != match.group(0):
+                    changed += texts[text]
+        costs.append((label, seconds, matches, changed))
+    costs.sort(key=lambda cost: cost[1], reverse=True)
+    return costs
+
+
+def indicator_costs(find, texts, judge=None):
+    """Cells each indicator term flags, given find(text) -> [(position, term)].
+
+    texts maps text -> occurrences. Returns {term: Counter} with 'cells'
+    (cells the term flags), 'sole' (cells only it flags) and, with
+    judge(text) -> is Swedish, 'english' (flagged cells judge calls
+    English: the term's false alarms).
+    """
+    costs = {}
+    for text, count in texts.items():
+        terms = {term for _, term in find(text)}
+        english = judge is not None and bool(terms) and not judge(text)
+        for term in terms:
+            cost = costs.setdefault(term, Counter())
+            cost['cells'] += count
+            if english:
+                cost['english'] += count
+            if len(terms) == 1:
+                cost['sole'] += count
+    return costs
+
+
+def _allocation_lines(snapshot, limit=TOP_ALLOCATIONS):
+    return [f"  {stat.size / 1024:>9.1f} KiB {stat.count:>7} blocks  "
+            f"{stat.traceback[0].filename}:{stat.traceback[0].lineno}"
+            for stat in snapshot.statistics('lineno')[:limit]]
+
+
+class Profiler:
+    """Profile one run into a directory; use as a context manager.
+
+    Call watch(pipeline) before the pipeline runs, and add_patterns() /
+    add_indicators() to have the term tables costed in the report.
+    """
+
+    def __init__(self, directory, log=None):
+        self.directory = directory
+        self.log = log or sys.stdout
+        self.stages = []
+        self.patterns = []  # (title, stage name, patterns)
+        self.indicators = []  # (stage name, find, judge, terms)
+        self._profile = cProfile.Profile()
+        self._start = None
+        self.wall = 0.0
+
+    def watch(self, pipeline):
+        """Wrap the pipeline's stages so their calls are measured."""
+        pipeline.stages = [stage if isinstance(stage, StageProfile) else StageProfile(stage)
+                           for stage in pipeline.stages]
+        self.stages.extend(stage for stage in pipeline.stages if stage not in self.stages)
+
+    def add_patterns(self, title, stage_name, patterns):
+        """Cost (label, compiled regex, replacement) patterns on the texts stage_name saw."""
+        self.patterns.append((title, stage_name, list(patterns)))
+
+    def add_indicators(self, stage_name, find, judge=None, terms=()):
+        """Cost the indicator terms find(text) reports on the texts stage_name saw.
+
+        terms, if given, is the full term list, to count the ones never found.
+        """
+        self.indicators.append((stage_name, find, judge, terms))
+
+    def __enter__(self):
+        os.makedirs(self.directory, exist_ok=True)
+        tracemalloc.start(1)
+        self._start = time.perf_counter()
+        self._profile.enable()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self._profile.disable()
+        self.wall = time.perf_counter() - self._start
+        # Leave out the profiler's own bookkeeping
+        snapshot = tracemalloc.take_snapshot().filter_traces([tracemalloc.Filter(False, __file__)])
+        _, run_peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        run_peak = max([run_peak] + [stage.run_peak for stage in self.stages])
+        self._profile.dump_stats(os.path.join(self.directory, 'run.pstats'))
+        snapshot.dump(os.path.join(self.directory, 'memory.snapshot'))
+        report = self.report(snapshot, run_peak)
+        with open(os.path.join(self.directory, 'report.txt'), 'w', encoding='utf-8') as f:
+            f.write(report)
+        print(f"📊 Profile written to {self.directory}/ (report.txt, run.pstats, memory*.snapshot)",
+              file=self.log)
+        return False
+
+    def _texts(self, stage_name):
+        texts = Counter()
+        for stage in self.stages:
+            if stage.name == stage_name:
+                texts.update(stage.texts)
+        return texts
+
+    def report(self, snapshot, run_peak):
+        lines = [f"Wall time: {self.wall:.3f} s; traced memory peak: {run_peak / 1024:,.0f} KiB", '']
+
+        lines.append('Pipeline stages (peak: largest transient allocation of one call)')
+        lines.append(f"  {'stage':<12} {'calls':>8} {'seconds':>9} {'share':>7} {'µs/call':>9} {'peak KiB':>9}")
+        staged = 0.0
+        overlapping = False
+        for stage in self.stages:
+            per_call = stage.seconds / stage.calls * 1e6 if stage.calls else 0.0
+            if stage.async_calls:
+                # Concurrent calls overlap, so their time is no share of the wall time
+                overlapping = True
+                share = '*'
+            else:
+                staged += stage.seconds
+                share = f'{stage.seconds / self.wall if self.wall else 0.0:.1%}'
+            lines.append(f"  {stage.name:<12} {stage.calls:>8} {stage.seconds:>9.3f} {share:>7} "
+                         f"{per_call:>9.1f} {stage.peak / 1024:>9.1f}")
+        if overlapping:
+            lines.append("  * awaited calls: seconds add up time spent in concurrent calls; peak not measured")
+        else:
+            outside = max(0.0, self.wall - staged)
+            share = outside / self.wall if self.wall else 0.0
+            lines.append(f"  {'(outside)':<12} {'':>8} {outside:>9.3f} {share:>7.1%}  CSV I/O and bookkeeping")
+        lines.append('')
+
+        lines.append('Still allocated at the end of the run (memory.snapshot)')
+        lines.extend(_allocation_lines(snapshot))
+        lines.append('')
+
+        for stage in self.stages:
+            if hasattr(stage.stage, 'call_async'):
+                lines.append(f"Stage {stage.name}: model-backed, not replayed")
+                continue
+            stage_snapshot, peak = stage.replay()
+            name = f'memory-{stage.name}.snapshot'
+            stage_snapshot.dump(os.path.join(self.directory, name))
+            kept = sum(stat.size for stat in stage_snapshot.statistics('filename'))
+            lines.append(f"Stage {stage.name} replayed on its {len(stage.seen_in)} distinct texts: "
+                         f"peak {peak / 1024:,.1f} KiB, {kept / 1024:,.1f} KiB kept ({name})")
+            lines.extend(_allocation_lines(stage_snapshot, 3))
+        lines.append('')
+
+        stream = io.StringIO()
+        stats = pstats.Stats(self._profile, stream=stream)
+        stats.sort_stats('cumulative').print_stats(TOP_FUNCTIONS)
+        lines.append(f"Top {TOP_FUNCTIONS} functions by cumulative time (full data in run.pstats)")
+        lines.extend('  ' + line for line in stream.getvalue().strip().splitlines())
+        lines.append('')
+
+        for title, stage_name, patterns in self.patterns:
+            texts = self._texts(stage_name)
+            costs = pattern_costs(patterns, texts)
+            idle = [cost for cost in costs if not cost[3]]
+            lines.append(f"{title}: {len(costs)} patterns scanned one by one over the {len(texts)} "
+                         f"distinct {stage_name} texts ({sum(texts.values())} cells), "
+                         f"{sum(cost[1] for cost in costs) * 1000:.1f} ms in total")
+            lines.append(f"  {sum(1 for cost in costs if not cost[2])} never match; "
+                         f"{sum(1 for cost in costs if cost[2] and not cost[3])} match but never change the text")
+            lines.append(f"  {'ms':>8} {'matches':>8} {'changed':>8}  pattern")
+            for label, seconds, matches, changed in costs[:TOP_PATTERNS]:
+                lines.append(f"  {seconds * 1000:>8.2f} {matches:>8} {changed:>8}  {label}")
+            if idle:
+                lines.append(f"  Never change the text, costliest first: "
+                             f"{', '.join(repr(cost[0]) for cost in idle[:TOP_PATTERNS])}"
+                             f"{', ...' if len(idle) > TOP_PATTERNS else ''}")
+            lines.append('')
+
+        for stage_name, find, judge, terms in self.indicators:
+            texts = self._texts(stage_name)
+            costs = indicator_costs(find, texts, judge)
+            ranked = sorted(costs.items(), key=lambda item: (item[1]['english'], item[1]['cells']),
+                            reverse=True)
+            lines.append(f"Indicator terms over the {len(texts)} distinct {stage_name} texts: "
+                         f"{len(costs)} terms found")
+            if terms:
+                lines.append(f"  {len(set(terms) - costs.keys())} of {len(set(terms))} terms never found")
+            if judge is not None:
+                lines.append("  English: flagged cells the language detector calls English (false alarms)")
+            lines.append(f"  {'cells':>8} {'sole':>8} {'English':>8}  term")
+            for term, cost in ranked[:TOP_PATTERNS]:
+                english = cost['english'] if judge is not None else '-'
+                lines.append(f"  {cost['cells']:>8} {cost['sole']:>8} {english:>8}  {term!r}")
+            lines.append('')
+        return '\n'.join(lines)
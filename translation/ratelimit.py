@@ -0,0 +1,221 @@
+"""
+Adaptive rate limiting for OpenAI requests.
+
+RateLimiter keeps two token buckets, requests per minute and tokens per
+minute. Every request reserves one request and its estimated tokens and
+waits only as long as the buckets require, instead of a fixed sleep. The
+x-ratelimit-* headers of each response resize the buckets to the account's
+real limits and sync them with what the server has left. A 429 pauses all
+callers for the server's Retry-After, or for a jittered exponential backoff
+if the server gives none.
+"""
+
+import asyncio
+import email.utils
+import random
+import re
+import time
+
+from translation.batching import estimate_tokens
+
+# gpt-4o-mini limits of a tier-1 account; the response headers replace
+# them with the account's own after the first request
+DEFAULT_RPM = 500
+DEFAULT_TPM = 200_000
+
+_DURATION_PART = re.compile(r'(\d+(?:\.\d+)?)(ms|s|m|h)')
+_DURATION_UNITS = {'ms': 0.001, 's': 1, 'm': 60, 'h': 3600}
+
+
+def parse_duration(value):
+    """Seconds in a reset header such as '1s', '6m0s' or '20ms', or None."""
+    parts = _DURATION_PART.findall(value or '')
+    if not parts:
+        return None
+    return sum(float(number) * _DURATION_UNITS[unit] for number, unit in parts)
+
+
+def retry_after(headers):
+    """Seconds the server asks us to wait, from retry-after-ms or retry-after."""
+    if not headers:
+        return None
+    value = headers.get('retry-after-ms')
+    if value:
+        try:
+            return float(value) / 1000
+        except ValueError:
+            pass
+    value = headers.get('retry-after')
+    if not value:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    try:
+        return max(0.0, email.utils.parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def error_headers(error):
+    """Response headers attached to an SDK error, if any."""
+    return getattr(getattr(error, 'response', None), 'headers', None)
+
+
+def is_rate_limited(error):
+    return getattr(error, 'status_code', None) == 429
+
+
+def request_tokens(params):
+    """Tokens a chat completion counts against the TPM limit: prompt plus max_tokens."""
+    prompt = sum(estimate_tokens(message['content']) for message in params['messages'])
+    return prompt + params.get('max_tokens', 0)
+
+
+class _Bucket:
+    """Token bucket refilled continuously at per_minute / 60 per second."""
+
+    def __init__(self, per_minute):
+        self.capacity = per_minute
+        self.level = per_minute
+        self.updated = time.monotonic()
+
+    def refill(self, now):
+        self.level = min(self.capacity, self.level + (now - self.updated) * self.capacity / 60)
+        self.updated = now
+
+    def reserve(self, amount, now):
+        """Take amount (possibly going negative) and return the seconds until it is covered."""
+        self.refill(now)
+        self.level -= min(amount, self.capacity)
+        return 0.0 if self.level >= 0 else -self.level * 60 / self.capacity
+
+
+class RateLimiter:
+    """Shared RPM/TPM limiter with header feedback and jittered backoff.
+
+    One limiter is shared by every request of a process, sync or async.
+    Set metrics to a translation.metrics.Metrics to record every request
+    made through create()/create_async() and every retry.
+    """
+
+    def __init__(self, rpm=DEFAULT_RPM, tpm=DEFAULT_TPM, base_delay=1.0, max_delay=60.0, seed=None):
+        self.requests = _Bucket(rpm)
+        self.tokens = _Bucket(tpm)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.blocked_until = 0.0
+        self.random = random.Random(seed)
+        self.sent = 0
+        self.waited = 0.0
+        self.throttled = 0
+        self.metrics = None
+
+    def set_limits(self, rpm=None, tpm=None):
+        """Resize the buckets; None leaves a limit unchanged."""
+        if rpm:
+            self.requests.capacity = rpm
+        if tpm:
+            self.tokens.capacity = tpm
+
+    def reserve(self, tokens=0):
+        """Reserve one request of tokens tokens; return the seconds to wait before sending."""
+        now = time.monotonic()
+        wait = max(self.requests.reserve(1, now), self.tokens.reserve(tokens, now),
+                   self.blocked_until - now)
+        self.sent += 1
+        self.waited += wait
+        return wait
+
+    def acquire(self, tokens=0):
+        wait = self.reserve(tokens)
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self, tokens=0):
+        wait = self.reserve(tokens)
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def observe(self, headers):
+        """Adopt the limits and remaining budget reported in x-ratelimit-* headers."""
+        if not headers:
+            return
+        now = time.monotonic()
+        for bucket, kind in ((self.requests, 'requests'), (self.tokens, 'tokens')):
+            try:
+                limit = headers.get(f'x-ratelimit-limit-{kind}')
+                if limit:
+                    bucket.capacity = float(limit)
+                remaining = headers.get(f'x-ratelimit-remaining-{kind}')
+                if remaining is not None:
+                    # Other clients may share the account; never assume more
+                    # budget than the server reports
+                    bucket.refill(now)
+                    bucket.level = min(bucket.level, float(remaining))
+                    reset = parse_duration(headers.get(f'x-ratelimit-reset-{kind}'))
+                    if float(remaining) <= 0 and reset:
+                        self.blocked_until = max(self.blocked_until, now + reset)
+            except ValueError:
+                continue
+
+    def backoff(self, attempt, error=None):
+        """Seconds to wait before retry number attempt + 1.
+
+        Uses the server's Retry-After when it sends one, otherwise an
+        exponential delay with jitter. A 429 pauses every caller of this
+        limiter, not just the one that hit it.
+        """
+        headers = error_headers(error)
+        delay = retry_after(headers)
+        if delay is None:
+            ceiling = min(self.max_delay, self.base_delay * 2 ** attempt)
+            delay = ceiling / 2 + self.random.uniform(0, ceiling / 2)
+        if error is not None and self.metrics is not None:
+            self.metrics.observe_retry(error)
+        if error is not None and is_rate_limited(error):
+            self.throttled += 1
+            self.blocked_until = max(self.blocked_until, time.monotonic() + delay)
+        return delay
+
+    def summary(self):
+        """One-line summary for the end-of-run report."""
+        return (f"{self.sent} requests, {self.waited:.1f}s spent waiting for the rate limit, "
+                f"{self.throttled} rate-limit responses "
+                f"(limits {self.requests.capacity:,.0f} RPM / {self.tokens.capacity:,.0f} TPM)")
+
+
+def _observe(limiter, start, response=None, error=None):
+    if limiter.metrics is not None:
+        limiter.metrics.observe_request(time.perf_counter() - start, response, error)
+
+
+def create(completions, limiter, params):
+    """Rate-limited chat completion; returns the parsed response."""
+    limiter.acquire(request_tokens(params))
+    start = time.perf_counter()
+    try:
+        raw = completions.with_raw_response.create(**params)
+    except Exception as e:
+        _observe(limiter, start, error=e)
+        raise
+    limiter.observe(raw.headers)
+    response = raw.parse()
+    _observe(limiter, start, response)
+    return response
+
+
+async def create_async(completions, limiter, params):
+    """create() for an AsyncOpenAI client."""
+    await limiter.acquire_async(request_tokens(params))
+    start = time.perf_counter()
+    try:
+        raw = await completions.with_raw_response.create(**params)
+    except Exception as e:
+        _observe(limiter, start, error=e)
+        raise
+    limiter.observe(raw.headers)
+    response = raw.parse()
+    _observe(limiter, start, response)
+    return response
@@ -0,0 +1,70 @@
+"""
+Resume index: which cells of the output CSV are already translated.
+
+For each (row identity, column) the index stores a hash of the source text
+and a hash of the translation that was accepted for it. On restart a cell
+whose source text is unchanged and whose current text hashes to its
+accepted translation is finished and is skipped with one dictionary
+lookup, instead of re-running the Swedish detector (whose false positives
+re-translate English text). A cell whose source changed is considered
+again; if it still holds the translation of the old source, it is outdated
+and goes back to its source text first.
+
+The index is a JSON sidecar next to the output CSV, written atomically
+when the run ends or is interrupted. Translations made after the last
+save are recovered from the checkpoint journal.
+"""
+
+import json
+import os
+
+from translation.journal import source_hash as content_hash
+
+INDEX_VERSION = 1
+
+
+def index_path(output_path):
+    return output_path + '.resume.json'
+
+
+class ResumeIndex:
+    """(row identity, column) -> (source hash, translation hash)."""
+
+    def __init__(self, path):
+        self.path = path
+        self.cells = {}
+        if os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') == INDEX_VERSION:
+                self.cells = {tuple(key.split('\t', 1)): tuple(value)
+                              for key, value in data['cells'].items()}
+
+    def __len__(self):
+        return len(self.cells)
+
+    def is_done(self, identity, column, source, text):
+        """True if text is the accepted translation of this cell's current source text."""
+        return self.cells.get((identity, column)) == (content_hash(source), content_hash(text))
+
+    def is_outdated(self, identity, column, source, text):
+        """True if text is the translation accepted for an earlier source text than source."""
+        entry = self.cells.get((identity, column))
+        return entry is not None and entry[1] == content_hash(text) and entry[0] != content_hash(source)
+
+    def accept(self, identity, column, source, translated):
+        self.accept_hashed(identity, column, content_hash(source), content_hash(translated))
+
+    def accept_hashed(self, identity, column, source_digest, translated_digest):
+        if identity is not None:
+            self.cells[(identity, column)] = (source_digest, translated_digest)
+
+    def save(self):
+        """Write the index via a temp file and an atomic rename."""
+        data = {'version': INDEX_VERSION,
+                'cells': {f'{identity}\t{column}': list(value)
+                          for (identity, column), value in self.cells.items()}}
+        temp_file = self.path + '.tmp'
+        with open(temp_file, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(temp_file, self.path)
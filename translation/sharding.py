@@ -0,0 +1,122 @@
+"""
+Multiprocess translation of a catalog CSV split into byte ranges.
+
+The rule-based translators are CPU-bound and every row is independent, so
+a large catalog can be spread over a process pool. The input is cut into
+byte ranges that end on CSV record boundaries: a newline outside quoted
+fields, found by tracking quote parity, since quoted cells may span lines.
+Each worker translates its ranges with its own copy of the pipeline and
+writes them to part files, which are concatenated in input order. The
+output is byte-identical to a single-process run.
+
+The pipeline, and the patterns compiled with it, reaches each worker once
+through the pool initializer, not once per range.
+"""
+
+import csv
+import io
+import mmap
+import os
+import shutil
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+
+from translation.streaming import STDIO, StreamStats
+
+# Ranges per worker; more, smaller ranges even out uneven rows
+CHUNKS_PER_WORKER = 4
+
+_pipeline = None  # set in each worker by _init_worker()
+
+
+def record_boundaries(path, parts):
+    """Return byte offsets [0, ..., size] splitting path into about `parts` ranges of whole records."""
+    size = os.path.getsize(path)
+    if size == 0:
+        return [0, 0]
+    bounds = [0]
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        pos = 0
+        quotes = 0  # '"' bytes before pos; odd means pos is inside a quoted field
+        for k in range(1, parts):
+            target = size * k // parts
+            if target <= pos:
+                continue
+            quotes += data[pos:target].count(b'"')
+            pos = target
+            while True:
+                newline = data.find(b'\n', pos)
+                if newline == -1:
+                    pos = size
+                    break
+                quotes += data[pos:newline].count(b'"')
+                pos = newline + 1
+                if quotes % 2 == 0:
+                    break
+            if pos >= size:
+                break
+            bounds.append(pos)
+    bounds.append(size)
+    return bounds
+
+
+def _init_worker(pipeline):
+    global _pipeline
+    _pipeline = pipeline
+
+
+def _translate_range(input_path, start, end, part_path):
+    """Translate bytes [start, end) of input_path into part_path; returns the range's StreamStats."""
+    with open(input_path, 'rb') as f:
+        f.seek(start)
+        text = f.read(end - start).decode('utf-8')
+    stats = StreamStats()
+    with open(part_path, 'w', encoding='utf-8', newline='') as out:
+        writer = csv.writer(out)
+        for row in csv.reader(io.StringIO(text, newline='')):
+            translated = _pipeline.translate_row(row)
+            writer.writerow(translated)
+            stats.count(translated)
+    return stats
+
+
+def translate_sharded(pipeline, input_path, output_path, workers):
+    """Translate input_path into output_path with a pool of `workers` processes.
+
+    input_path must be a file ('-' cannot be split); output_path may be '-'
+    for stdout. Returns the combined StreamStats.
+    """
+    bounds = record_boundaries(input_path, workers * CHUNKS_PER_WORKER)
+    ranges = list(zip(bounds, bounds[1:]))
+    stats = StreamStats()
+    with tempfile.TemporaryDirectory(prefix='translate-shards-') as parts_dir:
+        parts = [os.path.join(parts_dir, f'{i:05d}.csv') for i in range(len(ranges))]
+        with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(pipeline,)) as pool:
+            results = pool.map(_translate_range, [input_path] * len(ranges),
+                               [start for start, _ in ranges], [end for _, end in ranges], parts)
+            # Concatenate in input order as the ranges finish
+            to_stdout = output_path == STDIO
+            temp_file = None if to_stdout else output_path + '.tmp'
+            if to_stdout:
+                sys.stdout.flush()
+            out = sys.stdout.buffer if to_stdout else open(temp_file, 'wb')
+            try:
+                for part, part_stats in zip(parts, results):
+                    with open(part, 'rb') as f:
+                        shutil.copyfileobj(f, out)
+                    os.remove(part)
+                    stats.rows += part_stats.rows
+                    stats.data_rows += part_stats.data_rows
+                    stats.header_found = stats.header_found or part_stats.header_found
+            except BaseException:
+                if not to_stdout:
+                    out.close()
+                    os.remove(temp_file)
+                raise
+    if to_stdout:
+        out.flush()
+    else:
+        out.close()
+        os.replace(temp_file, output_path)
+    return stats
@@ -0,0 +1,148 @@
+"""
+Streaming translation of catalog CSVs in bounded memory.
+
+Pipeline.run() and the OpenAI scripts hold every row in memory, which is
+what deduplication, journaling and resuming need. Streaming instead reads
+one row at a time from a csv.reader, translates it and writes it out
+before the next one is read. Memory then stays flat however big the
+catalog is. '-' stands for stdin or stdout, so a script can sit in a
+shell pipeline:
+
+    zcat catalog.csv.gz | python3 translate_csv.py --input - --output - | gzip > en.csv.gz
+
+A file output is written to a temp file and renamed into place at the end,
+so an interrupted run leaves the previous file untouched.
+"""
+
+import asyncio
+import contextlib
+import csv
+import io
+import os
+import sys
+
+from translation.dispatch import dispatch
+from translation.pipeline import is_data_row, is_header
+
+STDIO = '-'
+
+# Rows read ahead of the oldest row not yet written, per request in flight
+WINDOW_PER_REQUEST = 4
+
+
+@contextlib.contextmanager
+def open_input(path):
+    """Open a catalog CSV for reading; '-' is stdin."""
+    if path == STDIO:
+        f = io.TextIOWrapper(sys.stdin.buffer, encoding='utf-8', newline='')
+        try:
+            yield f
+        finally:
+            f.detach()  # leave sys.stdin open
+    else:
+        with open(path, 'r', encoding='utf-8', newline='') as f:
+            yield f
+
+
+def stream_rows(f):
+    """Yield the rows of an open catalog CSV one at a time."""
+    yield from csv.reader(f)
+
+
+class RowWriter:
+    """Writes rows to path as they arrive; '-' is stdout.
+
+    Use as a context manager: a file is renamed into place only if the
+    block finishes without an exception and abort() was not called.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.aborted = False
+        if path == STDIO:
+            self._file = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', newline='',
+                                          write_through=True)
+            self._temp = None
+        else:
+            self._temp = path + '.tmp'
+            self._file = open(self._temp, 'w', encoding='utf-8', newline='')
+        self._writer = csv.writer(self._file)
+
+    def write(self, row):
+        self._writer.writerow(row)
+
+    def abort(self):
+        """Keep whatever is at path now instead of the rows written so far."""
+        self.aborted = True
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if self._temp is None:
+            self._file.flush()
+            self._file.detach()
+            return False
+        self._file.close()
+        if exc_type is None and not self.aborted:
+            os.replace(self._temp, self.path)
+        else:
+            os.remove(self._temp)
+        return False
+
+
+class StreamStats:
+    """Row counts of one streaming run."""
+
+    def __init__(self):
+        self.rows = 0
+        self.data_rows = 0
+        self.header_found = False
+        self.interrupted = False
+
+    def count(self, row):
+        self.rows += 1
+        if is_header(row):
+            self.header_found = True
+        elif is_data_row(row):
+            self.data_rows += 1
+
+
+def stream_translate(pipeline, input_path, output_path, concurrency=1, on_row=None):
+    """Translate input_path into output_path one row at a time; returns StreamStats.
+
+    With concurrency > 1 up to that many rows are translated at once with
+    Pipeline.translate_row_async, and rows are still written in input
+    order. on_row(stats), if given, is called after every row written.
+    While writing to stdout, print() output goes to stderr so it cannot
+    end up in the CSV.
+    """
+    stats = StreamStats()
+    redirect = contextlib.redirect_stdout(sys.stderr) if output_path == STDIO else contextlib.nullcontext()
+    with open_input(input_path) as source, RowWriter(output_path) as writer, redirect:
+
+        def emit(row):
+            writer.write(row)
+            stats.count(row)
+            if on_row is not None:
+                on_row(stats)
+
+        rows = stream_rows(source)
+        if concurrency > 1:
+            def on_result(index, row, result, error):
+                if error is not None:
+                    print(f"  ✗ Error translating row {index + 1}: {error} (kept as is)")
+                    result = row
+                emit(result)
+
+            stats.interrupted = asyncio.run(dispatch(rows, pipeline.translate_row_async, concurrency,
+                                                     on_result, window=concurrency * WINDOW_PER_REQUEST))
+        else:
+            try:
+                for row in rows:
+                    emit(pipeline.translate_row(row))
+            except KeyboardInterrupt:
+                stats.interrupted = True
+        if stats.interrupted:
+            writer.abort()
+    return stats
@@ -0,0 +1,428 @@
+"""
+Swedish-text detection shared by the OpenAI translation scripts.
+
+All indicator terms are compiled into one Aho-Corasick automaton, so a cell
+is scanned once regardless of how long the list grows.
+"""
+
+from translation.matchers import AhoCorasick
+
+SWEDISH_CHARS = ['å', 'ä', 'ö', 'Å', 'Ä', 'Ö']
+
+# Comprehensive list of common Swedish words
+SWEDISH_INDICATORS = [
+    # Common words
+    'är', 'och', 'för', 'med', 'på', 'av', 'till', 'det', 'som', 'kan',
+    'inte', 'eller', 'vid', 'bättre', 'högre', 'lägre', 'från', 'till',
+    'den', 'en', 'ett', 'de', 'om', 'i', 'att', 'har', 'var', 'så',
+    # Medical/supplement terms (additional)
+    'allergi', 'synaptisk', 'plasticitet', 'senolytisk', 'ionofor',
+    # Medical/supplement terms
+    'prekursor', 'mimetikum', 'neuroplasticitet', 'infektionsskydd',
+    'fettlöslig', 'mitokondriell', 'energi', 'mitokondrier', 'vakenhet',
+    'belastar', 'levern', 'leverenzym', 'immunstöd', 'hämmar', 'kväveoxidsyntas',
+    'neuropati', 'humör', 'metabolit', 'magsyra', 'magsår', 'halsbränna',
+    'matsmältning', 'lugnande', 'renad', 'laxerande', 'kolinkälla', 'kraft',
+    'effektivt', 'luftvägsinfektion', 'kreativitet', 'ångest', 'fokus',
+    'racetam', 'gaser', 'traditionell', 'användning', 'sömn', 'hämmare',
+    'kamomill', 'persilja', 'inflammation', 'muskeltillväxt', 'anabol',
+    'signal', 'kronisk', 'bättre', 'tveksam', 'biotillgänglighet', 'stress',
+    'sömnbärande', 'cykla', 'veckor', 'mat', 'kvällen', 'påverka',
+    'sköldkörtel', 'sederande', 'solskydd', 'lyster', 'karotenoid',
+    'hud', 'ögon', 'naturlig', 'mikroalger', 'immunstärkande', 'långtids',
+    'ökar', 'vita', 'blodkroppar', 'komplex', 'nerver', 'kofaktorer',
+    'signalsubstanser', 'homocystein', 'metylering', 'hjärnatrofi', 'skydd',
+    'inlärning', 'veckor', 'full', 'effekt', 'minne', 'fett', 'fettlösliga',
+    'magbesvär', 'trötthet', 'blodsocker', 'insulin', 'mimic', 'korosolsyra',
+    'hypoglykemi', 'minskad', 'muskelsparande', 'tillväxt', 'diabetisk',
+    'neuropati', 'ages', 'upptag', 'tiamin', 'aktivering', 'dåligt',
+    'tarmflora', 'interagerar', 'enzym', 'snällare', 'magen', 'buffrar',
+    'mjölksyra', 'stickningar', 'ofarliga', 'kräver', 'laddning', 'veckor',
+    'parestesi', 'metylgivare', 'kraftutveckling', 'stödjer', 'produktion',
+    'endast', 'stomach', 'ulcers', 'wounds', 'bränner', 'behov', 'provitamin',
+    'hudskydd', 'omvandlas', 'behov', 'säkrare', 'prostata', 'kolesterol',
+    'växtsterol', 'vitalitet', 'immune', 'nutrient', 'dense', 'allergy',
+    'mdr', 'stomach', 'psychobiotic', 'svartpeppar', 'upptag', 'substances',
+    'glukuronidering', 'affects', 'medication', 'hår', 'naglar', 'interferes',
+    'lab', 'tests', 'thyroid', 'heart', 'växt', 'hair', 'growth', 'b-vitamin',
+    'test', 'interference', 'bitter', 'melon', 'charantin', 'plant', 'birch',
+    'leaf', 'urinary', 'tract', 'detox', 'diuretic', 'blueberry', 'extract',
+    'memory', 'antocyaniner', 'fenugreek', 'libido', 'testofen', 'extract',
+    'after', 'meals', 'fiber', 'saponins', 'boron', 'citrate', 'glycinate',
+    'free', 'testosterone', 'bones', 'lowers', 'shbg', 'bone', 'health',
+    'hormones', 'joints', 'akba', 'lox', 'inhibitor', 'ledsmärta', 'choose',
+    'content', 'broccoli', 'sprout', 'sulforaphane', 'hormone', 'balance',
+    'potent', 'pineapple', 'protein', 'swelling', 'tom', 'stomach', 'injury',
+    'stinging', 'nettle', 'allergy', 'binds', 'shbg', 'root', 'leaves',
+    'immune', 'defense', 'antioxidant', 'liposomal', 'higher', 'uptake',
+    'stays', 'longer', 'expensive', 'effective', 'cayenne', 'thermogenesis',
+    'irritate', 'catuaba', 'bark', 'dopamine', 'brazilian', 'cbd', 'oil',
+    'fullspektrum', 'smärta', 'endocannabinoid', 'system', 'price', 'celastrus',
+    'paniculatus', 'intellect', 'tree', 'ayurvedic', 'nootropic', 'chaga',
+    'mushroom', 'birch', 'chlorella', 'broken', 'cell', 'wall', 'chlorophyll',
+    'måste', 'ha', 'chrysin', 'aromatase', 'inhibitor', 'theoretical', 'poor',
+    'oral', 'uptake', 'cissus', 'quadrangularis', 'bone', 'healing', 'ketosterones',
+    'citikolin', 'citicoline', 'acetylcholine', 'dopamin', 'focus', 'energy',
+    'ökar', 'dopaminereceptorer', 'phospholipids', 'mycket', 'bra', 'bioavailablehet',
+    'lemon', 'balm', 'melissa', 'officinalis', 'calming', 'gaba', 'transaminase',
+    'inhibitor', 'cognition', 'anxiety', 'gaba-t', 'citrulline', 'malate',
+    'pre-workout', 'pump', 'blood', 'flow', 'raising', 'conjugated', 'linoleic',
+    'acid', 'fat', 'loss', 'moderate', 'effect', 'safflower', 'questionable',
+    'humans', 'wrinkle', 'reduction', 'ubiquinone', 'ubiquinol', 'cordyceps',
+    'sinensis', 'oxygen', 'uptake', 'atp', 'mycelium', 'most', 'common',
+    'phytosome', 'piperine', 'required', 'regular', 'has', 'anti-inflammatory',
+    'longvida', 'brain', 'cognition', 'crosses', 'bbb', 'free', 'meriva',
+    'joint', 'clinically', 'studied', 'form', 'd-aspartic', 'acid', 'daa',
+    'temporary', 'boost', 'lh', 'stimulation', 'diminishes', 'short', 'term',
+    'pulse', 'd-chiro-inositol', 'pcos', 'ratio', 'myo', 'secondary', 'messenger',
+    'd-mannose', 'urinary', 'tract', 'infection', 'e.', 'coli', 'binds', 'bacteria',
+    'bladder', 'binder', 'd-serine', 'nmda-receptor', 'schizofreni-studier',
+    'hormonell', 'effekt', 't-cellsaktivering', 'kritisk', 'säsongsdepression',
+    'sad', 'serotoninsyntes', 'receptorer', 'insulinsekretion', 'betacell-funktion',
+    'damiana', 'båda', 'könen', 'avslappnande', 'dgl', 'deglycyrrhizinated',
+    'licorice', 'utan', 'glycyrrhizin', 'höjer', 'ej', 'blodtryck', 'dhea',
+    'hormonprekursor', 'endast', 'konstaterad', 'brist', 'ålder', 'hormonella',
+    'biverkningar', 'äldre', 't', 'östrogen', 'hormonell', 'obalans', 'dim',
+    'diindolylmethane', 'östrogenmetabolism', 'från', 'kålväxter', 'ändra',
+    'balance', 'bra', 'metaboliter', 'akne', 'pms', 'kål', 'devil', 'claw',
+    'ryggvärk', 'artros', 'harpagosid', 'dong', 'quai', 'kvinnlig', 'hälsa',
+    'ginseng', 'grape', 'seed', 'extract', 'blodtryck', 'cirkulation', 'rikt',
+    'opc', 'proantocyanidiner', 'ödem', 'standardiserat', 'kollagenskydd', 'kärl',
+    'dynamine', 'methylliberine', 'snabb', 'snabbare', 'koffein', 'teakrin',
+    'vitamin', 'e', 'immunfunktion', 'äldre', 't-cellsfunktion', 'gamma-tocopherol',
+    'antiinflammatorisk', 'form', 'kompletterar', 'alfa-tokoferol', 'eaa',
+    'essential', 'amino', 'acids', 'stimulerar', 'proteinsyntes', 'mtor', 'kring',
+    'träning', 'ecdysterone', 'spinach', 'cyanotis', 'muskelbyggande', 'anabol',
+    'binder', 'er-beta', 'receptorn', 'echinacea', 'förkylning', 'fagocytos',
+    'autoimmune', 'risk', 'electrolytes', 'na', 'k', 'mg', 'hydrering', 'svettning',
+    'balans', 'viktig', 'enoki', 'dao', 'diamine', 'oxidase', 'histaminintolerans',
+    'bryter', 'ner', 'histamin', 'digestive', 'enzymes', 'digestionsstöd', 'take',
+    'varierar', 'stort', 'gluten', 'digesting', 'dpp-iv', 'vid', 'glutenkänslighet',
+    'celiaki', 'prolin-rika', 'proteiner', 'lactase', 'enzyme', 'laktosintolerans',
+    'intag', 'mjölk', 'epicatechin', 'myostatinhämmare', 'muskler', 'kakao', 'te',
+    'exogenous', 'ketones', 'bhb', 'salts', 'omedelbar', 'ketos', 'hjärnenergi',
+    'innehåller', 'mycket', 'salt', 'magbesvär', 'fasoracetam', 'adhd-forskning',
+    'uppreglerar', 'fenugreek', 'bockhornsklöver', 'amning', 'blockera', 'dht',
+    'dl-phenylalanine', 'dlpa', 'pain', 'endorfiner', 'blandning', 'd-', 'l-form',
+    'pea', 'phenylethylamine', 'kärleksmolekylen', 'bryts', 'ner', 'snabbt', 'mao-b',
+    'kortvarig', 'phenylpiracetam', 'fysisk', 'mental', 'kyla', 'stimulerande',
+    'dopingklassad', 'tävling', 'tolerans', 'snabbt', 'fiber', 'glucomannan',
+    'mättnad', 'gelbildande', 'fisetin', 'hög', 'dos', 'korta', 'intervall',
+    'senolytiskt', 'take', 'fat', 'biotillgänglighet', 'fish', 'oil', 'omega-3',
+    'ledstelhet', 'antiinflammatorisk', 'elderberry', 'sambucus', 'förkylning',
+    'influensa', 'antiviral', 'effekt', 'fo-ti', 'he', 'shou', 'wu', 'grått',
+    'hår', 'vitalitet', 'leverpåverkan', 'försiktig', 'levertoxicitet', 'folic',
+    'acid', 'graviditet', 'celldelning', 'syntetisk', 'maskera', 'b12-brist',
+    'methylfolate', 'foster', 'aktivt', 'folat', 'forskolin', 'coleus', 'forskohlii',
+    'fettförbränning', 'camp', 'standardiserad', 'mage', 'lös', 'phosphatidic',
+    'muskelstyrka', 'direkt', 'signal', 'phosphatidylserine', 'sänker', 'kortisol',
+    'stödjer', 'soja', 'solroslecitin', 'ursprung', 'driven', 'kvällen', 'membranfluiditet',
+    'fucoxanthin', 'från', 'tång', 'tid', 'fennel', 'seed', 'kramp-dämpande',
+    'gaba', 'poor', 'over', 'bbb', 'fysiologiskt', 'stickningar', 'kan', 'förekomma',
+    'pharmagaba', 'fermenterad', 'gh', 'theoreticalt', 'galantamine', 'drömmar',
+    'lucid', 'dreaming', 'alzheimer-medicin', 'även', 'tillskott', 'illamående',
+    'garcinia', 'cambogia', 'hca', 'aptit', 'fettsyntes', 'debatterad', 'ginkgo',
+    'biloba', 'cirkulation', 'hjärna', 'äldre', 'blodflöde', 'minne', 'egb-761',
+    'sexuellt', 'mikrocirkulation', 'blödning', 'panax', 'ginseng', 'erektion',
+    'kväveoxid-mediator', 'amerikansk', 'kylande', 'tcm', 'standardisera', 'ginsenosider',
+    'höja', 'sibirisk', 'eleuthero', 'siberian', 'uthållighet', 'mildare', 'gla',
+    'nattljusolja', 'evening', 'primrose', 'skinproblem', 'eksem', 'omega-6',
+    'glukomannan', 'konjac', 'mättnadskänsla', 'expanderar', 'drick', 'vatten',
+    'kvävningsrisk', 'glukosamin', 'sulfate', 'sulfat', 'hcl', 'broskhälsa',
+    'evidens', 'skaldjursallergy', 'glutathione', 'reducerat', 'reduced', 'dåligt',
+    'oralt', 'setria', 'bättre', 'skinuppljusning', 'liposomalt', 'master',
+    'defenseets', 'bränsle', 'glycerol', 'glycerpump', 'hyperhydrering', 'binder',
+    'vätska', 'muskeln', 'klumpar', 'sig', 'pulver', 'glycine', 'sleepkvalitet',
+    'kollagenbyggsten', 'söt', 'smak', 'tas', 'sänggående', 'kroppstemp', 'goji',
+    'berry', 'lycium', 'zeaxantin', 'gotu', 'kola', 'centella', 'asiatica',
+    'cirkulation', 'kollagensyntes', 'nerver', 'neuroprotektiv', 'grains', 'paradise',
+    'aframomum', 'aktiverar', 'brunt', 'batt', 'krydda', 'ingefärsfamiljen',
+    'pomegranate', 'extract', 'ellagsyra', 'omvandlas', 'urolithin', 'grapefruit',
+    'seed', 'extract', 'kontroversiell', 'konserveringsmedel', 'cyp3a4-hämmare',
+    'gröna', 'kaffebönor', 'green', 'coffee', 'bean', 'klorogensyra', 'lågt',
+    'vikt', 'glukosupptag', 'grönt', 'te', 'egcg', 'påverka', 'extrem', 'dos',
+    'sällsynt', 'skydd', 'polyfenoler', 'guaraná', 'guarana', 'naturligt', 'långsamt',
+    'frisläpps', 'långsammare', 'syntetiskt', 'gullris', 'goldenrod', 'njurar',
+    'urinvägar', 'diuretic', 'gurkmeja', 'hel', 'turmeric', 'root', 'powder',
+    'mild', 'svårupptagen', 'svartpeppar', 'gymnema', 'sylvestre', 'sockerblockerare',
+    'regenerera', 'betaceller', 'sockerbegär', 'sugar', 'destroyer', 'blockerar',
+    'smak', 'hawthorn', 'hjärtsvikt', 'kontraktilitet', 'digoxin-interaktion',
+    'hallonblad', 'raspberry', 'leaf', 'livmoderhälsa', 'traditionell', 'gravidte',
+    'hallonketoner', 'ketones', 'strukturellt', 'lik', 'synefrin', 'capsaicin',
+    'hemp', 'protein', 'veganskt', 'fiberrikt', 'lägre', 'proteinhalt', 'havtornsolja',
+    'sea', 'buckthorn', 'torra', 'slemhinnor', 'underliv', 'hesperidin', 'cirkulation',
+    'vener', 'ofta', 'citrusbioflavonoider', 'hibiskus', 'hibiscus', 'tea', 'fungerar',
+    'mild', 'ace-hämmare', 'koppar', 'higenamine', 'beta-2', 'agonist', 'luftvägar',
+    'wada-förbjuden', 'hjärtklappning', 'hmb', 'beta-hydroxy', 'beta-methylbutyrate',
+    'antikatabolt', 'diet', 'kalciumsalt', 'fri', 'syra', 'holy', 'basil', 'tulsi',
+    'adaptogen', 'hordenin', 'mao-b', 'hämmare', 'förlänger', 'stimulanter', 'horny',
+    'goat', 'weed', 'icariin', 'pde5-hämmare', 'svag', 'standardisera', 'hops',
+    'extract', 'sedativ', 'valeriana', 'huperzine', 'a', 'acetylkolinesterashämmare',
+    'cykla', 'undvika', 'kolinerga', 'biverkningar', 'ache-hämmare', 'hyaluronic',
+    'acid', 'skin', 'fukt', 'binder', 'vatten', 'ledvätska', 'oral', 'fungerar',
+    'fuktighet', 'molekylvikt', 'svårabsorberad', 'indole-3-carbinol', 'i3c',
+    'prekursor', 'mindre', 'stabil', 'ginger', 'root', 'illamående', 'prokinetisk',
+    'tömmer', 'liknar', 'nsaid', 'cox-hämmare', 'gingeroler', 'aktiva', 'ämnet',
+    'blodförtunnande', 'inositol', 'panikanxiety', 'ocd', 'höga', 'doser', 'krävs',
+    'insulinkänslighet', 'cellsignalering', 'ip6', 'hexaphosphate', 'cellhälsa',
+    'kelaterar', 'mineraler', 'pulverform', 'enklast', 'lös', 'inulin', 'fos',
+    'prebiotika', 'kan', 'ge', 'fodmap', 'iodine', 'sköldkörtel', 'hjärna',
+    'kaliumjodid', 'kelp', 'autoimmune', 'tyreoidit', 'balans', 'johannesört',
+    'st.', "john's", 'wort', 'mild', 'många', 'läkemedelsinteraktioner', 'p-piller',
+    'antidepressiva', 'ssri-liknande', 'läkemedelsinteraktion', 'jordbaserad',
+    'soil', 'based', 'organisms', 'sbo', 'tålig', 'sporform', 'bacillus-stammar',
+    'subtilis', 'iron', 'menstruerande', 'kvinnor', 'ersätter', 'förlust', 'bisglycinat',
+    'blodvärde', 'skonsam', 'endast', 'brist', 'oxidativ', 'stress', 'överskott',
+    'heme', 'animaliskt', 'färre', 'magbiverkningar', 'överdosrisk', 'sulfat',
+    'anemi', 'hård', 'toxiskt', 'barn', 'jättenattljusolja', 'pms', 'bröstömhet',
+    'gamma-linolensyra', 'calcium', 'benskörhet', 'kombinera', 'd3', 'k2', 'kärlrisk',
+    'citrate', 'oberoende', 'magsyra', 'risk', 'för', 'kärlförkalkning', 'karbonat',
+    'take', 'kräver', 'syra', 'förstoppning', 'alfa-ketoglutarate', 'ca-akg',
+    'förlänger', 'healthspan', 'sänker', 'biologisk', 'ålder', 'fördröjd', 'frisättning',
+    'sustained', 'release', 'd-glucarate', 'toxiner', 'hämmar', 'beta-glukuronidas',
+    'kan', 'öka', 'utsöndring', 'medicin', 'glukuronidering', 'potassium', 'muskelfunktion',
+    'dos', 'tillskott', 'pga', 'säkerhetsrisk', 'hjärtrisk', 'njursvikt', 'via', 'kost',
+    'njurproblem', 'chamomile', 'apigenin', 'cinnamon', 'ceylon', 'välj', 'lågt',
+    'kumarin', 'caprylic', 'acid', 'candida', 'tarmhälsa', 'fettsyra', 'kokos',
+    'carnitine', 'hjärthälsa', 'angina', 'energiproduktion', 'tmao', 'mitokondriell',
+    'transport', 'casein', 'långsamt', 'natt', 'antikatabolt', 'mjölkallergy', 'catalase',
+    'h2o2-nedbrytning', 'tveksamt', 'kava', 'kavalaktoner', 'leverrisk', 'missbruk',
+    'alkohol', 'keratin', 'solubiliserat', 'solubilized', 'hairstruktur', 'cynatine',
+    'hns', 'varumärke', 'kisel', 'bambu', 'bamboo', 'horsetail', 'nagel-styrka',
+    'rikare', 'åkerfräken', 'orto-kisel', 'klorofyll', 'kroppslukt', 'gröna', 'växter',
+    'alger', 'caffeine', 'anhydrous', 'prestationshöjande', 'snabb', 'absorption',
+    'toleransutveckling', 'sleepstörning', 'adenosin-antagonist', 'theanin', 'jitters',
+    'klassisk', 'stack', 'kolanöt', 'kola', 'nut', 'koffeinkälla', 'traditionell',
+    'stimulant', 'choline', 'bitartrate', 'cellmembran', 'kan', 'öka', 'hydrolyserat',
+    'hydrolyzed', 'peptides', 'tas', 'gärna', 'c-vitamin', 'types', 'bovint', 'marint',
+    'uc-ii', 'autoimmune', 'oral', 'tolerans', 'liten', 'colostrum', 'antikroppar',
+    'ig', 'råmjölk', 'mjölkprotein', 'chondroitin', 'synergi', 'synergistisk',
+    'blodförtunnande', 'copper', 'pigment', 'balansera', 'alltid', 'toxiskt', 'i',
+    'överskott', 'barley', 'grass', 'näring', 'antioxidanter', 'liknar', 'vetegräs',
+    'glutenrisk', 'kre-alkalyn', 'buffered', 'ph-stabilt', 'bevisat', 'monohydrat',
+    'kognitiv', 'fatigue', 'hcl', 'samma', 'effekt', 'mono', 'mindre', 'vattenretention',
+    'theoreticalt', 'sur', 'smak', 'underhållsdos', 'dagligen', 'laddning', 'valfri',
+    'bäst', 'kolhydrater', 'drick', 'extra', 'krom', 'chromium', 'sötsug', 'pikolinat',
+    'picolinate', 'stabilt', 'upptagbart', 'kronärtskocka', 'artichoke', 'galla',
+    'minskar', 'uppblåsthet', 'gallsten', 'cynarin', 'gallflöde', 'kurkumin', 'curcumin',
+    'hjärninflammation', 'plack', 'l-arginine', 'kväveoxid', 'sämre', 'citrulline',
+    'stor', 'del', 'bryts', 'ner', 'herpesutbrott', 'l-citrullin', 'no-boost',
+    'l-cysteine', 'keratinbyggsten', 'svavelaminosyra', 'l-fenylalanin', 'l-phenylalanine',
+    'noradrenalin-prekursor', 'aptitdämpning', 'ej', 'pku', 'l-glutamin', 'l-glutamine',
+    'tarmslemhinna', 'primärt', 'bränsle', 'enterocyter', 'tarmvägg', 'muskelåterhämtning',
+    'tarmceller', 'l-karnitin', 'l-tartrat', 'l-carnitine', 'androgenreceptorer',
+    'muskelvävnad', 'l-lysine', 'l-lysine', 'herpes', 'munsår', 'antagonist',
+    'l-metionin', 'l-methionine', 'essentiell', 'aminosyra', 'l-metylfolat',
+    'l-methylfolate', '5-mthf', 'mthfr-mutation', 'aktiv', 'form', 'kräver', 'omvandling',
+    'l-ornitin', 'l-ornithine', 'ammoniak-detox', 'synergi', 'l-thp', 'l-tetrahydropalmatine',
+    'smärta', 'dopamine-antagonist', 'corydalis', 'sedering', 'l-tryptofan', 'l-tryptophan',
+    'melatonin-prekursor', 'konkurrerar', 'bcaa', 'akut', 'kyla', 'sömnbrist', 'tom',
+    'sköldkörtelinteraktion', 'lactobacillus', 'rhamnosus', 'gg', 'immun', 'allergy',
+    'välstuderad', 'stam', 'lakritsrot', 'deglycyrrhizinerad', 'höjer', 'tryck',
+    'laktoferrin', 'lactoferrin', 'järnbindande', 'lavendelolja', 'lavender', 'oral',
+    'silexan', 'studerat', 'rapar', 'lavendel', 'laxogenin', '5-alpha-hydroxy-laxogenin',
+    'växtanabol', 'kortisolkontroll', 'smilax', 'sieboldii', 'leucin', 'l-leucine',
+    'mtor-trigger', 'viktigaste', 'anabolism', 'lingonextrakt', 'lingonberry', 'resveratrol',
+    'procyanidiner', "lion's", 'mane', 'ngf', 'nervtillväxt', 'fruktkropp', 'varmvattens-',
+    'alkoholextrakt', 'litiumorotat', 'lithium', 'orotate', 'humörsvängningar', 'mikrodos',
+    'läkemedelsdos', 'lutein', 'skinelasticitet', 'blått', 'ljus-skydd', 'zeaxanthin',
+    'ögonhälsa', 'gula', 'fläcken', 'carotenoider', 'skyddar', 'mot', 'luteolin',
+    'neuroprotektion', 'hämmar', 'mikroglia-aktivering', 'lycopene', 'tomater', 'tomat',
+    'tomatextrakt', 'motverkar', 'balansera', 'läkemalva', 'marshmallow', 'slemhinnor',
+    'hosta', 'liknar', 'rödalmsbark', 'irriterad', 'tarm', 'hals', 'slemsubstans',
+    'maca', 'spermieproduktion', 'gelatiniserad', 'gul', 'allmän', 'hälsa', 'standardtypen',
+    'röd', 'boneshälsa', 'påverkar', 'direkt', 'svart', 'magnesium', 'spänning',
+    'lugnar', 'nervsystemet', 'arytmi', 'relaxing', 'vessels', 'insulinresistens',
+    'kofaktor', 'glykolys', 'l-threonate', 'refers', 'total', 'compound', 'approximately',
+    'elemental', 'unique', 'ability', 'cross', 'blood-brain', 'barrier', 'glycinate',
+    'preferably', 'gentle', 'relaxation', 'kombo', 'malate', 'fibromyalgia', 'taurate',
+    'calming', 'taurine', 'increases', 'intracellular', 'magnoliabark', 'magnolia', 'bark',
+    'honokiol', 'magnolol', 'aktivit', 'ämne', 'maitake', 'd-fraction', 'immunaktivering',
+    'fraktion', 'manganese', 'sod', 'neurotoxiskt', 'mycket', 'höga', 'doser', 'manuka',
+    'honey', 'mgo', 'lokal', 'sår', 'socker', 'maskrosblad', 'dandelion', 'vätskedrivande',
+    'kaliumsparande', 'bladen', 'njurarna', 'maskrosrot', 'diuretika', 'mct-olja', 'mct',
+    'oil', 'c8', 'c10', 'ketone', 'production', 'kaprylsyra', 'mest', 'potent', 'start',
+    'discomfort', 'alzheimer-stöd', 'thermogenesis', 'ketoner', 'energiförbrukning',
+    'caprylic', 'börja', 'lågt', 'magras', 'pulver', 'gentler', 'än', 'olja', 'melatonin',
+    'insomning', 'dygnsrytm', 'ofta', 'effektivare', 'kan', 'ge', 'mardrömmar', 'hormon',
+    'drömmar', 'mjölkdistel', 'milk', 'thistle', 'silymarin', 'leverhälsa', 'komplex',
+    'hepatocyter', 'cyp-interaktioner', 'mjölon', 'uva', 'ursi', 'akut', 'arbutin',
+    'bildar', 'hydrokinon', 'korttidsbruk', 'molybdenum', 'sulfiter', 'urinsyra',
+    'essentiellt', 'spårämne', 'monolaurin', 'höljeförsedda', 'kokosolja', 'laurinsyra',
+    'msm', 'methylsulfonylmethane', 'svaveldonator', 'ledhälsa', 'antioxidat', 'tas',
+    'upp', 'väl', 'skönhetsmineral', 'mucuna', 'pruriens', 'l-dopa', 'motivations-boost',
+    'nedreglering', 'muira', 'puama', 'potency', 'wood', 'munkpeppar', 'vitex', 'chasteberry',
+    'progesteron', 'prolaktin', 'myo-inositol', 'släkting', 'n-acetyl', 'l-tyrosin',
+    'nalt', 'mer', 'löslig', 'sämre', 'omvandling', 'tyr', 'water-soluble', 'n-metyltyramin',
+    'n-methyltyramine', 'gastrin', 'n-acetyl', 'cysteine', 'slem', 'lungor', 'tvångssyndrom',
+    'beroende', 'glutamat-modulering', 'n-acetylcystein', 'slemrösande', 'svaveldoft',
+    'biotillgänglig', 'natriumbikarbonat', 'sodium', 'bicarbonate', 'mjölksyrabuffert',
+    'kroppsvikt', 'magsmärtor', 'magkramp', 'diarré', 'nattokinase', 'blodcirkulation',
+    'fibrinolytisk', 'niacin', 'nicotinic', 'acid', 'hdl', 'ldl-kvot', 'flush-varianten',
+    'niacinamide', 'nicotinamide', 'ingen', 'akne', 'skinbarrier', 'rodnad', 'nmn',
+    'nicotinamide', 'mononucleotide', 'morgonen', 'stöd', 'sublingualt', 'liposomalt',
+    'föredras', 'påverkar', 'methylation', 'åldersrelaterad', 'noopept', 'bdnf', 'ngf',
+    'mycket', 'potent', 'mg-dos', 'nässla', 'blad', 'nettle', 'histaminhämmande',
+    'rot', 'bph', 'shbg-bindning', 'odenaturerat', 'undenatured', 'immunmodulering',
+    'ledhälsa', 'verkar', 'tarmen', "peyer's", 'patches', 'oktopamin', 'octopamine',
+    'norepinefrin', 'svagare', 'oleamid', 'oleamide', 'sleepinducering', 'ackumuleras',
+    'sömnbrist', 'olivbladsextrakt', 'olive', 'leaf', 'extract', 'oleuropein', 'herxheimer-reaktion',
+    'epa', 'dha', 'total', 'mängd', 'fatrik', 'måltid', 'skin', 'fukt', 'viktigast',
+    'mood', 'oreganoolja', 'oregano', 'oil', 'starkt', 'irritera', 'slemhinnor', 'slår',
+    'ut', 'goda', 'bakterier', 'stark', 'carvacrol', 'ornitin', 'ammoniak', 'ostronskivling',
+    'oyster', 'mushroom', 'lovastatin', 'statin-liknande', 'ämnen', 'oxgalla', 'ox', 'bile',
+    'fettsmältning', 'utan', 'gallblåsa', 'ersätter', 'galla', 'oxiracetam', 'logik',
+    'stimulans', 'p-5-p', 'pyridoxal-5-phosphate', 'pyridoxal', 'kofaktor', 'neurotransmittorer',
+    'leveromvandling', 'höga', 'neuropati', 'paba', 'b-vitaminkofaktor', 'dela', 'folsyra-molekylen',
+    'sulfamedicin-interaktion', 'förr', 'tiden', 'folat', 'pantetin', 'pantethine', 'aktiv',
+    'b5', 'kolesterol', 'pantotensyra', 'pantothenic', 'akne', 'fettmetabolism', 'papaya',
+    'enzyme', 'papain', 'protein-nedbrytning', 'tuggtabletter', 'vanliga', 'passionsblomma',
+    'passion', 'flower', 'dåsighet', 'pepparmynta', 'peppermint', 'ibs', 'kramp', 'tarm',
+    'enterokapslar', 'bäst', 'refluxrisk', 'kapslad', 'halsbränna', 'phenylalanine',
+    'pkU-varning', 'phgg', 'guar', 'gum', 'väl', 'tolererad', 'gasbildande', 'polygala',
+    'tenuifolia', 'neuroplasticitet', 'unik', 'verkningsmekanism', 'poria', 'cocos',
+    'njurhälsa', 'kinesisk', 'medicin', 'pqq', 'pyrroloquinoline', 'quinone', 'mitokondriell',
+    'biogenes', 'synergi', 'q10', 'skinens', 'mitokondrier', 'nytt', 'inom', 'skinvård',
+    'hjärna', 'hjärta', 'nybildning', 'pramiracetam', 'starkt', 'fettlöslig', 'emotionell',
+    'avtrubbning', 'prebiotika', 'galaktooligosackarider', 'snällare', 'mat', 'bakterier',
+    'pregnenolon', 'pregnenolone', 'master', 'hormone', 'neurosteroid', 'hormonpåverkan',
+    'probiotika', 'allmän', 'multi-strain', 'tarm-immune-axel', 'defenseet', 'probiotic',
+    'longum', 'stressstomach', 'acidophilus', 'allmän', 'maghälsa', 'laktos', 'vanligaste',
+    'reuteri', 'dsm', '17938', 'kolik', 'd-vitaminupptag', 'stam-specifik', 'rhamnosus',
+    'diarré', 'boulardii', 'saccharomyces', 'mot', 'antibiotika-diarré', 'jästsvamp',
+    'dör', 'antibiotika', 'immunesupprimerade', 'prolin', 'l-proline', 'kollagenstruktur',
+    'icke-essentiell', 'bee', 'propolis', 'bikupa-antibiotika', 'munhåla', 'psyllium',
+    'husk', 'sänker', 'cholesterol', 'mättnad', 'måste', 'mycket', 'vatten', 'kan',
+    'påverka', 'medicinupptag', 'pterostilben', 'pterostilbene', 'mer', 'potent', 'analog',
+    'bättre', 'oral', 'pumpakärnolja', 'pumpkin', 'seed', 'oil', 'hairavfall', 'naturlig',
+    'betasitosterol', 'pumpakärnor', 'blåsa', 'pycnogenol', 'pine', 'bark', 'patenterat',
+    'skinelasticitet', 'pigmentering', 'tallbarksextrakt', 'pygeum', 'africanum', 'afrikanskt',
+    'plommon', 'ofta', 'kombinerat', 'saw', 'palmetto', 'hjärtsvikt', 'statin-biverkning',
+    'till', 'hjärtat', 'ubiquinol', 'reducerade', 'aktiva', 'interagerar', 'waran',
+    'quercetin', 'zink-jonofor', 'senolytisk', 'fytosom', 'virusinträde', 'rauwolscine',
+    'alpha-yohimbine', 'liknar', 'yohimbin', 'stereoisomer', 'stark', 'reishi', 'lugn',
+    'mushroom', 'immortality', 'immunmodulerande', 'beta-glukaner', 'resistent', 'stärkelse',
+    'resistant', 'starch', 'butyrat-produktion', 'tarmflora', 'potatismjöl', 'grön',
+    'banan', 'resveratrol', 'anti-aging', 'sirtuin-aktivering', 'sirtuiner', 'hjärnblood',
+    'metabol', 'hälsa', 'ampk', 'trans', 'kräver', 'fett', 'mikronisering', 'cyp450-interaktioner',
+    'rhodiola', 'rosea', 'standardiserad', 'rosavins', 'morgonen', 'stimulerande', 'risprotein',
+    'rice', 'kombinera', 'ärt', 'komplett', 'rutin', 'kärlhälsa', 'hemorrojder', 'glykosid',
+    'rödalm', 'slippery', 'elm', 'slemsubstans', 'mucilage', 'tas', 'rödalmsbark',
+    'tarmslemhinna', 'bildar', 'hindra', 'rödbetsjuice', 'beetroot', 'nitrat', 'vasodilatation',
+    'konc', 'beet', 'root', 'juice', 'concentrate', 'prestation', 'nitratladdning', 'dosering',
+    'ca', 'rödbetspulver', 'powder', 'nitrates', 'endurance', 'standardisera', 'nitratinnehåll',
+    'sänker', 'rödklöver', 'red', 'clover', 'klimakteriet', 'fytoöstrogen', 'rödris',
+    'red', 'yeast', 'rice', 'monacolin', 'q10-brist', 's.', 'boulardii', 'jäst-probiotika',
+    'antibiotika-stomach', 'sabroxy', 'oroxylum', 'indicum', 'dopamineåterupptag', 'saffran',
+    'saffron', 'affron', 'satiereal', 'aptitdämpning', 'påverkar', 'sam', 's-adenosyl',
+    'methionine', 'metylgivare', 'mani', 'bipolär', 'sjukdom', 'sarcosin', 'sarcosine',
+    'glycin-transportörhämmare', 'schizofreni', 'saw', 'palmetto', 'håravfall', 'hämmar',
+    '5-alfa-reduktas', 'förstoring', 'standardiserad', 'fettsyra', 'schisandra', 'berry',
+    'fas', 'detox-stöd', 'scullcap', 'skullcap', 'baikal', 'nervskydd', 'baicalin',
+    'selenium', 'virusförsvar', 'brist', 'ökar', 'virus-virulens', 'selenometionin',
+    'selenomethionine', 'organisk', 'lagras', 'vävnad', 'toxiskt', 'vid', 'överdos',
+    'sellerifröextrakt', 'celery', 'seed', 'extract', '3nb', 'gikt', 'standardiserat',
+    'ftalider', 'serrapeptase', 'ärrvävnad', 'scar', 'tissue', 'enzym', 'shiitake',
+    'ahcc', 'ett', 'extract', 'från', 'denna', 'silverax', 'black', 'cohosh', 'vallningar',
+    'ej', 'serotonin', 'leverrisk', 'smörsyra', 'butyrate', 'tarmhälsa', 'luktar',
+    'illa', 'smör', 'cellenergi', 'sojaisoflavoner', 'soy', 'isoflavones', 'hormonkänslig',
+    'cancer', 'sojaprotein', 'soy', 'protein', 'isoflavoner', 'spermidine', 'främjar',
+    'autofagi', 'vetegroddsextrakt', 'wheat', 'germ', 'extract', 'cellförnyelse',
+    'innehåller', 'gluten', 'vete', 'spirulina', 'tungmetall-detox', 'kontrollera',
+    'renhet', 'toxiner', 'sulbutiamin', 'sulbutiamine', 'motivation', 'syntetisk',
+    'b1-dimer', 'toleransutveckling', 'sulforafan', 'sulforaphane', 'nrf2-aktivering',
+    'kräver', 'myrosinas', 'aktivering', 'svartkumminolja', 'black', 'seed', 'oil',
+    'nigella', 'sativa', 'thymoquinone', 'svartvinbärsolja', 'black', 'currant',
+    'gla-källa', 'synefrin', 'synephrine', 'bitter', 'orange', 'liknar', 'efedrin',
+    'säkrare', 'p-synefrin', 'säkrast', 'sågpalmetto', 'manligt', 'kvinnligt',
+    'blockerar', 'dht', 'tallbarksextrakt', 'tart', 'cherry', 'extract', 'urinsyra',
+    'gikt', 'återhämtning', 'idrott', 'naturligt', 'också', 'antiinflammatorisk',
+    'taurin', 'taurine', 'cellvolym', 'finns', 'energidryck', 'motverkar', 'skak',
+    'osmoregulation', 'tauroursodeoxycholsyra', 'tudca', 'gallflöde', 'skyddar',
+    'celldöd', 'er-stress', 'tautin', 'kramp', 'gaba-agonist', 'teakrin', 'theacrine',
+    'teacrine', 'energi', 'utan', 'krasch', 'mindre', 'tolerans', 'teanin', 'theanine',
+    'avslappning', 'alfavågor', 'teobromin', 'theobromine', 'kakao-extrakt', 'vidgar',
+    'blodkärl', 'lång', 'halveringstid', 'giftigt', 'hundar', 'cocoa', 'flavanoler',
+    'tokotrienoler', 'tocotrienols', 'e-vitaminform', 'antioxidantskydd', 'tokoferoler',
+    'tongkat', 'ali', 'longjack', 'extrakt', 't.ex.', 'lowers', 'tranbär', 'cranberry',
+    'pacs', 'standardized', 'hindrar', 'adhesion', 'dosering', 'avs', 'förhindrar',
+    'e.coli-fäste', 'tranbärsextrakt', 'urinvägshälsa', 'tremella', 'snow', 'fungus',
+    'fukt', 'skönhet', 'tribulus', 'terrestris', 'testo', 'lust', 'muskel', 'protodioscin',
+    'tryptofan', 'säkrare', 'rate-limited', 'turkesterone', 'ajuga', 'ekdysteroid',
+    'plant', 'sterol', 'androgen', 'turkey', 'tail', 'cancer-stöd', 'psk', 'psp',
+    'polysackarider', 'immunstöd', 'cellgifter', 'tyrosin', 'tyrosine', 'krävs',
+    'sköldkörtelhormon', 'drive', 'kognitiv', 'arbetsminne', 'under', 'press',
+    'uridinmonofosfat', 'uridine', 'monophosphate', 'dopaminreceptorer', 'synapser',
+    'dha', 'kolin', 'valeriana', 'valerian', 'oro', 'valerensyra', 'valerianarot',
+    'valerian', 'root', 'gaba-aktivitet', 'dåsighet', 'vanadin', 'vanadium', 'vanadyl',
+    'sulfate', 'spårelement', 'vassleprotein', 'whey', 'protein', 'snabbt', 'post-workout',
+    'högt', 'leucin', 'anabolt', 'vetegroddsextrakt', 'vetegräs', 'wheatgrass', 'ph-balans',
+    'enzymer', 'vitaminer', 'vinpocetin', 'vinpocetine', 'hjärnans', 'syntetisk', 'från',
+    'periwinkle', 'vasodilator', 'vit', 'kidneyböna', 'white', 'kidney', 'bean', 'extract',
+    'kolhydratblockerare', 'amylashämmare', 'före', 'stärkelserik', 'gas', 'uppblåsthet',
+    'njur-böna', 'hämmar', 'alfa-amylas', 'gaser', 'vitamin', 'a', 'skincell-omsättning',
+    'retinol', 'animaliskt', 'maxdos', 'vitamin', 'b1', 'tiamin', 'thiamine', 'kolhydratmetabolism',
+    'vattenlöslig', 'vitamin', 'b12', 'adenosylcobalamin', 'adenosyl', 'mitokondriell',
+    'krebs-cykeln', 'cyanokobalamin', 'cyanocobalamin', 'standardform', 'sämre', 'metyl',
+    'adeno', 'metylkobalamin', 'methylcobalamin', 'nervhälsa', 'sublingualt', 'effektivt',
+    'vitamin', 'b2', 'riboflavin', 'migrän', 'färgar', 'urin', 'neongul', 'vitamin',
+    'b3', 'nicotinic', 'orsakar', 'skinrodnad', 'flush', 'leverpåverkan', 'extrem',
+    'vitamin', 'b5', 'pantotensyra', 'pantothenic', 'binjurar', 'coenzym', 'askorbinsyra',
+    'kissas', 'ut', 'diarré', 'kollagensyntes', 'glow', 'vitamin', 'd3', 'cholecalciferol',
+    'högre', 'doser', 'fat-solublet', 'överdos', 'kan', 'ge', 'hyperkalcemi', 'vitamin',
+    'e', 'blandade', 'tokoferoler', 'mixed', 'tocopherols', 'cellmembran', 'välj',
+    'ej', 'bara', 'alfa', 'vitamin', 'k2', 'artärstelhet', 'förhindrar', 'kalcium',
+    'kärl', 'waran', 'mk-7', 'viktig', 'rikta', 'skelettet', 'lång', 'halveringstid',
+    'vitlök', 'garlic', 'aged', 'allicin', 'plack', 'age', 'vitpilbark', 'white', 'willow',
+    'bark', 'salicin', 'naturlig', 'aspirin', 'magsår', 'salicylat', 'växtsteroler',
+    'plant', 'sterols', 'blockerar', 'upptag', 'wild', 'yam', 'diosgenin', 'labbomvandling',
+    'placebo', 'yerba', 'mate', 'glp-1', 'innehåller', 'teobromin', 'yohimbin', 'yohimbine',
+    'hcl', 'alfa-2', 'antagonist', 'anxiety', 'hjärtklappning', 'dosera', 'försiktigt',
+    'blockerare', 'hjärta', 'zink', 'zinc', 'skinläkning', 'akne', 'pikolinat', 'glycinat',
+    'kopparbalans', 'kelaterad', 'lozenges', 'halsont', 'lokal', 'sugtabletter', 'acetat',
+    'glukonat', 'viktig', 'mannens', 'hälsa', 'kopparbrist', 'modulerar', 'synaptisk',
+    'plasticitet', 'neurotransmittor-modulering', 'insulinlagring', 'insulin-hexamerer',
+    'l-carnosine', 'specifikt', 'slemhinnor', 'löses', 'långsamt', 'lokal', 'zinkpikolinat',
+    'zinc', 'picolinate', 'long-termbruk', 'utmärkt', 'hämma', 'kopparupptag', 'zma',
+    'återhämtning', 'populär', 'åkerfräken', 'kiselkälla', 'hårkomplex', 'äggprotein',
+    'egg', 'white', 'protein', 'medelsnabbt', 'hög', 'bv', 'laktosfritt', 'alternativ',
+    'äppelcidervinäger', 'apple', 'cider', 'vinegar', 'acv', 'kapslar', 'skonar',
+    'tandemaljen', 'ättiksyra', 'insulinsvar', 'ärtprotein', 'pea', 'protein', 'bra',
+    'aminosyraprofil', 'högt', 'arginine'
+]
+
+# Indicators are matched against the lower-cased text; the lower-case Swedish
+# characters are included so one pass also covers the character check.
+INDICATOR_MATCHER = AhoCorasick(SWEDISH_CHARS[:3] + SWEDISH_INDICATORS)
+
+
+def find_swedish_terms(text):
+    """Return (start, term) for every Swedish indicator found in text.
+
+    Positions refer to text.lower(). An empty list means no Swedish text.
+    """
+    if not text or text == '-' or text.strip() == '':
+        return []
+
+    hits = INDICATOR_MATCHER.findall(text.lower())
+
+    # The other status/risk terms contain å/ä/ö; 'Medium' is matched as-is
+    start = text.find('Medium')
+    if start != -1:
+        hits.append((start, 'Medium'))
+
+    return hits
+
+
+def has_swedish_text(text, hits=None):
+    """Check if text contains Swedish words or characters.
+
+    Pass the result of find_swedish_terms() as hits to skip re-scanning.
+    """
+    if hits is not None:
+        return bool(hits)
+    if not text or text == '-' or text.strip() == '':
+        return False
+    if INDICATOR_MATCHER.search(text.lower()) is not None:
+        return True
+    return 'Medium' in text